@@ -1,5 +1,6 @@
 """Public entry points for the HordeRL engine."""
 
+from .archetype_component_manager import ArchetypeComponentManager
 from .component_manager import ComponentManager
 from .components import Actor, Component, Coordinates, EnergyActor, Entity
 from .game_scene import GameScene
@@ -9,6 +10,7 @@ from .ui_context import UiContext
 
 __all__ = [
     "Actor",
+    "ArchetypeComponentManager",
     "Component",
     "ComponentManager",
     "Coordinates",
@@ -0,0 +1,336 @@
+"""
+Archetype-based storage backend for the component manager.
+
+The default ComponentManager keeps one insertion-ordered map per concrete
+component type. This module provides a drop-in alternative that groups
+entities by their *archetype*: the exact set of concrete component types
+attached to the entity. Each archetype stores its entities in parallel,
+contiguous columns (one column per concrete type), so:
+
+- Iterating a type walks only the columns of archetypes that contain it.
+- Components of one entity sit in the same row rather than in a per-entity
+  dictionary.
+- Removing an entity from an archetype is a swap-remove, not a list search.
+
+Entities move between archetypes when components are added or removed, which
+makes composition changes more expensive than with the default backend. The
+public API (add/get/get_one/get_all/delete/stash...) is unchanged; only the
+storage primitives of ComponentManager are overridden.
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set, Type
+
+from engine.component_manager import ComponentManager
+from engine.components.component import Component
+from engine.types import ComponentType, T, U
+
+Cell = List[Component]
+
+
+class Archetype:
+    """
+    Store the entities that share one exact set of concrete component types.
+
+    Rows are entities; there is one column per concrete component type. A cell
+    is a list because an entity may hold several components of the same type.
+
+    """
+
+    __slots__ = ("types", "entities", "rows", "columns", "_matches")
+
+    def __init__(self, types: FrozenSet[type], order: List[type]):
+        """
+        Create an empty archetype.
+
+        :param types: The concrete component types of this archetype
+        :type types: FrozenSet[type]
+        :param order: The same types in a stable iteration order
+        :type order: List[type]
+
+        """
+        self.types = types
+        self.entities: List[int] = []
+        self.rows: Dict[int, int] = {}
+        self.columns: Dict[type, List[Cell]] = {t: [] for t in order}
+        self._matches: Dict[type, List[type]] = {}
+
+    def append(self, entity: int, cells: Dict[type, Cell]) -> None:
+        """
+        Append an entity row to every column.
+
+        :param entity: The entity to append
+        :type entity: int
+        :param cells: The entity's components keyed by concrete type
+        :type cells: Dict[type, Cell]
+        :return: None
+
+        """
+        self.rows[entity] = len(self.entities)
+        self.entities.append(entity)
+        for component_type, column in self.columns.items():
+            column.append(cells[component_type])
+
+    def remove(self, entity: int) -> Dict[type, Cell]:
+        """
+        Swap-remove an entity row and return its cells.
+
+        :param entity: The entity to remove
+        :type entity: int
+        :return: The entity's components keyed by concrete type
+        :rtype: Dict[type, Cell]
+
+        """
+        row = self.rows.pop(entity)
+        last = len(self.entities) - 1
+        cells = {}
+        for component_type, column in self.columns.items():
+            cells[component_type] = column[row]
+            column[row] = column[last]
+            column.pop()
+        moved = self.entities[last]
+        self.entities[row] = moved
+        self.entities.pop()
+        if moved != entity:
+            self.rows[moved] = row
+        return cells
+
+    def matching(self, component_type: type) -> List[type]:
+        """
+        Get the concrete column types that are instances of a queried type.
+
+        :param component_type: The (possibly abstract) type being queried
+        :type component_type: type
+        :return: The concrete types in this archetype that match
+        :rtype: List[type]
+
+        """
+        matches = self._matches.get(component_type)
+        if matches is None:
+            matches = [
+                t for t in self.columns if issubclass(t, component_type)
+            ]
+            self._matches[component_type] = matches
+        return matches
+
+
+class ArchetypeComponentManager(ComponentManager):
+    """
+    Manage components with archetype-grouped, columnar storage.
+
+    Behaves like ComponentManager for every public operation. Ordering of
+    results differs: components are grouped by archetype and concrete type
+    rather than being returned in global insertion order.
+
+    """
+
+    def _reset_storage(self) -> None:
+        """
+        Create empty archetype tables.
+
+        - archetypes: Maps a set of concrete types to its Archetype
+        - entity_archetypes: Maps each entity to the Archetype holding it
+        - columns_by_type: Maps any queried type (including base classes) to
+          the archetype columns whose concrete type is a subclass of it
+
+        :return: None
+
+        """
+        self.archetypes: Dict[FrozenSet[type], Archetype] = {}
+        self.entity_archetypes: Dict[int, Archetype] = {}
+        self.columns_by_type: Dict[type, List[List[Cell]]] = defaultdict(list)
+        self._type_order: Dict[type, int] = {}
+
+    @property
+    def entities(self) -> Set[int]:
+        """
+        Get a set of all entity IDs currently tracked by the component manager.
+
+        :return: A set containing the unique ID of each entity in the system
+        :rtype: Set[int]
+
+        """
+        return set(self.entity_archetypes)
+
+    def get(
+        self,
+        component_type: T,
+        query: Callable[[T], bool] = lambda x: True,
+        project: Callable[[T], U] = lambda x: x,
+    ) -> List[U]:
+        """
+        Get all components of a given type, filtered and transformed as specified.
+
+        Walks the matching archetype columns directly rather than going through
+        the generic storage iterator.
+
+        :param component_type: The component type to select
+        :type component_type: T
+        :param query: A boolean function to filter the components
+        :type query: Callable[[T], bool]
+        :param project: A transformation function applied to each selected component
+        :type project: Callable[[T], U]
+        :return: A list of transformed components that pass the query filter
+        :rtype: List[U]
+
+        """
+        return [
+            project(component)
+            for column in self.columns_by_type.get(component_type, ())
+            for cell in column
+            for component in cell
+            if query(component)
+        ]
+
+    def get_all(self, component_type: Type[T], entity: int) -> List[T]:
+        """
+        Get all components of a given type for a given entity.
+
+        :param component_type: The type of components to retrieve
+        :type component_type: Type[T]
+        :param entity: The ID of the entity to query
+        :type entity: int
+        :return: A list of components of the specified type attached to the entity
+        :rtype: List[T]
+
+        """
+        archetype = self.entity_archetypes.get(entity)
+        if archetype is None:
+            return []
+        row = archetype.rows[entity]
+        output = []
+        for concrete_type in archetype.matching(component_type):
+            output.extend(archetype.columns[concrete_type][row])
+        return output
+
+    def get_one(self, component_type: Type[T], entity: int) -> T:
+        """
+        Get a single component of a given type for a given entity.
+
+        :param component_type: The type of component to retrieve
+        :type component_type: Type[T]
+        :param entity: The ID of the entity to query
+        :type entity: int
+        :return: The first component of the specified type, or None if none exists
+        :rtype: T or None
+
+        """
+        archetype = self.entity_archetypes.get(entity)
+        if archetype is None:
+            return None
+        row = archetype.rows[entity]
+        for concrete_type in archetype.matching(component_type):
+            cell = archetype.columns[concrete_type][row]
+            if cell:
+                return cell[0]
+        return None
+
+    # storage primitives
+    def _store(self, component: Component) -> None:
+        entity = component.entity
+        component_type = type(component)
+        archetype = self.entity_archetypes.get(entity)
+        if archetype is not None and component_type in archetype.types:
+            row = archetype.rows[entity]
+            archetype.columns[component_type][row].append(component)
+            return
+
+        cells = archetype.remove(entity) if archetype is not None else {}
+        cells[component_type] = [component]
+        self._move(entity, cells)
+
+    def _unstore(self, component: Component) -> None:
+        entity = component.entity
+        component_type = type(component)
+        archetype = self.entity_archetypes.get(entity)
+        if archetype is None or component_type not in archetype.types:
+            return
+        cell = archetype.columns[component_type][archetype.rows[entity]]
+        for index, candidate in enumerate(cell):
+            if candidate is component:
+                break
+        else:
+            return
+        if len(cell) > 1:
+            del cell[index]
+            return
+
+        cells = archetype.remove(entity)
+        del cells[component_type]
+        if cells:
+            self._move(entity, cells)
+        else:
+            del self.entity_archetypes[entity]
+
+    def _drop_entity(self, entity: int) -> None:
+        archetype = self.entity_archetypes.pop(entity, None)
+        if archetype is not None:
+            archetype.remove(entity)
+
+    def _has_entity(self, entity: int) -> bool:
+        return entity in self.entity_archetypes
+
+    def _entity_components(self, entity: int) -> List[Component]:
+        archetype = self.entity_archetypes.get(entity)
+        if archetype is None:
+            return []
+        row = archetype.rows[entity]
+        return [
+            component
+            for column in archetype.columns.values()
+            for component in column[row]
+        ]
+
+    def _iter_components(self, component_type: ComponentType) -> Iterable:
+        for column in self.columns_by_type.get(component_type, ()):
+            for cell in column:
+                yield from cell
+
+    # private methods
+    def _move(self, entity: int, cells: Dict[type, Cell]) -> None:
+        """
+        Place an entity's cells into the archetype matching their types.
+
+        :param entity: The entity being moved
+        :type entity: int
+        :param cells: The entity's components keyed by concrete type
+        :type cells: Dict[type, Cell]
+        :return: None
+
+        """
+        types = frozenset(cells)
+        archetype = self.archetypes.get(types)
+        if archetype is None:
+            archetype = self._create_archetype(types)
+        archetype.append(entity, cells)
+        self.entity_archetypes[entity] = archetype
+
+    def _create_archetype(self, types: FrozenSet[type]) -> Archetype:
+        """
+        Create an archetype and register its columns for type queries.
+
+        Column order follows the order in which concrete types were first seen
+        by this manager so that iteration is deterministic.
+
+        :param types: The concrete component types of the new archetype
+        :type types: FrozenSet[type]
+        :return: The new archetype
+        :rtype: Archetype
+
+        """
+        for component_type in types:
+            self._type_order.setdefault(component_type, len(self._type_order))
+        order = sorted(types, key=self._type_order.__getitem__)
+        archetype = Archetype(types, order)
+        self.archetypes[types] = archetype
+        for component_type, column in archetype.columns.items():
+            for component_class in component_type.mro():
+                self.columns_by_type[component_class].append(column)
+        self.logger.debug(
+            "Created archetype",
+            extra={
+                "archetype_types": [t.__name__ for t in order],
+                "archetype_count": len(self.archetypes),
+            },
+        )
+        return archetype
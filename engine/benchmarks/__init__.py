@@ -0,0 +1,8 @@
+"""
+Micro-benchmarks for engine internals.
+
+Benchmarks are plain modules with a ``main()`` entry point; they are not
+collected by pytest. Run one with, for example::
+
+    poetry run python -m engine.benchmarks.component_storage
+"""
@@ -0,0 +1,79 @@
+"""
+Measure how much memory each storage backend spends on bookkeeping.
+
+The synthetic world from ``component_storage`` is built first, so the
+component objects themselves are not counted; only what the manager allocates
+while the components are added (per-type and per-entity storage, the id map
+and the secondary indexes) is traced with ``tracemalloc``. Actors carry the
+deep ``Component -> Actor -> EnergyActor`` chain, so a layout that lists every
+component under each class of its MRO shows up here.
+
+Usage::
+
+    poetry run python -m engine.benchmarks.component_memory --tiles 20000
+"""
+
+import argparse
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from engine.benchmarks.component_storage import BACKENDS, make_world
+from engine.components import Component
+
+
+def measure(manager_class, world: List[List[Component]]) -> Dict[str, float]:
+    """
+    Build a manager from ``world`` and return the bytes it allocated.
+    """
+    component_count = sum(len(components) for components in world)
+    tracemalloc.start()
+    try:
+        cm = manager_class()
+        for components in world:
+            cm.add(*components)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del cm
+    return {
+        "current": current,
+        "peak": peak,
+        "per component": current / component_count,
+    }
+
+
+def format_results(results: Dict[str, Dict[str, float]]) -> str:
+    """
+    Render a fixed-width table with one row per backend.
+    """
+    header = f"{'backend':<28}{'retained':>14}{'peak':>14}{'per comp.':>12}"
+    lines = [header, "-" * len(header)]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<28}"
+            f"{result['current'] / 1024:>11.0f} KB"
+            f"{result['peak'] / 1024:>11.0f} KB"
+            f"{result['per component']:>10.0f} B"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> Tuple[Dict[str, Dict[str, float]], str]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tiles", type=int, default=20000)
+    parser.add_argument("--actors", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, manager_class in BACKENDS.items():
+        world = make_world(args.tiles, args.actors)
+        results[name] = measure(manager_class, world)
+
+    table = format_results(results)
+    print(f"{args.tiles} tiles, {args.actors} actors\n")
+    print(table)
+    return results, table
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure how entity deletion scales with the size of the world.
+
+For each world size, a world of terrain-like entities is built and then
+``--deletes`` entities are removed with ``ComponentManager.delete``. With
+constant-time removal the cost per delete stays flat as the world grows.
+
+Usage::
+
+    poetry run python -m engine.benchmarks.component_removal
+"""
+
+import argparse
+import random
+from time import perf_counter
+from typing import Dict, List
+
+from engine.benchmarks.component_storage import BACKENDS, make_world
+
+
+def time_deletes(manager_class, tiles: int, deletes: int) -> float:
+    """
+    Build a world of ``tiles`` entities and return seconds spent deleting.
+    """
+    world = make_world(tiles, actors=0)
+    cm = manager_class()
+    for components in world:
+        cm.add(*components)
+
+    entities = [components[0].entity for components in world]
+    random.Random(2).shuffle(entities)
+    start = perf_counter()
+    for entity in entities[:deletes]:
+        cm.delete(entity)
+    return perf_counter() - start
+
+
+def main(argv=None) -> Dict[str, List[float]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--deletes", type=int, default=10000)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10000, 20000, 40000]
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"deleting {args.deletes} entities\n")
+    print(f"{'backend':<28}{'tiles':>8}{'total':>12}{'per delete':>14}")
+    for name, manager_class in BACKENDS.items():
+        results[name] = []
+        for tiles in args.sizes:
+            deletes = min(args.deletes, tiles)
+            seconds = time_deletes(manager_class, tiles, deletes)
+            results[name].append(seconds)
+            print(
+                f"{name:<28}{tiles:>8}{seconds * 1000:>9.1f} ms"
+                f"{seconds / deletes * 1e6:>11.1f} us"
+            )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Compare component storage backends on a synthetic, terrain-heavy world.
+
+The world mimics a generated map: every tile carries a handful of small
+terrain components, and a smaller population of actors carries components
+with a deep inheritance chain. Each scenario is timed for every backend:
+
+- build: add every component
+- iterate: ``get(Coordinates)`` once per frame
+- join: ``get(Material)`` joined to ``get_one(Coordinates)`` once per frame
+- base type: ``get(Actor)`` once per frame
+- delete: delete a tenth of the terrain entities
+
+Usage::
+
+    poetry run python -m engine.benchmarks.component_storage --tiles 5000
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+from engine.archetype_component_manager import ArchetypeComponentManager
+from engine.component_manager import ComponentManager
+from engine.components import Actor, Component, Coordinates, EnergyActor
+from engine.components.entity import Entity
+
+BACKENDS = {
+    "ComponentManager": ComponentManager,
+    "ArchetypeComponentManager": ArchetypeComponentManager,
+}
+
+
+@dataclass(slots=True)
+class BenchMaterial(Component):
+    blocks: bool = False
+    blocks_sight: bool = False
+
+
+@dataclass(slots=True)
+class BenchAppearance(Component):
+    symbol: str = " "
+
+
+@dataclass(slots=True)
+class BenchPathCost(Component):
+    cost: int = 1
+
+
+@dataclass(slots=True)
+class BenchBrain(EnergyActor):
+    target: int = 0
+
+
+def make_world(tiles: int, actors: int) -> List[List[Component]]:
+    """
+    Build the component lists for a synthetic world, one list per entity.
+    """
+    rng = random.Random(1)
+    width = max(1, int(tiles**0.5))
+    entities = []
+    for i in range(tiles):
+        entity = 1_000_000 + i
+        components = [
+            Entity(id=entity, entity=entity, name="grass", static=True),
+            Coordinates(entity=entity, x=i % width, y=i // width),
+            BenchAppearance(entity=entity, symbol="."),
+            BenchMaterial(entity=entity, blocks_sight=rng.random() < 0.2),
+        ]
+        if rng.random() < 0.5:
+            components.append(BenchPathCost(entity=entity, cost=10))
+        entities.append(components)
+    for i in range(actors):
+        entity = 2_000_000 + i
+        entities.append(
+            [
+                Entity(id=entity, entity=entity, name="hordeling"),
+                Coordinates(entity=entity, x=i % width, y=0),
+                BenchAppearance(entity=entity, symbol="h"),
+                BenchMaterial(entity=entity, blocks=True),
+                BenchBrain(entity=entity),
+            ]
+        )
+    return entities
+
+
+def run_backend(
+    manager_class, world: List[List[Component]], frames: int
+) -> Dict[str, float]:
+    """
+    Time every scenario against one backend and return seconds per scenario.
+    """
+    results = {}
+    cm = manager_class()
+
+    def timed(name: str, fn: Callable[[], object]) -> None:
+        start = perf_counter()
+        fn()
+        results[name] = perf_counter() - start
+
+    def build():
+        for components in world:
+            cm.add(*components)
+
+    def iterate():
+        for _ in range(frames):
+            sum(1 for _ in cm.get(Coordinates))
+
+    def join():
+        for _ in range(frames):
+            for material in cm.get(BenchMaterial):
+                cm.get_one(Coordinates, entity=material.entity)
+
+    def base_type():
+        for _ in range(frames):
+            cm.get(Actor)
+
+    def delete():
+        terrain = [c[0].entity for c in world if not isinstance(c[-1], Actor)]
+        for entity in terrain[::10]:
+            cm.delete(entity)
+
+    timed("build", build)
+    timed("iterate", iterate)
+    timed("join", join)
+    timed("base type", base_type)
+    timed("delete", delete)
+    return results
+
+
+def format_results(results: Dict[str, Dict[str, float]]) -> str:
+    """
+    Render a fixed-width table with one column per backend.
+    """
+    names = list(results)
+    scenarios = list(next(iter(results.values())))
+    header = f"{'scenario':<12}" + "".join(f"{n:>28}" for n in names)
+    lines = [header, "-" * len(header)]
+    for scenario in scenarios:
+        baseline = results[names[0]][scenario]
+        row = f"{scenario:<12}"
+        for name in names:
+            seconds = results[name][scenario]
+            ratio = seconds / baseline if baseline else 0.0
+            row += f"{seconds * 1000:>17.1f} ms ({ratio:5.3g}x)"
+        lines.append(row)
+    return "\n".join(lines)
+
+
+def main(argv=None) -> Tuple[Dict[str, Dict[str, float]], str]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tiles", type=int, default=5000)
+    parser.add_argument("--actors", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, manager_class in BACKENDS.items():
+        world = make_world(args.tiles, args.actors)
+        results[name] = run_backend(manager_class, world, args.frames)
+
+    table = format_results(results)
+    print(f"{args.tiles} tiles, {args.actors} actors, {args.frames} frames\n")
+    print(table)
+    return results, table
+
+
+if __name__ == "__main__":
+    main()
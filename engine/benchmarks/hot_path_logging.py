@@ -0,0 +1,105 @@
+"""
+Measure what hot-path debug logging costs per frame.
+
+Each synthetic frame does the per-component work a busy turn does: it adds
+and deletes short-lived components one at a time, dispatches their debug
+logging, and calls a ``core.timed`` function. The frame is timed with the
+logging levels set three ways:
+
+- debug on: DEBUG records are created (and dropped, as no handler is set)
+- debug off: the root logger is at INFO, so hot-path payloads are skipped
+- production: hot-path logging is switched off whatever the level
+
+Usage::
+
+    poetry run python -m engine.benchmarks.hot_path_logging --frames 200
+"""
+
+import argparse
+import logging
+from dataclasses import dataclass
+from statistics import median
+from time import perf_counter
+from typing import Dict, Tuple
+
+from engine import core
+from engine.component_manager import ComponentManager
+from engine.components import Component
+from engine.logging import set_production_mode
+
+MODES = ("debug on", "debug off", "production")
+
+
+@dataclass(slots=True)
+class BenchEvent(Component):
+    value: int = 0
+
+
+@core.timed(1000, __name__)
+def _timed_step(value: int) -> int:
+    return value + 1
+
+
+def _set_mode(mode: str) -> None:
+    """
+    Apply one of MODES to the root logger and the hot-path loggers.
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.INFO if mode == "debug off" else logging.DEBUG)
+    set_production_mode(mode == "production")
+
+
+def run_frame(cm: ComponentManager, events: int, timed_calls: int) -> float:
+    """
+    Run one synthetic frame and return its duration in milliseconds.
+    """
+    start = perf_counter()
+    added = []
+    for i in range(events):
+        event = BenchEvent(entity=1 + i % 50, value=i)
+        cm.add(event)
+        added.append(event)
+    for event in added:
+        cm.delete_component(event)
+    value = 0
+    for _ in range(timed_calls):
+        value = _timed_step(value)
+    return (perf_counter() - start) * 1000
+
+
+def main(argv=None) -> Tuple[Dict[str, float], str]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--timed-calls", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    root = logging.getLogger()
+    saved_level = root.level
+    results = {}
+    try:
+        for mode in MODES:
+            _set_mode(mode)
+            cm = ComponentManager()
+            run_frame(cm, args.events, args.timed_calls)
+            results[mode] = median(
+                run_frame(cm, args.events, args.timed_calls)
+                for _ in range(args.frames)
+            )
+    finally:
+        root.setLevel(saved_level)
+        set_production_mode(False)
+
+    lines = [f"{'mode':<14}{'ms/frame':>10}", "-" * 24]
+    lines.extend(f"{mode:<14}{ms:>10.2f}" for mode, ms in results.items())
+    table = "\n".join(lines)
+    print(
+        f"{args.events} component adds/deletes and {args.timed_calls} timed"
+        f" calls per frame, median of {args.frames} frames\n"
+    )
+    print(table)
+    return results, table
+
+
+if __name__ == "__main__":
+    main()
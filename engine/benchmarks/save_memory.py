@@ -0,0 +1,183 @@
+"""
+Measure the peak memory and time of saving and loading a large world.
+
+The synthetic world from ``component_storage`` is scaled to about
+``--components`` components and saved and loaded in each format. Every
+measurement runs in a fresh interpreter and reports how far the peak RSS rose
+above the RSS just before the operation:
+
+- save: with the world already built
+- load: including the loaded components themselves
+
+On Linux the peak is reset before each operation (``/proc/self/clear_refs``).
+Elsewhere the process-lifetime peak from ``resource.getrusage`` is used, which
+hides a save's peak below the peak reached while building the world.
+
+Usage::
+
+    poetry run python -m engine.benchmarks.save_memory --components 100000
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from engine import serialization
+
+# Components per synthetic tile, on average, in component_storage.make_world
+_COMPONENTS_PER_TILE = 4.5
+_ACTOR_SHARE = 0.05
+
+
+def _status_bytes(key: str) -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(key + ":"):
+                return int(line.split()[1]) * 1024
+    raise KeyError(key)
+
+
+def start_measuring() -> int:
+    """
+    Reset the peak RSS where possible and return the RSS to measure from.
+    """
+    gc.collect()
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return _status_bytes("VmRSS")
+    except OSError:
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """
+    Return the peak RSS since start_measuring reset it, or the
+    process-lifetime peak where it cannot be reset.
+    """
+    try:
+        return _status_bytes("VmHWM")
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _worker(operation: str, save_format: str, path: str, components: int):
+    """
+    Run one save or load and print its measurements as JSON.
+    """
+    from engine.benchmarks.component_storage import make_world
+    from engine.component_manager import ComponentManager
+
+    if operation == "save":
+        tiles = int(components / _COMPONENTS_PER_TILE)
+        world = make_world(tiles, int(tiles * _ACTOR_SHARE))
+        cm = ComponentManager()
+        for entity_components in world:
+            cm.add(*entity_components)
+        del world
+        before = start_measuring()
+        start = perf_counter()
+        serialization.save(cm.get_serial_form(), path, save_format=save_format)
+        seconds = perf_counter() - start
+        count = len(cm.components_by_id)
+    else:
+        before = start_measuring()
+        start = perf_counter()
+        data = serialization.load(path)
+        seconds = perf_counter() - start
+        count = len(data["active_components"])
+    print(
+        json.dumps(
+            {
+                "components": count,
+                "seconds": seconds,
+                "peak_growth": peak_rss_bytes() - before,
+                "file_size": os.path.getsize(path),
+            }
+        )
+    )
+
+
+def measure(
+    operation: str, save_format: str, path: str, components: int
+) -> Dict[str, float]:
+    """
+    Run one measurement in a fresh interpreter.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            __spec__.name,
+            "--worker",
+            operation,
+            save_format,
+            path,
+            "--components",
+            str(components),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def format_results(results: List[Tuple[str, str, Dict[str, float]]]) -> str:
+    """
+    Render one row per format and operation.
+    """
+    lines = [
+        f"{'format':<8}{'operation':<10}{'ms':>9}{'peak MB':>10}"
+        f"{'file MB':>10}",
+        "-" * 47,
+    ]
+    for save_format, operation, result in results:
+        lines.append(
+            f"{save_format:<8}{operation:<10}{result['seconds'] * 1000:>9.0f}"
+            f"{result['peak_growth'] / 2**20:>10.1f}"
+            f"{result['file_size'] / 2**20:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=100_000)
+    parser.add_argument(
+        "--formats", nargs="+", default=list(serialization.FORMATS)
+    )
+    parser.add_argument("--worker", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _worker(*args.worker, args.components)
+        return None
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for save_format in args.formats:
+            path = os.path.join(directory, f"world.{save_format}")
+            for operation in ("save", "load"):
+                result = measure(operation, save_format, path, args.components)
+                results.append((save_format, operation, result))
+    table = format_results(results)
+    print(
+        f"{results[0][2]['components']} active components, peak RSS growth"
+        " per operation\n"
+    )
+    print(table)
+    return results, table
+
+
+if __name__ == "__main__":
+    main()
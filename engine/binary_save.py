@@ -0,0 +1,1085 @@
+"""
+A compact binary save format.
+
+A binary save stores each component class once, as a schema, and the
+components of each class column by column. Numeric columns are packed arrays,
+string columns are one UTF-8 blob, and a column whose values are all the same
+immutable value is stored once. Components are written and read in blocks of
+at most BLOCK_SIZE, so neither side holds more than one encoded block in
+memory. The layout (little-endian) is:
+
+- ``MAGIC``, a u16 format ``VERSION``, the length-prefixed info block (the
+  header's ``info``: what a load menu lists) and the length-prefixed rest of
+  the header: named IDs, allocator state and stashed entities, each as one
+  tagged value (see ``_write_value``)
+- per section (active and stashed components): a section record with its
+  name, then block and tile records, each prefixed with its length, in the
+  order of the components they hold
+- per block: the schema (name and init field names) of each class first seen
+  in it, whose position in the order of first appearance is its class tag;
+  the class tag of every component in order, so the original order is
+  restored; then per class its tag, count and one column per schema field
+- per tile record: the prefabs first seen in it, as their component counts
+  and one block of their components, whose position in the order of first
+  appearance is the prefab's tag; then the prefab tag, entity ID, x and y of
+  each tile entity, each column stored as runs of equal deltas
+- an end record
+
+Static terrain makes up most of a world and is built by a few factories, so
+most of it repeats. A run of consecutive components belonging to one static
+entity (an ``Entity`` with ``static`` set and a single ``Coordinates``) is a
+tile entity. Tile entities whose components differ only in their position,
+and whose component IDs sit at the same offsets from their entity ID, share
+a prefab: its components are written once, and each tile costs only its
+prefab, entity ID and position. Reading expands tiles back into components.
+
+Fields are matched by name when loading, so a save still loads after a
+component gains a field (it gets its default) or loses one (it is dropped).
+
+Enum values are stored with the module path of their type. Loading never
+imports what a save names: the path must belong to an enum type that a
+component class declares (in a field annotation or its body) or that was
+passed to register_enum, and anything else is a SaveFormatError.
+"""
+
+import copy
+import dataclasses
+import struct
+import typing
+from array import array
+from enum import Enum
+from itertools import groupby
+from operator import attrgetter
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from engine.components import Coordinates
+from engine.components.component import Component, saved_fields
+from engine.components.entity import Entity
+
+from .logging import get_logger
+
+MAGIC = b"HRLSAVE\x00"
+# Version 2 added tile records, version 3 the info block
+VERSION = 3
+
+# The most components encoded or decoded at once
+BLOCK_SIZE = 4096
+
+# Record markers
+_END = 0
+_SECTION = 1
+_BLOCK = 2
+_TILES = 3
+
+# The name iter_sizes reports tile positions under
+TILE_POSITIONS = "<tile positions>"
+
+# Column codecs
+_INT64 = 0
+_BOOL = 1
+_FLOAT = 2
+_STR = 3
+_ENUM = 4
+_CONST = 5
+_GENERIC = 6
+
+# Tagged value types
+_V_NONE = 0
+_V_FALSE = 1
+_V_TRUE = 2
+_V_INT = 3
+_V_BIGINT = 4
+_V_FLOAT = 5
+_V_STR = 6
+_V_TUPLE = 7
+_V_LIST = 8
+_V_DICT = 9
+_V_SET = 10
+_V_FROZENSET = 11
+_V_ENUM = 12
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+# Values a _CONST column may share between every component it loads
+_IMMUTABLE = (int, float, str, bool, type(None), tuple, frozenset, Enum)
+
+# Field values copied for every tile built from a prefab
+_MUTABLE = frozenset({list, dict, set})
+
+_ENTITY = attrgetter("entity")
+
+
+class SaveFormatError(ValueError):
+    """
+    Raised when a file is not a binary save this version can read.
+    """
+
+
+def is_binary_save(file) -> bool:
+    """
+    Check whether a file starts with the binary save magic.
+
+    :param file: The path to check
+    :return: True if the file is a binary save
+    :rtype: bool
+
+    """
+    with open(file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write(
+    f: IO[bytes],
+    header: dict,
+    sections: Dict[str, Mapping[int, Any]],
+    block_size: int = BLOCK_SIZE,
+) -> int:
+    """
+    Write a binary save, one block of components at a time.
+
+    :param f: A file opened for binary writing
+    :param header: Plain data stored alongside the components
+    :type header: dict
+    :param sections: Component dictionaries (id to component) by name
+    :type sections: Dict[str, Mapping[int, Any]]
+    :param block_size: The most components encoded in memory at once
+    :type block_size: int
+    :return: The number of bytes written
+    :rtype: int
+
+    """
+    out = bytearray(MAGIC)
+    out += _U16.pack(VERSION)
+    # The info block comes first, so read_info stops reading right after it
+    rest = {key: value for key, value in header.items() if key != "info"}
+    for value in (header.get("info"), rest):
+        encoded = bytearray()
+        _write_value(encoded, value)
+        out += _U32.pack(len(encoded))
+        out += encoded
+    f.write(out)
+    written = len(out)
+
+    classes: Dict[type, int] = {}
+    schemas: List[Tuple[str, Tuple[str, ...]]] = []
+    prefabs: Dict[tuple, int] = {}
+
+    def put(record: int, data: bytearray) -> None:
+        nonlocal written
+        f.write(_U8.pack(record) + _U32.pack(len(data)))
+        f.write(data)
+        written += _U8.size + _U32.size + len(data)
+
+    for name, components in sections.items():
+        out = bytearray(_U8.pack(_SECTION))
+        _write_str(out, name)
+        f.write(out)
+        written += len(out)
+        block: list = []
+        tiles: list = []
+        for _, group in groupby(components.values(), _ENTITY):
+            group = list(group)
+            tile = _tile(group)
+            if tile is None:
+                if tiles:
+                    put(
+                        _TILES, _encode_tiles(tiles, prefabs, classes, schemas)
+                    )
+                    tiles = []
+                block += group
+                while len(block) >= block_size:
+                    put(
+                        _BLOCK,
+                        _encode_block(block[:block_size], classes, schemas),
+                    )
+                    del block[:block_size]
+            else:
+                if block:
+                    put(_BLOCK, _encode_block(block, classes, schemas))
+                    block = []
+                tiles.append(tile)
+                if len(tiles) == block_size:
+                    put(
+                        _TILES, _encode_tiles(tiles, prefabs, classes, schemas)
+                    )
+                    tiles = []
+        if block:
+            put(_BLOCK, _encode_block(block, classes, schemas))
+        if tiles:
+            put(_TILES, _encode_tiles(tiles, prefabs, classes, schemas))
+    f.write(_U8.pack(_END))
+    return written + _U8.size
+
+
+def read(f: IO[bytes], loadable_classes: Dict[str, type]):
+    """
+    Read a whole binary save.
+
+    :param f: A file opened for binary reading
+    :param loadable_classes: Component classes by name
+    :type loadable_classes: Dict[str, type]
+    :return: The header and the component dictionaries by section name;
+        sections without components are left out
+    :rtype: Tuple[dict, Dict[str, dict]]
+    :raises SaveFormatError: If the file is not a readable binary save
+    :raises ValueError: If the save uses a component class that is not known
+
+    """
+    header = read_header(f)
+    sections: Dict[str, dict] = {}
+    for name, component in iter_components(f, loadable_classes):
+        section = sections.get(name)
+        if section is None:
+            section = sections[name] = {}
+        section[component.id] = component
+    return header, sections
+
+
+def read_header(f: IO[bytes]) -> dict:
+    """
+    Check the format and read the header of a binary save.
+
+    Leaves the file positioned at the first section, ready for
+    iter_components.
+
+    :param f: A file opened for binary reading
+    :return: The header
+    :rtype: dict
+    :raises SaveFormatError: If the file is not a readable binary save
+
+    """
+    version = _read_version(f)
+    if version < 3:
+        return _read_block_value(f)
+    info = _read_block_value(f)
+    header = _read_block_value(f)
+    if info is not None:
+        header["info"] = info
+    return header
+
+
+def read_info(f: IO[bytes]) -> Optional[dict]:
+    """
+    Read only the info block of a binary save.
+
+    Saves written before the info block (format version 2 and older) have
+    their whole header read instead.
+
+    :param f: A file opened for binary reading
+    :return: The header's info, or None if it has none
+    :rtype: Optional[dict]
+    :raises SaveFormatError: If the file is not a readable binary save
+
+    """
+    if _read_version(f) < 3:
+        return _read_block_value(f).get("info")
+    return _read_block_value(f)
+
+
+def _read_version(f: IO[bytes]) -> int:
+    if f.read(len(MAGIC)) != MAGIC:
+        raise SaveFormatError("not a binary save")
+    (version,) = _U16.unpack(_read_exact(f, _U16.size))
+    if version > VERSION:
+        raise SaveFormatError(
+            f"save format version {version} is newer than {VERSION}"
+        )
+    return version
+
+
+def _read_block_value(f: IO[bytes]):
+    (length,) = _U32.unpack(_read_exact(f, _U32.size))
+    value, _ = _read_value(memoryview(_read_exact(f, length)), 0)
+    return value
+
+
+def iter_components(
+    f: IO[bytes], loadable_classes: Dict[str, type]
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Build the components of a binary save as their blocks are read.
+
+    :param f: A binary save positioned after its header
+    :param loadable_classes: Component classes by name
+    :type loadable_classes: Dict[str, type]
+    :return: The section name and component, in saved order
+    :rtype: Iterator[Tuple[str, Any]]
+    :raises SaveFormatError: If the file is truncated or malformed
+    :raises ValueError: If the save uses a component class that is not known
+
+    """
+    factories: list = []
+    prefabs: list = []
+    section = None
+    while True:
+        (record,) = _U8.unpack(_read_exact(f, _U8.size))
+        if record == _END:
+            return
+        if record == _SECTION:
+            (length,) = _U32.unpack(_read_exact(f, _U32.size))
+            section = str(_read_exact(f, length), "utf-8")
+        elif record in (_BLOCK, _TILES) and section is not None:
+            (length,) = _U32.unpack(_read_exact(f, _U32.size))
+            data = memoryview(_read_exact(f, length))
+            if record == _BLOCK:
+                components = _decode_block(data, factories, loadable_classes)
+            else:
+                components = _decode_tiles(
+                    data, prefabs, factories, loadable_classes
+                )
+            for component in components:
+                yield section, component
+        else:
+            raise SaveFormatError(f"unexpected record {record}")
+
+
+def iter_sizes(f: IO[bytes]) -> Iterator[Tuple[str, int, Dict[str, int]]]:
+    """
+    Measure the components of a binary save without building them.
+
+    :param f: A binary save positioned after its header
+    :return: For each class in each block: the class name, the number of its
+        components and the encoded size of each field's column. For each
+        tile record: TILE_POSITIONS, the number of tiles and the size of each
+        column of their prefab tags, entity IDs and positions. The schemas
+        and component order of each block are not counted.
+    :rtype: Iterator[Tuple[str, int, Dict[str, int]]]
+    :raises SaveFormatError: If the file is truncated or malformed
+
+    """
+    schemas: List[Tuple[str, List[str]]] = []
+    while True:
+        (record,) = _U8.unpack(_read_exact(f, _U8.size))
+        if record == _END:
+            return
+        (length,) = _U32.unpack(_read_exact(f, _U32.size))
+        data = memoryview(_read_exact(f, length))
+        if record == _BLOCK:
+            yield from _block_sizes(data, schemas)
+        elif record == _TILES:
+            (new_count,) = _U32.unpack_from(data, 0)
+            offset = _U32.size + 2 * new_count
+            if new_count:
+                (length,) = _U32.unpack_from(data, offset)
+                offset += _U32.size
+                yield from _block_sizes(
+                    data[offset : offset + length], schemas
+                )
+                offset += length
+            (count,) = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            sizes = {}
+            for name in ("prefab", "entity", "x", "y"):
+                start = offset
+                _, offset = _read_runs(data, offset, count)
+                sizes[name] = offset - start
+            yield TILE_POSITIONS, count, sizes
+        elif record != _SECTION:
+            raise SaveFormatError(f"unexpected record {record}")
+
+
+def _block_sizes(data: memoryview, schemas: list):
+    (new_classes,) = _U16.unpack_from(data, 0)
+    offset = _U16.size
+    for _ in range(new_classes):
+        class_name, offset = _read_str(data, offset)
+        (field_count,) = _U16.unpack_from(data, offset)
+        offset += _U16.size
+        fields = []
+        for _ in range(field_count):
+            field_name, offset = _read_str(data, offset)
+            fields.append(field_name)
+        schemas.append((class_name, fields))
+
+    (count,) = _U32.unpack_from(data, offset)
+    offset += _U32.size + 2 * count
+    (group_count,) = _U16.unpack_from(data, offset)
+    offset += _U16.size
+    for _ in range(group_count):
+        (tag,) = _U16.unpack_from(data, offset)
+        (size,) = _U32.unpack_from(data, offset + _U16.size)
+        offset += _U16.size + _U32.size
+        class_name, fields = schemas[tag]
+        sizes = {}
+        for field_name in fields:
+            start = offset
+            _, offset = _read_column(data, offset, size)
+            sizes[field_name] = offset - start
+        yield class_name, size, sizes
+
+
+def _encode_block(components, classes, schemas) -> bytearray:
+    """
+    Encode a block: the schemas of classes first seen in it, the class tag
+    of each component in order, then the columns of each class.
+    """
+    order = array("H")
+    groups: Dict[int, list] = {}
+    first_new = len(schemas)
+    for component in components:
+        cls = type(component)
+        tag = classes.get(cls)
+        if tag is None:
+            tag = classes[cls] = len(schemas)
+            schemas.append((cls.__name__, _schema(cls)))
+        group = groups.get(tag)
+        if group is None:
+            group = groups[tag] = []
+        order.append(tag)
+        group.append(component)
+
+    out = bytearray(_U16.pack(len(schemas) - first_new))
+    for class_name, fields in schemas[first_new:]:
+        _write_str(out, class_name)
+        out += _U16.pack(len(fields))
+        for field_name in fields:
+            _write_str(out, field_name)
+    out += _U32.pack(len(order))
+    out += _little_endian(order).tobytes()
+    out += _U16.pack(len(groups))
+    for tag, group in groups.items():
+        out += _U16.pack(tag)
+        out += _U32.pack(len(group))
+        for field_name in schemas[tag][1]:
+            _write_column(out, list(map(attrgetter(field_name), group)))
+    return out
+
+
+def _decode_block(data: memoryview, factories: list, loadable_classes):
+    (new_classes,) = _U16.unpack_from(data, 0)
+    offset = _U16.size
+    for _ in range(new_classes):
+        class_name, offset = _read_str(data, offset)
+        (field_count,) = _U16.unpack_from(data, offset)
+        offset += _U16.size
+        fields = []
+        for _ in range(field_count):
+            field_name, offset = _read_str(data, offset)
+            fields.append(field_name)
+        factories.append(_factory(class_name, fields, loadable_classes))
+
+    (count,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    order = _unpack_array("H", data[offset : offset + 2 * count])
+    offset += 2 * count
+    (group_count,) = _U16.unpack_from(data, offset)
+    offset += _U16.size
+    built = {}
+    for _ in range(group_count):
+        (tag,) = _U16.unpack_from(data, offset)
+        (size,) = _U32.unpack_from(data, offset + _U16.size)
+        offset += _U16.size + _U32.size
+        field_count, build = factories[tag]
+        columns = []
+        for _ in range(field_count):
+            column, offset = _read_column(data, offset, size)
+            columns.append(column)
+        built[tag] = iter(build(columns, size))
+    return [next(built[tag]) for tag in order]
+
+
+def _tile(group: list):
+    """
+    Describe one entity's consecutive components as a tile, if they are one.
+
+    :return: The prefab key, entity ID, x, y and components, or None if the
+        components are not a static entity with a single integer position
+    """
+    static = False
+    position = None
+    fields = []
+    for component in group:
+        cls = type(component)
+        if cls is Entity and component.static:
+            static = True
+        read, positioned = _tile_fields(cls)
+        if positioned:
+            if position is not None:
+                return None
+            position = (component.x, component.y)
+        fields.append(read)
+    if not static or position is None:
+        return None
+    x, y = position
+    if type(x) is not int or type(y) is not int:
+        return None
+
+    entity = group[0].entity
+    key = []
+    for component, read in zip(group, fields):
+        values = read(component)
+        # Equal values of different types, like 1 and True, differ here
+        key.append(
+            (
+                type(component),
+                component.id - entity,
+                values,
+                tuple(map(type, values)),
+            )
+        )
+    return tuple(key), entity, x, y, group
+
+
+_tile_field_cache: Dict[type, Tuple[Any, bool]] = {}
+
+
+def _tile_fields(cls):
+    """
+    Get the function reading the saved fields that the tiles of one prefab
+    share, everything but the IDs and position, and whether the class holds
+    the position.
+    """
+    cached = _tile_field_cache.get(cls)
+    if cached is None:
+        positioned = issubclass(cls, Coordinates)
+        excluded = (
+            {"id", "entity", "x", "y"} if positioned else {"id", "entity"}
+        )
+        names = [name for name in _schema(cls) if name not in excluded]
+        if len(names) > 1:
+            read = attrgetter(*names)
+        elif names:
+            get = attrgetter(names[0])
+            read = lambda component: (get(component),)  # noqa: E731
+        else:
+            read = _no_fields
+        cached = _tile_field_cache[cls] = (read, positioned)
+    return cached
+
+
+def _no_fields(_component):
+    return ()
+
+
+def _frozen(value):
+    """
+    Make a hashable stand-in for a prefab key holding mutable values.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(map(_frozen, value))
+    if isinstance(value, dict):
+        return dict, tuple((_frozen(k), _frozen(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(map(_frozen, value))
+    return value
+
+
+def _encode_tiles(tiles: list, prefabs, classes, schemas) -> bytearray:
+    """
+    Encode tile entities: the components of prefabs first seen here, then
+    the prefab, entity, x and y of every tile.
+    """
+    new_prefabs = []
+    columns: List[list] = [[], [], [], []]
+    for key, entity, x, y, group in tiles:
+        try:
+            tag = prefabs.get(key)
+        except TypeError:
+            # The prefab holds mutable values
+            key = _frozen(key)
+            tag = prefabs.get(key)
+        if tag is None:
+            tag = prefabs[key] = len(prefabs)
+            new_prefabs.append(group)
+        for column, value in zip(columns, (tag, entity, x, y)):
+            column.append(value)
+
+    out = bytearray(_U32.pack(len(new_prefabs)))
+    for group in new_prefabs:
+        out += _U16.pack(len(group))
+    if new_prefabs:
+        templates = _encode_block(
+            [c for group in new_prefabs for c in group], classes, schemas
+        )
+        out += _U32.pack(len(templates))
+        out += templates
+    out += _U32.pack(len(tiles))
+    for column in columns:
+        _write_runs(out, column)
+    return out
+
+
+def _decode_tiles(data: memoryview, prefabs, factories, loadable_classes):
+    """
+    Decode tile entities. The first tile of a new prefab is the prefab's own
+    components; later tiles are copied from them.
+    """
+    (new_count,) = _U32.unpack_from(data, 0)
+    offset = _U32.size
+    sizes = _unpack_array("H", data[offset : offset + 2 * new_count])
+    offset += 2 * new_count
+    fresh = {}
+    if new_count:
+        (length,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        end = offset + length
+        templates = iter(
+            _decode_block(data[offset:end], factories, loadable_classes)
+        )
+        offset = end
+        for size in sizes:
+            group = [next(templates) for _ in range(size)]
+            # Copied before the components are handed out and edited
+            fresh[len(prefabs)] = group
+            prefabs.append(list(map(_template, group)))
+
+    (count,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    columns = []
+    for _ in range(4):
+        column, offset = _read_runs(data, offset, count)
+        columns.append(column)
+    components = []
+    for tag, entity, x, y in zip(*columns):
+        group = fresh.pop(tag, None)
+        if group is not None:
+            components += group
+            continue
+        for build in prefabs[tag]:
+            components.append(build(entity, x, y))
+    return components
+
+
+_template_cache: Dict[type, tuple] = {}
+
+
+def _template(component):
+    """
+    Build the function that copies a prefab component onto a tile entity.
+    """
+    cls = type(component)
+    layout = _template_cache.get(cls)
+    if layout is None:
+        fields = [f for f in dataclasses.fields(cls) if f.init]
+        names = [f.name for f in fields]
+        positions = (
+            (names.index("x"), names.index("y"))
+            if issubclass(cls, Coordinates)
+            else None
+        )
+        layout = _template_cache[cls] = (
+            names,
+            attrgetter(*names),
+            names.index("id"),
+            names.index("entity"),
+            positions,
+            not any(f.kw_only for f in fields),
+        )
+    names, read, id_index, entity_index, positions, positional = layout
+    row = list(read(component))
+    offset = component.id - component.entity
+    mutable = []
+    # Loaded values are plain lists, dicts and sets
+    if not _MUTABLE.isdisjoint(map(type, row)):
+        mutable = [i for i, v in enumerate(row) if type(v) in _MUTABLE]
+        for index in mutable:
+            row[index] = copy.deepcopy(row[index])
+
+    def build(entity, x, y):
+        values = row.copy()
+        values[id_index] = entity + offset
+        values[entity_index] = entity
+        if positions:
+            values[positions[0]] = x
+            values[positions[1]] = y
+        for index in mutable:
+            values[index] = copy.deepcopy(values[index])
+        if positional:
+            return cls(*values)
+        return cls(**dict(zip(names, values)))
+
+    return build
+
+
+def _write_runs(out: bytearray, values: list) -> None:
+    """
+    Append a column of integers as runs of equal differences between
+    consecutive values, the first taken from zero.
+    """
+    deltas = array("q")
+    counts = array("I")
+    previous = 0
+    for value in values:
+        delta = value - previous
+        previous = value
+        if counts and deltas[-1] == delta:
+            counts[-1] += 1
+        else:
+            deltas.append(delta)
+            counts.append(1)
+    out += _U32.pack(len(deltas))
+    out += _little_endian(deltas).tobytes()
+    out += _little_endian(counts).tobytes()
+
+
+def _read_runs(data: memoryview, offset: int, size: int):
+    (runs,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    deltas = _unpack_array("q", data[offset : offset + 8 * runs])
+    offset += 8 * runs
+    counts = _unpack_array("I", data[offset : offset + 4 * runs])
+    offset += 4 * runs
+    values = []
+    value = 0
+    for delta, count in zip(deltas, counts):
+        for _ in range(count):
+            value += delta
+            values.append(value)
+    if len(values) != size:
+        raise SaveFormatError("tile record is malformed")
+    return values, offset
+
+
+def _read_exact(f: IO[bytes], size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise SaveFormatError("binary save is truncated")
+    return data
+
+
+def _schema(cls) -> Tuple[str, ...]:
+    return saved_fields(cls)
+
+
+def _factory(class_name, fields, loadable_classes):
+    """
+    Build the constructor for the saved columns of one class.
+    """
+    cls = loadable_classes.get(class_name)
+    if cls is None:
+        raise ValueError(f"class not found: {class_name}")
+    init_fields = [f for f in dataclasses.fields(cls) if f.init]
+    known = {f.name for f in init_fields}
+    dropped = [name for name in fields if name not in known]
+    if dropped:
+        get_logger(__name__).warning(
+            f"Dropping saved fields no longer on {class_name}: {dropped}",
+            extra={"action": "drop_fields", "component_class": class_name},
+        )
+
+    def build(columns, size):
+        if not columns:
+            return [cls() for _ in range(size)]
+        if fields == [f.name for f in init_fields] and not any(
+            f.kw_only for f in init_fields
+        ):
+            return [cls(*row) for row in zip(*columns)]
+        kept = [
+            (name, column)
+            for name, column in zip(fields, columns)
+            if name in known
+        ]
+        names = [name for name, _ in kept]
+        return [
+            cls(**dict(zip(names, row)))
+            for row in zip(*(column for _, column in kept))
+        ]
+
+    return len(fields), build
+
+
+def _write_column(out: bytearray, values: list) -> None:
+    first = values[0]
+    types = set(map(type, values))
+    if len(types) == 1:
+        kind = type(first)
+        if (
+            len(values) > 1
+            and isinstance(first, _IMMUTABLE)
+            and values.count(first) == len(values)
+            and _hashable(first)
+        ):
+            out += _U8.pack(_CONST)
+            _write_value(out, first)
+            return
+        if kind is int:
+            try:
+                packed = array("q", values)
+            except OverflowError:
+                pass
+            else:
+                out += _U8.pack(_INT64)
+                out += _little_endian(packed).tobytes()
+                return
+        elif kind is bool:
+            out += _U8.pack(_BOOL)
+            out += bytes(values)
+            return
+        elif kind is float:
+            out += _U8.pack(_FLOAT)
+            out += _little_endian(array("d", values)).tobytes()
+            return
+        elif kind is str:
+            joined = "\x00".join(values)
+            if joined.count("\x00") == len(values) - 1:
+                blob = joined.encode("utf-8")
+                out += _U8.pack(_STR)
+                out += _U32.pack(len(blob))
+                out += blob
+                return
+        elif issubclass(kind, Enum):
+            out += _U8.pack(_ENUM)
+            _write_str(out, enum_path(kind))
+            _write_column(out, [value.value for value in values])
+            return
+    out += _U8.pack(_GENERIC)
+    for value in values:
+        _write_value(out, value)
+
+
+def _read_column(data: memoryview, offset: int, size: int):
+    (codec,) = _U8.unpack_from(data, offset)
+    offset += _U8.size
+    if codec == _INT64:
+        end = offset + 8 * size
+        return _unpack_array("q", data[offset:end]).tolist(), end
+    if codec == _BOOL:
+        end = offset + size
+        return list(map(bool, data[offset:end])), end
+    if codec == _FLOAT:
+        end = offset + 8 * size
+        return _unpack_array("d", data[offset:end]).tolist(), end
+    if codec == _STR:
+        (length,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        end = offset + length
+        text = str(data[offset:end], "utf-8")
+        return text.split("\x00") if size else [], end
+    if codec == _ENUM:
+        path, offset = _read_str(data, offset)
+        enum_class = resolve_enum(path)
+        values, offset = _read_column(data, offset, size)
+        return list(map(enum_class, values)), offset
+    if codec == _CONST:
+        value, offset = _read_value(data, offset)
+        return [value] * size, offset
+    if codec == _GENERIC:
+        values = []
+        for _ in range(size):
+            value, offset = _read_value(data, offset)
+            values.append(value)
+        return values, offset
+    raise SaveFormatError(f"unknown column codec {codec}")
+
+
+def _write_value(out: bytearray, value: Any) -> None:
+    """
+    Append one tagged value. Containers are written recursively.
+    """
+    if value is None:
+        out += _U8.pack(_V_NONE)
+    elif value is False:
+        out += _U8.pack(_V_FALSE)
+    elif value is True:
+        out += _U8.pack(_V_TRUE)
+    elif isinstance(value, Enum):
+        out += _U8.pack(_V_ENUM)
+        _write_str(out, enum_path(type(value)))
+        _write_value(out, value.value)
+    elif isinstance(value, int):
+        if -(2**63) <= value < 2**63:
+            out += _U8.pack(_V_INT)
+            out += _I64.pack(value)
+        else:
+            out += _U8.pack(_V_BIGINT)
+            _write_str(out, str(value))
+    elif isinstance(value, float):
+        out += _U8.pack(_V_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        out += _U8.pack(_V_STR)
+        _write_str(out, value)
+    elif isinstance(value, dict):
+        out += _U8.pack(_V_DICT)
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            _write_value(out, key)
+            _write_value(out, item)
+    else:
+        if isinstance(value, tuple):
+            tag = _V_TUPLE
+        elif isinstance(value, list):
+            tag = _V_LIST
+        elif isinstance(value, set):
+            tag = _V_SET
+        elif isinstance(value, frozenset):
+            tag = _V_FROZENSET
+        else:
+            raise TypeError(
+                f"Cannot save a value of type {type(value).__name__}"
+            )
+        out += _U8.pack(tag)
+        out += _U32.pack(len(value))
+        for item in value:
+            _write_value(out, item)
+
+
+def _read_value(data: memoryview, offset: int):
+    (tag,) = _U8.unpack_from(data, offset)
+    offset += _U8.size
+    if tag == _V_NONE:
+        return None, offset
+    if tag == _V_FALSE:
+        return False, offset
+    if tag == _V_TRUE:
+        return True, offset
+    if tag == _V_INT:
+        return _I64.unpack_from(data, offset)[0], offset + _I64.size
+    if tag == _V_FLOAT:
+        return _F64.unpack_from(data, offset)[0], offset + _F64.size
+    if tag == _V_STR:
+        return _read_str(data, offset)
+    if tag == _V_BIGINT:
+        text, offset = _read_str(data, offset)
+        return int(text), offset
+    if tag == _V_ENUM:
+        path, offset = _read_str(data, offset)
+        value, offset = _read_value(data, offset)
+        return resolve_enum(path)(value), offset
+    (count,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    if tag == _V_DICT:
+        output = {}
+        for _ in range(count):
+            key, offset = _read_value(data, offset)
+            output[key], offset = _read_value(data, offset)
+        return output, offset
+    items = []
+    for _ in range(count):
+        item, offset = _read_value(data, offset)
+        items.append(item)
+    if tag == _V_TUPLE:
+        return tuple(items), offset
+    if tag == _V_LIST:
+        return items, offset
+    if tag == _V_SET:
+        return set(items), offset
+    if tag == _V_FROZENSET:
+        return frozenset(items), offset
+    raise SaveFormatError(f"unknown value tag {tag}")
+
+
+def _write_str(out: bytearray, text: str) -> None:
+    encoded = text.encode("utf-8")
+    out += _U32.pack(len(encoded))
+    out += encoded
+
+
+def _read_str(data: memoryview, offset: int):
+    (length,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    end = offset + length
+    return str(data[offset:end], "utf-8"), end
+
+
+def enum_path(enum_class) -> str:
+    """
+    Get the path a save stores for an enum type (see resolve_enum).
+
+    :param enum_class: The enum type
+    :type enum_class: type
+    :return: The type's module and qualified name
+    :rtype: str
+
+    """
+    return f"{enum_class.__module__}:{enum_class.__qualname__}"
+
+
+# Enum types a save may name, by enum_path
+_enum_classes: Dict[str, type] = {}
+# Component classes whose enum types are in _enum_classes
+_scanned_classes: set = set()
+
+
+def register_enum(enum_class: type) -> None:
+    """
+    Allow a save to hold values of an enum type that no component field
+    declares, such as one only used in a save's extra data.
+
+    Enum types named in component field annotations, or defined inside a
+    component class, are known without registering them.
+
+    :param enum_class: The enum type
+    :type enum_class: type
+
+    """
+    _enum_classes[enum_path(enum_class)] = enum_class
+
+
+def resolve_enum(path: str):
+    """
+    Find a known enum type by the path a save stored for it.
+
+    Saves are never trusted to name a module to import: the path must belong
+    to an enum type a component class declares or one that was registered.
+    JSON saves (see engine.serialization) store the same paths.
+
+    :param path: The path, as given by enum_path
+    :type path: str
+    :return: The enum type
+    :rtype: type
+    :raises SaveFormatError: If no known enum type has that path
+
+    """
+    enum_class = _enum_classes.get(path)
+    if enum_class is None:
+        for cls in list(Component.subclasses.values()):
+            if cls not in _scanned_classes:
+                for found in _declared_enums(cls):
+                    _enum_classes[enum_path(found)] = found
+                _scanned_classes.add(cls)
+        enum_class = _enum_classes.get(path)
+        if enum_class is None:
+            raise SaveFormatError(f"{path} is not a known enum type")
+    return enum_class
+
+
+def _declared_enums(cls) -> set:
+    """
+    Gather the enum types in a class's field annotations, including inside
+    Optional, List and the like, and the enum types defined in its body.
+    """
+    found = set()
+    try:
+        annotations = list(typing.get_type_hints(cls).values())
+    except Exception:
+        # A forward reference that does not resolve: keep what is a type
+        annotations = [f.type for f in dataclasses.fields(cls)]
+    while annotations:
+        annotation = annotations.pop()
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            found.add(annotation)
+        annotations.extend(typing.get_args(annotation))
+    for base in cls.__mro__:
+        for value in vars(base).values():
+            if isinstance(value, type) and issubclass(value, Enum):
+                found.add(value)
+    return found
+
+
+def _hashable(value) -> bool:
+    # Tuples are only immutable if what they hold is
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _unpack_array(typecode: str, data: memoryview) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    return _little_endian(values)
+
+
+def _little_endian(values: array) -> array:
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+_BIG_ENDIAN = struct.pack("=H", 1) == struct.pack(">H", 1)
@@ -0,0 +1,220 @@
+"""
+On-demand cProfile captures scoped to named frame sections.
+
+Profiling a whole run mostly measures menus and slows everything down. A
+CallProfiler is started and stopped while the game runs, and only profiles
+the frame sections it is scoped to: the scene hooks, or a few named systems.
+Attach it to the FrameProfiler that already times those sections:
+
+    capture = CallProfiler(sections=["move", "event"])
+    capture.start()
+    frame_profiler.set_call_profiler(capture)
+    ...
+    frame_profiler.set_call_profiler(None)
+    pstats_path, collapsed_path = capture.stop("profiles/horde-wave")
+
+``stop`` writes a pstats dump (for ``python -m pstats`` or snakeviz) and a
+collapsed-stack file (for flamegraph.pl, speedscope or inferno). cProfile only
+records caller/callee pairs, not whole stacks, so each function's own time is
+split across its call paths in proportion to the time each caller spent in
+it.
+"""
+
+import cProfile
+import pstats
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+R = TypeVar("R")
+
+# The sections the scene controller times for the scene on top of the stack
+SCENE_SECTIONS = frozenset(
+    {"scene.before_update", "scene.update", "scene.render"}
+)
+
+# Call paths deeper than this are cut off in the collapsed stacks
+MAX_STACK_DEPTH = 64
+
+
+class CallProfiler:
+    """
+    Collect a cProfile capture of selected frame sections.
+
+    """
+
+    def __init__(self, sections: Optional[Iterable[str]] = SCENE_SECTIONS):
+        """
+        Create a capture.
+
+        :param sections: The section names to profile, or None to profile
+            everything between start and stop
+        :type sections: Optional[Iterable[str]]
+
+        """
+        self.sections: Optional[FrozenSet[str]] = (
+            None if sections is None else frozenset(sections)
+        )
+        self.running = False
+        self._profile: Optional[cProfile.Profile] = None
+        self._depth = 0
+
+    def start(self) -> None:
+        """
+        Start collecting.
+
+        :return: None
+        :raises RuntimeError: If the capture is already running
+
+        """
+        if self.running:
+            raise RuntimeError("Call profiler is already running")
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self.running = True
+        if self.sections is None:
+            self._profile.enable()
+
+    def wants(self, name: str) -> bool:
+        """
+        Check whether a section should be profiled.
+
+        :param name: The section name
+        :type name: str
+        :return: True if the capture is running and scoped to the section
+        :rtype: bool
+
+        """
+        return (
+            self.running
+            and self.sections is not None
+            and name in self.sections
+        )
+
+    def call(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """
+        Call a function with profiling on.
+
+        :param func: The function to call
+        :type func: Callable
+        :return: Whatever the function returns
+
+        """
+        self._enter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._exit()
+
+    @contextmanager
+    def profiling(self) -> Iterator[None]:
+        """
+        Profile the body of a with block.
+
+        """
+        self._enter()
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def _enter(self) -> None:
+        # Nested sections are profiled once, by the outermost one
+        self._depth += 1
+        if self._depth == 1:
+            self._profile.enable()
+
+    def _exit(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._profile.disable()
+
+    def stop(self, path: str) -> Tuple[Path, Path]:
+        """
+        Stop collecting and write the capture.
+
+        :param path: The output path without a suffix; ``.pstats`` and
+            ``.collapsed`` are appended
+        :type path: str
+        :return: The pstats path and the collapsed-stack path
+        :rtype: Tuple[Path, Path]
+        :raises RuntimeError: If the capture is not running
+
+        """
+        if not self.running:
+            raise RuntimeError("Call profiler is not running")
+        self._profile.disable()
+        self.running = False
+        stem = Path(path)
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        pstats_path = stem.with_name(stem.name + ".pstats")
+        collapsed_path = stem.with_name(stem.name + ".collapsed")
+        self._profile.dump_stats(str(pstats_path))
+        stacks = collapsed_stacks(pstats.Stats(self._profile))
+        with open(collapsed_path, "w") as file:
+            for stack, microseconds in sorted(stacks.items()):
+                file.write(f"{stack} {microseconds}\n")
+        self._profile = None
+        return pstats_path, collapsed_path
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """
+    Estimate the own time of each call path from a cProfile capture.
+
+    :param stats: The capture
+    :type stats: pstats.Stats
+    :return: Microseconds per ``root;caller;callee`` path
+    :rtype: Dict[str, int]
+
+    """
+    entries = stats.stats
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+    output: Dict[str, int] = defaultdict(int)
+
+    def walk(func, path, share):
+        _, _, own, total, _ = entries[func]
+        microseconds = int(own * share * 1e6)
+        if microseconds:
+            output[";".join(path)] += microseconds
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_total in callees[func].items():
+            callee_total = entries[callee][3]
+            if callee in visiting or callee_total <= 0:
+                continue
+            callee_share = share * edge_total / callee_total
+            # Paths worth less than a microsecond are not worth walking
+            if callee_total * callee_share < 1e-6:
+                continue
+            visiting.add(callee)
+            walk(callee, path + [_label(callee)], callee_share)
+            visiting.discard(callee)
+
+    for func, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            visiting = {func}
+            walk(func, [_label(func)], 1.0)
+    return dict(output)
+
+
+def _label(func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        label = name
+    else:
+        label = f"{name} ({Path(filename).name}:{line})"
+    return label.replace(";", ",")
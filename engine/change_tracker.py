@@ -0,0 +1,281 @@
+"""
+Per-type change tracking for ComponentManager.
+
+A system that keeps derived state (a transparency map, a cost grid, a render
+layer...) registers a ChangeReader for the component types it depends on::
+
+    reader = cm.track(Material, Coordinates, key="update_senses")
+    changes = reader.drain()
+    if changes.rebuild:
+        ...  # first run, or the manager was cleared: rebuild from scratch
+    else:
+        for component in changes.added + changes.removed + changes.modified:
+            ...  # patch only what changed
+
+The manager reports additions, deletions and assignments to watched fields
+(see Component.watched_fields) to every reader whose types match. Each reader
+coalesces what it has seen since its last drain, so a component added and then
+deleted between two drains is never reported, and a component that moved twice
+is reported once along with the value it had at the last drain.
+
+A reader created with ``cm.track(..., writes=True)`` is also told about
+assignments to unwatched saved fields, which is how an incremental save finds
+the components it must write without comparing every one of them.
+"""
+
+from typing import Dict, Hashable, List, Tuple
+
+from engine.components.component import Component
+from engine.types import ComponentType
+
+
+class ChangeSet:
+    """
+    The changes a reader accumulated between two drains.
+
+    """
+
+    __slots__ = (
+        "added",
+        "removed",
+        "modified",
+        "rebuild",
+        "generation",
+        "_old",
+    )
+
+    def __init__(
+        self,
+        added: List[Component],
+        removed: List[Component],
+        modified: List[Component],
+        rebuild: bool,
+        generation: int,
+        old: Dict[int, Dict[str, object]],
+    ):
+        """
+        Create a change set.
+
+        :param added: Components added since the last drain
+        :type added: List[Component]
+        :param removed: Components deleted since the last drain
+        :type removed: List[Component]
+        :param modified: Components whose watched fields changed, or that were
+                         deleted and added back, since the last drain
+        :type modified: List[Component]
+        :param rebuild: True if the reader cannot describe the changes as a
+                        delta and derived state must be rebuilt
+        :type rebuild: bool
+        :param generation: The manager's generation at the time of the drain
+        :type generation: int
+        :param old: Watched field values as of the last drain, by id(component)
+        :type old: Dict[int, Dict[str, object]]
+
+        """
+        self.added = added
+        self.removed = removed
+        self.modified = modified
+        self.rebuild = rebuild
+        self.generation = generation
+        self._old = old
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.rebuild or self.added or self.removed or self.modified
+        )
+
+    def old_value(self, component: Component, name: str) -> object:
+        """
+        Get the value a watched field had at the last drain.
+
+        For removed and modified components this is the value the consumer
+        last saw. Fields that did not change return their current value.
+
+        :param component: A removed or modified component
+        :type component: Component
+        :param name: The watched field
+        :type name: str
+        :return: The field's value at the last drain
+        :rtype: object
+
+        """
+        values = self._old.get(id(component))
+        if values is not None and name in values:
+            return values[name]
+        return getattr(component, name)
+
+
+class ChangeReader:
+    """
+    Accumulate the changes to a set of component types for one consumer.
+
+    """
+
+    __slots__ = (
+        "types",
+        "key",
+        "writes",
+        "data",
+        "generation",
+        "_rebuild",
+        "_latest",
+        "_added",
+        "_removed",
+        "_modified",
+        "_old",
+    )
+
+    def __init__(
+        self,
+        types: Tuple[ComponentType, ...],
+        key: Hashable,
+        generation: int,
+        writes: bool = False,
+    ):
+        """
+        Create a reader. Its first drain always asks for a rebuild.
+
+        :param types: The component types (and subclasses) to track
+        :type types: Tuple[ComponentType, ...]
+        :param key: The consumer's registration key
+        :type key: Hashable
+        :param generation: The manager's current generation
+        :type generation: int
+        :param writes: Whether writes to unwatched saved fields count as
+                       modifications too
+        :type writes: bool
+
+        """
+        self.types = types
+        self.key = key
+        self.writes = writes
+        # Free for the consumer's derived state, e.g. a cached map.
+        self.data = None
+        self.generation = generation
+        self._latest = generation
+        self._rebuild = True
+        self._added: Dict[int, Component] = {}
+        self._removed: Dict[int, Component] = {}
+        self._modified: Dict[int, Component] = {}
+        self._old: Dict[int, Dict[str, object]] = {}
+
+    @property
+    def pending(self) -> bool:
+        """
+        Report whether anything changed since the last drain.
+
+        :return: True if the next drain would not be empty
+        :rtype: bool
+
+        """
+        return bool(
+            self._rebuild or self._added or self._removed or self._modified
+        )
+
+    def drain(self) -> ChangeSet:
+        """
+        Return the accumulated changes and start accumulating afresh.
+
+        :return: The changes since the previous drain
+        :rtype: ChangeSet
+
+        """
+        changes = ChangeSet(
+            list(self._added.values()),
+            list(self._removed.values()),
+            list(self._modified.values()),
+            self._rebuild,
+            self._latest,
+            self._old,
+        )
+        self.generation = self._latest
+        self._rebuild = False
+        self._added = {}
+        self._removed = {}
+        self._modified = {}
+        self._old = {}
+        return changes
+
+    def invalidate(self, generation: int) -> None:
+        """
+        Drop the accumulated changes and request a rebuild on the next drain.
+
+        :param generation: The manager's current generation
+        :type generation: int
+        :return: None
+
+        """
+        self._latest = generation
+        self._rebuild = True
+        self._added = {}
+        self._removed = {}
+        self._modified = {}
+        self._old = {}
+
+    def on_added(self, component: Component, generation: int) -> None:
+        """
+        Record that a component was added.
+
+        :param component: The component
+        :type component: Component
+        :param generation: The manager's generation after the change
+        :type generation: int
+        :return: None
+
+        """
+        self._latest = generation
+        key = id(component)
+        if self._removed.pop(key, None) is not None:
+            # Deleted and added back: the consumer still holds the old state.
+            self._modified[key] = component
+            return
+        self._modified.pop(key, None)
+        self._old.pop(key, None)
+        self._added[key] = component
+
+    def on_removed(self, component: Component, generation: int) -> None:
+        """
+        Record that a component was deleted.
+
+        :param component: The component
+        :type component: Component
+        :param generation: The manager's generation after the change
+        :type generation: int
+        :return: None
+
+        """
+        self._latest = generation
+        key = id(component)
+        if self._added.pop(key, None) is not None:
+            return
+        self._modified.pop(key, None)
+        self._removed[key] = component
+        # It stops reporting writes now; remember what the consumer saw.
+        old = self._old.setdefault(key, {})
+        for name in component.watched_fields:
+            old.setdefault(name, getattr(component, name))
+
+    def on_modified(
+        self, component: Component, name: str, old: object, generation: int
+    ) -> None:
+        """
+        Record that a watched field of a component was assigned, or for a
+        reader that tracks writes, any saved field.
+
+        :param component: The component
+        :type component: Component
+        :param name: The field that was assigned
+        :type name: str
+        :param old: The field's previous value
+        :type old: object
+        :param generation: The manager's generation after the change
+        :type generation: int
+        :return: None
+
+        """
+        self._latest = generation
+        key = id(component)
+        if key in self._added or key in self._removed:
+            return
+        self._modified[key] = component
+        self._old.setdefault(key, {}).setdefault(name, old)
@@ -10,19 +10,46 @@ multiple indexing strategies, and supports operations such as:
 - Removing components and entities from the game world
 - Temporarily stashing and later unstashing components or entire entities
 - Querying and filtering components based on custom criteria
+- Joining several component types per entity through cached query views
+- Finding the entities on a tile or in a rectangle through a spatial index
+- Looking components up by the value of a declared, indexed field
+- Batching bulk additions and deletions so index upkeep happens once
+- Reporting per-type changes so systems can update derived state incrementally
+- Cloning an independent copy of the whole world for snapshots
 - Serializing component state for save/load functionality
 
 The entity-component system allows for flexible game object composition without
 deep inheritance hierarchies, enabling behavior to be added or removed at runtime.
 """
 
+import copy
+import dataclasses
 from collections import defaultdict
-from typing import Callable, Dict, Generic, Iterable, List, Set, Type
+from contextlib import contextmanager
+from itertools import chain
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Type,
+)
 
-from engine import constants
-from engine.components.component import Component
-from engine.logging import get_logger
+from engine import constants, core
+from engine.change_tracker import ChangeReader, ChangeSet
+from engine.components.component import Component, report_writes, saved_fields
+from engine.components.coordinates import Coordinates
+from engine.field_index import FieldIndex
+from engine.logging import get_hot_path_logger, get_logger
+from engine.query_view import QueryView, Row
+from engine.spatial_index import SpatialIndex
 from engine.types import (
+    ComponentIndex,
     ComponentList,
     ComponentType,
     EntityDict,
@@ -30,6 +57,10 @@ from engine.types import (
     T,
     U,
 )
+from engine.utilities import gc_paused
+
+# Logs from per-component operations, which run many times per frame
+_hot_logger = get_hot_path_logger(__name__)
 
 
 class ComponentManager:
@@ -44,6 +75,9 @@ class ComponentManager:
     1. Components by type - Access all components of a certain type
     2. Components by entity - Access all components belonging to a specific entity
     3. Components by ID - Direct access to individual components by their unique ID
+    4. Coordinates by tile - Access the entities at a position or in an area
+    5. Components by field value - Access components whose indexed field
+       holds a value
 
     The class also provides stashing functionality to temporarily remove entities or
     components from the active game state without destroying them, allowing them to be
@@ -56,25 +90,37 @@ class ComponentManager:
         Initialize a new ComponentManager with empty component collections.
 
         Creates the following data structures:
-        - components: Maps component types to lists of components
-        - components_by_entity: Maps entity IDs to dictionaries of components by type
+        - components: Maps concrete component types to insertion-ordered components
+        - components_by_entity: Maps entity IDs to their components by concrete type
+        - subtypes: Maps each type to the stored concrete types derived from it
         - components_by_id: Maps component IDs to component instances
         - component_types: List of all registered component types
         - stashed_components: Holds components that have been temporarily removed
         - stashed_entities: Maps entity IDs to sets of stashed component IDs
+        - views: Maps query signatures to their cached QueryView
+        - spatial: Maps (x, y) tiles to the Coordinates components on them
+        - field_index: Maps indexed field values to components
+        - readers: Maps consumer keys to their ChangeReader
+        - generation: Counts additions, deletions and reported field writes
+        - tracks_writes: Whether a reader wants writes to unwatched fields
+        - releases_ids: Whether deleting returns IDs to the global allocator
 
         """
         self.logger = get_logger(__name__)
-        self.components: Dict[ComponentType, ComponentList] = defaultdict(list)
-        self.components_by_entity: EntityDictIndex = defaultdict(
-            lambda: defaultdict(list)
-        )
+        self.releases_ids = True
+        self._batch_depth = 0
+        self.generation = 0
+        self.readers: Dict[Hashable, ChangeReader] = {}
+        self._readers_by_type: Dict[type, List[ChangeReader]] = {}
+        self.tracks_writes = False
+        self._reset_storage()
         self.components_by_id: Dict[int, Component] = {}
         self.component_types: List[ComponentType] = []
         self.stashed_components: Dict[int, Component] = {}
 
         # A mapping from the entity id to the related stashed base_components
         self.stashed_entities: Dict[int, Set[int]] = {}
+        self._reset_indexes()
 
     # properties
     @property
@@ -88,27 +134,6 @@ class ComponentManager:
         """
         return set(k for k in self.components_by_entity.keys())
 
-    def _add_component_to_indexes(
-        self, component: T, component_type: Type[T]
-    ) -> None:
-        """
-        Add a component to ComponentManager's indexes.
-
-        Updates the internal indexes to include the given component under its entity and
-        component type.
-
-        :param component: The component instance to add to the indexes
-        :type component: T
-        :param component_type: The type of the component
-        :type component_type: Type[T]
-        :return: None
-
-        """
-        entity_component_dict = self.components_by_entity[component.entity]
-        components = entity_component_dict[component_type]
-        components.append(component)
-        self.components_by_id[component.id] = component
-
     def clear(self) -> None:
         """
         Clear all active components and entities from the component manager.
@@ -120,11 +145,62 @@ class ComponentManager:
 
         """
         self.logger.debug("Clearing component manager")
-        self.components = defaultdict(list)
-        self.components_by_entity = defaultdict(lambda: defaultdict(list))
+        for component in self.components_by_id.values():
+            # Stop the outgoing components reporting field writes to us
+            if component._manager is self:
+                component._manager = None
+        self._reset_storage()
         self.components_by_id = {}
         self.component_types = []
         self.stashed_components = {}
+        self._reset_indexes()
+        self.generation += 1
+        for reader in self.readers.values():
+            reader.invalidate(self.generation)
+
+    def clone(self) -> "ComponentManager":
+        """
+        Create a full, independent copy of the world.
+
+        Every component, active or stashed, is copied and keeps its id and
+        entity, so ids mean the same thing in both managers. List, dict and
+        set fields are copied as well; other field values are shared, which is
+        safe because they are treated as immutable. Changes to either manager
+        after the clone, including field writes, are not seen by the other.
+
+        This is not copy-on-write: cloning costs time and memory in
+        proportion to the whole world, every time. It skips serialization and
+        adds the copies in a single batch, and query views are only built
+        when the clone is queried, so it suits occasional whole-world copies
+        such as a consistent snapshot, not per-move AI lookahead or previews.
+        Change readers are not carried over. IDs deleted from the clone are
+        not released, since the original manager still uses them.
+
+        :return: A new manager of the same type holding the copies
+        :rtype: ComponentManager
+
+        """
+        clone = type(self)()
+        clone.releases_ids = False
+        clone.add_many(
+            _copy_component(component)
+            for component in self.components_by_id.values()
+        )
+        clone.stashed_components = {
+            cid: _copy_component(component)
+            for cid, component in self.stashed_components.items()
+        }
+        clone.stashed_entities = {
+            eid: set(cids) for eid, cids in self.stashed_entities.items()
+        }
+        self.logger.debug(
+            "Cloned component manager",
+            extra={
+                "component_count": len(clone.components_by_id),
+                "stashed_count": len(clone.stashed_components),
+            },
+        )
+        return clone
 
     # data manipulation methods
     def add(self, component: Component, *components: Component) -> None:
@@ -173,6 +249,54 @@ class ComponentManager:
 
             self._add(comp)
 
+    def add_many(self, components: Iterable[Component]) -> None:
+        """
+        Add every component from an iterable in a single batch.
+
+        :param components: The components to add
+        :type components: Iterable[Component]
+        :return: None
+        :raises TypeError: If any input is not a Component instance
+        :raises ValueError: If any component has an invalid entity ID
+
+        """
+        with self.batch():
+            for component in components:
+                self.add(component)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer secondary index upkeep and per-component logging.
+
+        Inside the block, additions and deletions update the primary storage
+        (``get``, ``get_one``, ``get_all``, ``get_entity``) immediately. Query
+        views, the spatial index and field indexes are brought up to date
+        once, when the outermost batch exits or before any method that reads
+        them. Tile lookups (``at``, ``coordinates_at``, ``in_rect``) only
+        bring the spatial index up to date, so placing things tile by tile
+        inside a batch still defers the rest. A component that is added and
+        deleted again inside the batch never touches those indexes. Batches
+        may be nested.
+
+        ::
+
+            with cm.batch():
+                for x, y in tiles:
+                    cm.add(*make_grass(x, y)[1])
+
+        :return: A context manager
+        :rtype: Iterator[None]
+
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush()
+
     def get(
         self,
         component_type: T,
@@ -196,15 +320,260 @@ class ComponentManager:
 
         """
         return [
-            project(x) for x in self.components[component_type] if query(x)
+            project(x)
+            for x in self._iter_components(component_type)
+            if query(x)
+        ]
+
+    def query(
+        self,
+        *component_types: ComponentType,
+        optional: Iterable[ComponentType] = (),
+        exclude: Iterable[ComponentType] = (),
+    ) -> List[Row]:
+        """
+        Join several component types per entity.
+
+        Returns one tuple per entity that has every requested type and none of
+        the excluded types. Each tuple holds the first component of each
+        requested type, then the first component of each optional type (or
+        None), in the order given, so it can be unpacked directly::
+
+            for coords, material in cm.query(Coordinates, Material):
+                ...
+
+        The first call for a given signature builds a view by scanning the
+        entities of the first requested type. The view is then updated
+        incrementally as components are added and deleted, so later calls
+        cost only a copy of the cached rows.
+
+        :param component_types: The component types every row must have
+        :type component_types: ComponentType
+        :param optional: Component types to include when present
+        :type optional: Iterable[ComponentType]
+        :param exclude: Component types that disqualify an entity
+        :type exclude: Iterable[ComponentType]
+        :return: A snapshot of the matching rows, safe to mutate the manager
+                 while iterating
+        :rtype: List[Tuple[Optional[Component], ...]]
+        :raises ValueError: If no required component type is given
+
+        """
+        if not component_types:
+            raise ValueError("query requires at least one component type.")
+        self._flush()
+        key = (component_types, tuple(optional), tuple(exclude))
+        view = self.views.get(key)
+        if view is None:
+            view = self._create_view(*key)
+        return list(view.rows.values())
+
+    def get_by(self, component_type: Type[T], **fields: object) -> List[T]:
+        """
+        Get the components of a type whose fields hold the given values.
+
+        Fields listed in the component's ``indexed_fields`` are answered from a
+        hash index, so ``cm.get_by(Tag, tag_type=TagType.HORDELING)`` costs the
+        size of the result. ``entity`` narrows the search to one entity's
+        components. Any other field is compared against each candidate, and if
+        no given field is indexed the whole type is scanned as with ``get``.
+
+        :param component_type: The component type to select
+        :type component_type: Type[T]
+        :param fields: Field names mapped to the values they must equal
+        :type fields: object
+        :return: The matching components
+        :rtype: List[T]
+
+        """
+        self._flush()
+        candidates = None
+        remaining = dict(fields)
+        if "entity" in remaining:
+            candidates = self.get_all(component_type, remaining.pop("entity"))
+        else:
+            for name, value in fields.items():
+                candidates = self.field_index.lookup(
+                    component_type, name, value
+                )
+                if candidates is not None:
+                    del remaining[name]
+                    break
+        if candidates is None:
+            candidates = self._iter_components(component_type)
+        if not remaining:
+            return list(candidates)
+        return [
+            component
+            for component in candidates
+            if all(
+                getattr(component, name) == value
+                for name, value in remaining.items()
+            )
+        ]
+
+    def at(self, x: int, y: int) -> List[int]:
+        """
+        Get the entities whose Coordinates are on a tile.
+
+        :param x: The tile's x coordinate
+        :type x: int
+        :param y: The tile's y coordinate
+        :type y: int
+        :return: The entity IDs on the tile, in the order they arrived
+        :rtype: List[int]
+
+        """
+        self._sync_spatial()
+        return [coords.entity for coords in self.spatial.at(x, y)]
+
+    def coordinates_at(self, x: int, y: int) -> List[Coordinates]:
+        """
+        Get the Coordinates components on a tile.
+
+        :param x: The tile's x coordinate
+        :type x: int
+        :param y: The tile's y coordinate
+        :type y: int
+        :return: The components on the tile, in the order they arrived
+        :rtype: List[Coordinates]
+
+        """
+        self._sync_spatial()
+        return list(self.spatial.at(x, y))
+
+    def in_rect(self, x: int, y: int, width: int, height: int) -> List[int]:
+        """
+        Get the entities whose Coordinates are inside a rectangle.
+
+        :param x: The left edge
+        :type x: int
+        :param y: The top edge
+        :type y: int
+        :param width: The number of columns covered
+        :type width: int
+        :param height: The number of rows covered
+        :type height: int
+        :return: The entity IDs inside the rectangle
+        :rtype: List[int]
+
+        """
+        self._sync_spatial()
+        return [
+            coords.entity
+            for coords in self.spatial.in_rect(x, y, width, height)
         ]
 
+    def track(
+        self,
+        *component_types: ComponentType,
+        key: Hashable,
+        writes: bool = False,
+    ) -> ChangeReader:
+        """
+        Get the change reader registered under a key, creating it if needed.
+
+        The reader accumulates additions, deletions and watched-field writes
+        to components of the given types (and their subclasses) until it is
+        drained. Its first drain, and the first drain after ``clear``, asks
+        the consumer to rebuild from scratch. Systems call this every time
+        they run and get the same reader back::
+
+            changes = cm.track(Material, key=__name__).drain()
+
+        A reader created with ``writes=True`` also reports assignments to
+        every other saved field as modifications, changed or not. That puts
+        a __setattr__ hook on every component class until the reader is
+        untracked (see report_writes), so it is meant for consumers such as
+        incremental saves that must see every change.
+
+        :param component_types: The component types to track
+        :type component_types: ComponentType
+        :param key: A key identifying the consumer
+        :type key: Hashable
+        :param writes: Whether to report writes to unwatched fields too
+        :type writes: bool
+        :return: The reader for that key
+        :rtype: ChangeReader
+        :raises ValueError: If no type is given, or the key is already
+                            registered for different types or write tracking
+
+        """
+        self._flush()
+        reader = self.readers.get(key)
+        if reader is not None:
+            if reader.types != component_types or reader.writes != writes:
+                raise ValueError(
+                    f"Change reader {key!r} already tracks"
+                    f" {[t.__name__ for t in reader.types]}"
+                    f" with writes={reader.writes}."
+                )
+            return reader
+        if not component_types:
+            raise ValueError("track requires at least one component type.")
+        reader = ChangeReader(component_types, key, self.generation, writes)
+        self.readers[key] = reader
+        self._readers_by_type = {}
+        if writes:
+            if not self.tracks_writes:
+                report_writes(True)
+            self.tracks_writes = True
+        return reader
+
+    def untrack(self, key: Hashable) -> None:
+        """
+        Stop tracking changes for a consumer.
+
+        :param key: The key the reader was registered under
+        :type key: Hashable
+        :return: None
+
+        """
+        reader = self.readers.pop(key, None)
+        if reader is None:
+            return
+        self._readers_by_type = {}
+        if reader.writes and not any(r.writes for r in self.readers.values()):
+            self.tracks_writes = False
+            report_writes(False)
+
+    def changed_tiles(self, changes: ChangeSet) -> Set[Tuple[int, int]]:
+        """
+        Get the tiles a change set touched.
+
+        A Coordinates change touches the tile it was on at the last drain and
+        the tile it is on now. Any other change touches the tile its entity
+        currently stands on, if any.
+
+        :param changes: Changes drained from a reader
+        :type changes: ChangeSet
+        :return: The (x, y) positions whose contents may have changed
+        :rtype: Set[Tuple[int, int]]
+
+        """
+        tiles = set()
+        for component in changes.added + changes.removed + changes.modified:
+            if isinstance(component, Coordinates):
+                tiles.add(
+                    (
+                        changes.old_value(component, "x"),
+                        changes.old_value(component, "y"),
+                    )
+                )
+                tiles.add((component.x, component.y))
+            else:
+                coords = self.get_one(Coordinates, entity=component.entity)
+                if coords:
+                    tiles.add((coords.x, coords.y))
+        return tiles
+
     def get_entity(self, entity: int) -> EntityDict:
         """
         Get a dictionary representing all components attached to an entity.
 
         Returns a dictionary mapping component types to lists of component instances
-        that belong to the specified entity.
+        that belong to the specified entity. The dictionary is built on demand and
+        lists each component under every class in its MRO.
 
         :param entity: The ID of the entity to query
         :type entity: int
@@ -212,7 +581,11 @@ class ComponentManager:
         :rtype: EntityDict
 
         """
-        return self.components_by_entity[entity]
+        output = defaultdict(list)
+        for component in self._entity_components(entity):
+            for component_class in type(component).__mro__:
+                output[component_class].append(component)
+        return output
 
     def get_all(self, component_type: Type[T], entity: int) -> List[T]:
         """
@@ -229,7 +602,18 @@ class ComponentManager:
         :rtype: List[T]
 
         """
-        return self.components_by_entity[entity][component_type]
+        entity_components = self.components_by_entity.get(entity)
+        subtypes = self.subtypes.get(component_type)
+        if not entity_components or not subtypes:
+            return []
+        if len(subtypes) == 1:
+            return entity_components.get(next(iter(subtypes)), [])
+        return [
+            component
+            for subtype, cell in entity_components.items()
+            if subtype in subtypes
+            for component in cell
+        ]
 
     # TODO consider whether we really want to support this.
     def get_one(self, component_type: Type[T], entity: int) -> Generic[T]:
@@ -247,9 +631,16 @@ class ComponentManager:
         :rtype: T or None
 
         """
-        output = self.components_by_entity[entity][component_type]
-        if output:
-            return output[0]
+        entity_components = self.components_by_entity.get(entity)
+        subtypes = self.subtypes.get(component_type)
+        if not entity_components or not subtypes:
+            return None
+        if len(subtypes) == 1:
+            cell = entity_components.get(next(iter(subtypes)))
+            return cell[0] if cell else None
+        for subtype, cell in entity_components.items():
+            if subtype in subtypes:
+                return cell[0]
         return None
 
     def get_component_by_id(self, cid: int) -> Component:
@@ -275,6 +666,8 @@ class ComponentManager:
         itself from the component manager's indexes. Does not delete any references to
         the entity or its components that might exist elsewhere in the game.
 
+        The entity ID and the component IDs are released for reuse.
+
         If the entity also has stashed components, those are deleted as well to prevent
         stashed component leaks.
 
@@ -290,10 +683,11 @@ class ComponentManager:
                 " delete_component?"
             )
 
-        self.logger.debug(
-            "Deleting entity",
-            extra={"entity_id": entity, "operation": "delete_entity"},
-        )
+        if __debug__ and _hot_logger.debug_enabled and not self._batch_depth:
+            _hot_logger.debug(
+                "Deleting entity",
+                extra={"entity_id": entity, "operation": "delete_entity"},
+            )
 
         # Clean up any stashed components belonging to this entity
         if entity in self.stashed_entities:
@@ -309,30 +703,30 @@ class ComponentManager:
             # Remove the stashed components to prevent leaks
             self.drop_stashed_entity(entity)
 
-        components = self.get_entity(entity)
-
-        for _, component_list in components.items():
-            for component in component_list:
-                self.delete_component(component)
-        if entity in self.entities:
-            self._delete_entity_from_indexes(entity)
+        for component in self._entity_components(entity):
+            self.delete_component(component)
+        if self._has_entity(entity):
+            self._drop_entity(entity)
+        if self.releases_ids:
+            core.release_id(entity)
 
     def delete_all(self, entities: Iterable[int]) -> None:
         """
         Delete multiple entities and all their components.
 
         Iterates through the provided collection of entity IDs and deletes each one
-        along with its components.
+        along with its components, as a single batch.
 
         :param entities: An iterable collection of entity IDs to delete
         :type entities: Iterable[int]
         :return: None
 
         """
-        for entity in entities:
-            self.delete(entity)
+        with self.batch():
+            for entity in entities:
+                self.delete(entity)
 
-    def _delete_entity_from_indexes(self, entity: int) -> None:
+    def _drop_entity(self, entity: int) -> None:
         """
         Remove an entity from all component manager indexes.
 
@@ -344,11 +738,10 @@ class ComponentManager:
         :return: None
 
         """
-        components = self.components_by_entity[entity]
-        for component_type, components in components.items():
+        entity_components = self.components_by_entity.pop(entity)
+        for component_type, components in entity_components.items():
             for component in components:
-                self.components[component_type].remove(component)
-        del self.components_by_entity[entity]
+                self.components[component_type].pop(id(component), None)
 
     def delete_component(self, component: Component) -> None:
         """
@@ -357,49 +750,53 @@ class ComponentManager:
         Removes the component from all indexes in the component manager. Does not delete
         any references to the component that might exist elsewhere.
 
+        The component's ID is released for reuse unless the component is being
+        stashed. An ID equal to the entity's is left for delete(entity) to
+        release, since the entity's other components still refer to it.
+
         :param component: The component to delete
         :type component: Component
         :return: None
         :raises ValueError: If the component is None
 
         """
-        self.logger.debug(
-            "Deleting component",
-            extra={
-                "component_id": component.id if component else None,
-                "component_type": (
-                    type(component).__name__ if component else None
-                ),
-                "entity_id": component.entity if component else None,
-            },
-        )
+        if __debug__ and _hot_logger.debug_enabled and not self._batch_depth:
+            _hot_logger.debug(
+                "Deleting component",
+                extra={
+                    "component_id": component.id if component else None,
+                    "component_type": (
+                        type(component).__name__ if component else None
+                    ),
+                    "entity_id": component.entity if component else None,
+                },
+            )
         if not component:
             raise ValueError("Cannot delete None.")
         entity = component.entity
 
         component.on_component_delete(self)
 
-        if entity in self.entities:
-            component_types = type(component).mro()
-            for component_type in component_types:
-                if component in self.components[component_type]:
-                    self.components[component_type].remove(component)
-                if (
-                    component
-                    in self.components_by_entity[component.entity][
-                        component_type
-                    ]
-                ):
-                    self.components_by_entity[component.entity][
-                        component_type
-                    ].remove(component)
+        if self._has_entity(entity):
+            self._unstore(component)
             if component.id in self.components_by_id:
                 del self.components_by_id[component.id]
+            if self._batch_depth:
+                self._defer(component, added=False)
+            else:
+                self._unindex(component)
+        if (
+            self.releases_ids
+            and component.id != entity
+            and component.id not in self.stashed_components
+        ):
+            core.release_id(component.id)
 
     def delete_components(self, component_type: ComponentType) -> None:
-        components_to_delete = [c for c in self.components[component_type]]
-        for component in components_to_delete:
-            self.delete_component(component)
+        components_to_delete = list(self._iter_components(component_type))
+        with self.batch():
+            for component in components_to_delete:
+                self.delete_component(component)
 
     # stashing
     def stash_component(self, cid: int) -> None:
@@ -540,26 +937,18 @@ class ComponentManager:
             extra={"entity_id": eid, "operation": "stash_entity"},
         )
 
-        components = self.get_entity(eid)
+        components = self._entity_components(eid)
         component_ids = set()
 
-        # Check if the entity has any components
-        has_components = False
-        for _, component_list in components.items():
-            if component_list:
-                has_components = True
-                break
-
-        if not has_components:
+        if not components:
             self.logger.warning(
                 "No components found for entity", extra={"entity_id": eid}
             )
 
         # Process components
-        for _, component_list in components.items():
-            for component in component_list:
-                component_ids.add(component.id)
-                self.stash_component(component.id)
+        for component in components:
+            component_ids.add(component.id)
+            self.stash_component(component.id)
 
         self.stashed_entities[eid] = component_ids
         self.logger.info(
@@ -687,6 +1076,10 @@ class ComponentManager:
         for component_id in component_ids:
             if component_id in self.stashed_components:
                 del self.stashed_components[component_id]
+                if self.releases_ids:
+                    core.release_id(component_id)
+        if self.releases_ids and not self._has_entity(eid):
+            core.release_id(eid)
 
         # Remove the entity from stashed entities
         del self.stashed_entities[eid]
@@ -709,15 +1102,54 @@ class ComponentManager:
         }
 
     def from_data(self, loaded_data):
-        active_components = [
-            v for k, v in loaded_data["active_components"].items()
-        ]
-        for _, obj in [item for item in self.components_by_id.items()]:
-            self.delete_component(obj)
-        self.add(*active_components)
+        """
+        Replace the world with loaded components.
+
+        The outgoing world is dropped at once, as by ``clear``; its IDs are
+        not released, since the ID allocator was restored along with the
+        data. The loaded components are then stored and indexed in a single
+        pass, without the per-component checks, logging and change
+        notifications of ``add``: they come from a save, so only their entity
+        IDs are validated. Query views are rebuilt when next queried and
+        change readers are asked to rebuild.
+
+        :param loaded_data: The data returned by serialization.load
+        :type loaded_data: dict
+        :return: None
+        :raises ValueError: If a component has an invalid entity ID
+
+        """
+        self.clear()
+        store = self._store
+        components_by_id = self.components_by_id
+        insert_position = self.spatial.insert
+        insert_fields = self.field_index.insert
+        with gc_paused():
+            for component in loaded_data["active_components"].values():
+                if component.entity == constants.INVALID:
+                    raise ValueError(
+                        f"Invalid entity ID! {component}. The save is damaged."
+                    )
+                store(component)
+                components_by_id[component.id] = component
+                component._manager = self
+                if isinstance(component, Coordinates):
+                    insert_position(component)
+                if component.indexed_fields:
+                    insert_fields(component)
+        self.generation += 1
+        for reader in self.readers.values():
+            reader.invalidate(self.generation)
 
         self.stashed_entities = loaded_data["stashed_entities"]
         self.stashed_components = loaded_data["stashed_components"]
+        self.logger.debug(
+            "Loaded component data",
+            extra={
+                "component_count": len(components_by_id),
+                "stashed_count": len(self.stashed_components),
+            },
+        )
 
     # private methods
     def _add(self, component: Component) -> None:
@@ -762,20 +1194,500 @@ class ComponentManager:
                 " owning entity?"
             )
 
+        self._store(component)
+        self.components_by_id[component.id] = component
+        component._manager = self
+        if self._batch_depth:
+            self._defer(component, added=True)
+            return
+
+        if __debug__ and _hot_logger.debug_enabled:
+            _hot_logger.debug(
+                "Adding component",
+                extra={
+                    "component_id": component.id,
+                    "component_type": type(component).__name__,
+                    "entity_id": entity,
+                    "operation": "add",
+                },
+            )
+        self._index(component)
+
+    def _index(self, component: Component, spatial: bool = True) -> None:
+        """
+        Add a stored component to the secondary indexes and query views.
+
+        :param component: The component that was added
+        :type component: Component
+        :param spatial: False if the spatial index already has it
+        :type spatial: bool
+        :return: None
+
+        """
+        if spatial and isinstance(component, Coordinates):
+            self.spatial.insert(component)
+        if component.indexed_fields:
+            self.field_index.insert(component)
+        self._refresh_views(component)
+        self.generation += 1
+        for reader in self._readers_for(component):
+            reader.on_added(component, self.generation)
+
+    def _unindex(self, component: Component, spatial: bool = True) -> None:
+        """
+        Remove an unstored component from the secondary indexes and views.
+
+        :param component: The component that was deleted
+        :type component: Component
+        :param spatial: False if the spatial index already dropped it
+        :type spatial: bool
+        :return: None
+
+        """
+        if component._manager is self:
+            component._manager = None
+        if spatial and isinstance(component, Coordinates):
+            self.spatial.remove(component)
+        if component.indexed_fields:
+            self.field_index.remove(component)
+        self._refresh_views(component)
+        self.generation += 1
+        for reader in self._readers_for(component):
+            reader.on_removed(component, self.generation)
+
+    def _defer(self, component: Component, added: bool) -> None:
+        """
+        Record an index update to apply when the current batch is flushed.
+
+        Opposite updates to the same component cancel out. A deleted component
+        keeps reporting field changes until the flush so that the indexes it
+        is still listed in stay consistent if it is re-added.
+
+        :param component: The component that was added or deleted
+        :type component: Component
+        :param added: True for an addition, False for a deletion
+        :type added: bool
+        :return: None
+
+        """
+        key = id(component)
+        if isinstance(component, Coordinates):
+            # Tracked apart, so tile lookups can catch up on their own
+            self._defer_spatial(key, component, added)
+        pending = self._pending.get(key)
+        if pending is not None and pending[1] is not added:
+            del self._pending[key]
+            if not added and component._manager is self:
+                # Added and deleted within the batch: it was never indexed.
+                component._manager = None
+            return
+        self._pending[key] = (component, added)
+
+    def _defer_spatial(
+        self, key: int, component: Coordinates, added: bool
+    ) -> None:
+        pending = self._pending_spatial.get(key)
+        if pending is not None and pending[1] is not added:
+            del self._pending_spatial[key]
+        else:
+            self._pending_spatial[key] = (component, added)
+
+    def _sync_spatial(self) -> None:
+        """
+        Apply the spatial index updates deferred by batch(), leaving the
+        other deferred updates for the flush.
+
+        Tile lookups (at, coordinates_at, in_rect) call this instead of
+        _flush, so code that checks tiles while placing things inside a batch
+        only pays for the Coordinates added since its last lookup.
+
+        :return: None
+
+        """
+        if not self._pending_spatial:
+            return
+        pending = self._pending_spatial
+        self._pending_spatial = {}
+        spatial = self.spatial
+        for component, added in pending.values():
+            if added:
+                spatial.insert(component)
+            else:
+                spatial.remove(component)
+
+    def _flush(self) -> None:
+        """
+        Apply the index updates deferred by batch().
+
+        :return: None
+
+        """
+        self._sync_spatial()
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = {}
+        added = 0
+        for component, was_added in pending.values():
+            if was_added:
+                self._index(component, spatial=False)
+                added += 1
+            else:
+                self._unindex(component, spatial=False)
+        if __debug__ and _hot_logger.debug_enabled:
+            _hot_logger.debug(
+                "Applied component batch",
+                extra={
+                    "added_count": added,
+                    "deleted_count": len(pending) - added,
+                    "operation": "batch",
+                },
+            )
+
+    def _on_component_changed(
+        self, component: Component, name: str, old: object
+    ) -> None:
+        """
+        React to an assignment to one of a component's watched fields.
+
+        Called by the component itself (see Component.watched_fields) while it
+        is held by this manager.
+
+        :param component: The component that changed
+        :type component: Component
+        :param name: The name of the field that was assigned
+        :type name: str
+        :param old: The field's previous value
+        :type old: object
+        :return: None
+
+        """
+        if isinstance(component, Coordinates) and name in ("x", "y"):
+            if name == "x":
+                old_position = (old, component.y)
+            else:
+                old_position = (component.x, old)
+            self.spatial.move(component, old_position)
+        if name in component.indexed_fields:
+            self.field_index.move(component, name, old)
+        self.generation += 1
+        for reader in self._readers_for(component):
+            reader.on_modified(component, name, old, self.generation)
+
+    def _on_component_written(
+        self, component: Component, name: str, old: object
+    ) -> None:
+        """
+        React to an assignment to an unwatched field while writes are
+        tracked (see track). Transient fields are not reported.
+
+        :param component: The component that was written
+        :type component: Component
+        :param name: The name of the field that was assigned
+        :type name: str
+        :param old: The field's previous value
+        :type old: object
+        :return: None
+
+        """
+        if name not in saved_fields(type(component)):
+            return
+        self.generation += 1
+        for reader in self._readers_for(component):
+            if reader.writes:
+                reader.on_modified(component, name, old, self.generation)
+
+    def _reset_indexes(self) -> None:
+        """
+        Drop every cached query view, empty the spatial and field indexes and
+        forget any deferred batch updates.
+
+        :return: None
+
+        """
+        self.views: Dict[tuple, QueryView] = {}
+        self._views_by_type: Dict[type, List[QueryView]] = {}
+        self.spatial = SpatialIndex()
+        self.field_index = FieldIndex()
+        # Index updates deferred by batch(), keyed by id(component)
+        self._pending: Dict[int, Tuple[Component, bool]] = {}
+        # The Coordinates among them not yet applied to the spatial index
+        self._pending_spatial: Dict[int, Tuple[Coordinates, bool]] = {}
+
+    def _create_view(
+        self,
+        component_types: Tuple[ComponentType, ...],
+        optional: Tuple[ComponentType, ...],
+        exclude: Tuple[ComponentType, ...],
+    ) -> QueryView:
+        """
+        Build and register a view for a query signature.
+
+        :param component_types: The component types every row must have
+        :type component_types: Tuple[ComponentType, ...]
+        :param optional: Component types to include when present
+        :type optional: Tuple[ComponentType, ...]
+        :param exclude: Component types that disqualify an entity
+        :type exclude: Tuple[ComponentType, ...]
+        :return: The new view
+        :rtype: QueryView
+
+        """
+        view = QueryView(component_types, optional, exclude)
+        view.build(self)
+        self.views[(component_types, optional, exclude)] = view
+        # Concrete types are resolved to their views lazily on first change.
+        self._views_by_type = {}
         self.logger.debug(
-            "Adding component",
+            "Created query view",
             extra={
-                "component_id": component.id,
-                "component_type": type(component).__name__,
-                "entity_id": entity,
-                "operation": "add",
+                "view_types": [t.__name__ for t in view.watched],
+                "view_rows": len(view.rows),
+                "view_count": len(self.views),
             },
         )
+        return view
+
+    def _refresh_views(self, component: Component) -> None:
+        """
+        Update the row of the component's entity in every affected view.
+
+        :param component: The component that was added or removed
+        :type component: Component
+        :return: None
 
-        component_classes = type(component).mro()
-        for component_class in component_classes:
-            self.components_by_entity[entity][component_class].append(
-                component
+        """
+        if not self.views:
+            return
+        component_type = type(component)
+        views = self._views_by_type.get(component_type)
+        if views is None:
+            views = [
+                view
+                for view in self.views.values()
+                if issubclass(component_type, view.watched)
+            ]
+            self._views_by_type[component_type] = views
+        for view in views:
+            view.refresh(self, component.entity)
+
+    def _readers_for(self, component: Component) -> List[ChangeReader]:
+        """
+        Get the change readers that track a component's type.
+
+        :param component: The component that changed
+        :type component: Component
+        :return: The matching readers, cached per concrete type
+        :rtype: List[ChangeReader]
+
+        """
+        if not self.readers:
+            return []
+        component_type = type(component)
+        readers = self._readers_by_type.get(component_type)
+        if readers is None:
+            readers = [
+                reader
+                for reader in self.readers.values()
+                if issubclass(component_type, reader.types)
+            ]
+            self._readers_by_type[component_type] = readers
+        return readers
+
+    # storage primitives
+    #
+    # Alternative storage backends (see ArchetypeComponentManager) override
+    # these methods and inherit everything else: validation, logging,
+    # stashing and serialization are all written against this small surface.
+    def _reset_storage(self) -> None:
+        """
+        Create empty per-type and per-entity storage.
+
+        Each component is stored once, under its concrete type. Per-type
+        storage maps ``id(component)`` to the component, so removal is a
+        constant-time delete, and dicts keep insertion order. Queries by a base
+        type go through ``subtypes``, which lists the stored concrete types
+        that are subclasses of each type.
+
+        :return: None
+
+        """
+        self.components: Dict[ComponentType, ComponentIndex] = {}
+        self.components_by_entity: EntityDictIndex = {}
+        self.subtypes: Dict[ComponentType, Dict[ComponentType, None]] = {}
+
+    def _store(self, component: Component) -> None:
+        """
+        Insert an already validated component into the per-type and per-entity
+        storage.
+
+        The first component of a concrete type registers that type with every
+        class in its MRO, so that queries by a base type can find it.
+
+        :param component: The component to store
+        :type component: Component
+        :return: None
+
+        """
+        component_type = type(component)
+        components = self.components.get(component_type)
+        if components is None:
+            components = self.components[component_type] = {}
+            for component_class in component_type.__mro__:
+                self.subtypes.setdefault(component_class, {})[
+                    component_type
+                ] = None
+        components[id(component)] = component
+
+        entity_components = self.components_by_entity.get(component.entity)
+        if entity_components is None:
+            entity_components = self.components_by_entity[component.entity] = (
+                {}
             )
-            self.components[component_class].append(component)
-        self.components_by_id[component.id] = component
+        cell = entity_components.get(component_type)
+        if cell is None:
+            entity_components[component_type] = [component]
+        else:
+            cell.append(component)
+
+    def _unstore(self, component: Component) -> None:
+        """
+        Remove a component from the per-type and per-entity storage.
+
+        Per-type removal is O(1). The per-entity list is searched by identity,
+        which costs at most the number of components of that type the entity
+        holds.
+
+        :param component: The component to remove
+        :type component: Component
+        :return: None
+
+        """
+        component_type = type(component)
+        components = self.components.get(component_type)
+        if components is not None:
+            components.pop(id(component), None)
+        entity_components = self.components_by_entity.get(component.entity)
+        if entity_components is not None:
+            cell = entity_components.get(component_type)
+            _remove_identical(cell, component)
+            if cell is not None and not cell:
+                del entity_components[component_type]
+
+    def _has_entity(self, entity: int) -> bool:
+        """
+        Report whether an entity currently has an entry in the storage.
+
+        :param entity: The ID of the entity to check
+        :type entity: int
+        :return: True if the entity is stored
+        :rtype: bool
+
+        """
+        return entity in self.components_by_entity
+
+    def _entity_components(self, entity: int) -> ComponentList:
+        """
+        Get a snapshot of every component attached to an entity.
+
+        Each component appears once, so callers may delete or stash while
+        iterating over the result.
+
+        :param entity: The ID of the entity to query
+        :type entity: int
+        :return: A new list of the entity's components
+        :rtype: ComponentList
+
+        """
+        entity_components = self.components_by_entity.get(entity)
+        if not entity_components:
+            return []
+        return [
+            component
+            for cell in entity_components.values()
+            for component in cell
+        ]
+
+    def _iter_components(self, component_type: ComponentType) -> Iterable:
+        """
+        Iterate over every stored component that is an instance of a type.
+
+        A concrete type with no stored subclasses is a single lookup; a base
+        type chains the storage of its stored subclasses, grouped by type in
+        the order the types were first stored.
+
+        :param component_type: The component type to iterate
+        :type component_type: ComponentType
+        :return: An iterable over the matching components
+        :rtype: Iterable[Component]
+
+        """
+        subtypes = self.subtypes.get(component_type)
+        if not subtypes:
+            return ()
+        if len(subtypes) == 1:
+            return self.components[next(iter(subtypes))].values()
+        return chain.from_iterable(
+            self.components[subtype].values() for subtype in subtypes
+        )
+
+
+def _remove_identical(components: ComponentList, component: Component) -> None:
+    """
+    Remove a component from a list by identity rather than equality.
+
+    Dataclass equality compares every field, which is both slow and able to
+    match a different component that happens to hold the same values.
+
+    :param components: The list to remove from, or None
+    :type components: ComponentList
+    :param component: The component to remove
+    :type component: Component
+    :return: None
+
+    """
+    if not components:
+        return
+    for index, candidate in enumerate(components):
+        if candidate is component:
+            del components[index]
+            return
+
+
+_MUTABLE_FIELD_TYPES = (list, dict, set)
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _copy_component(component: Component) -> Component:
+    """
+    Copy a component for a cloned manager.
+
+    Container fields are deep-copied so that in-place edits such as
+    ``path.append`` stay on one side of the clone. The copy is not attached to
+    any manager.
+
+    :param component: The component to copy
+    :type component: Component
+    :return: The copy
+    :rtype: Component
+
+    """
+    component_type = type(component)
+    names = _FIELD_NAMES.get(component_type)
+    if names is None:
+        names = tuple(f.name for f in dataclasses.fields(component_type))
+        _FIELD_NAMES[component_type] = names
+    # Bypasses __init__ and the watched-field hook, like copy.copy, but
+    # without the __reduce_ex__ round trip.
+    duplicate = component_type.__new__(component_type)
+    for name in names:
+        value = getattr(component, name)
+        if isinstance(value, _MUTABLE_FIELD_TYPES):
+            value = copy.deepcopy(value)
+        object.__setattr__(duplicate, name, value)
+    extra = getattr(component, "__dict__", None)
+    if extra:
+        for name, value in extra.items():
+            if name not in duplicate.__dict__:
+                duplicate.__dict__[name] = value
+    return duplicate
@@ -6,7 +6,7 @@ explicitly re-exported here.
 """
 
 from .actor import Actor
-from .component import Component
+from .component import Component, transient
 from .coordinates import Coordinates
 from .energy_actor import EnergyActor
 from .entity import Entity
@@ -17,4 +17,5 @@ __all__ = [
     "Coordinates",
     "EnergyActor",
     "Entity",
+    "transient",
 ]
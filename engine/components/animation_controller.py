@@ -8,7 +8,7 @@ from engine.components.updateable import Updateable
 from engine.game_scene import GameScene
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationController(Updateable, ABC):
     """
     Base class for animation effects that can be applied to entities.
@@ -6,7 +6,7 @@ from engine.components.component import Component
 from engine.components.events import Event
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadClasses(Event):
     def listener_type(self):
         return LoadClassListener
@@ -20,7 +20,7 @@ class LoadClasses(Event):
             self._log_debug(f"loaded {clz}")
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadClassListener(Component, ABC):
     """
     A world building step.
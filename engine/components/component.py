@@ -1,17 +1,47 @@
+import dataclasses
 import logging
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field
+from typing import ClassVar, Dict, FrozenSet, Tuple
 
 from engine import constants
 from engine.core import get_id
 
+# Field metadata key marking fields that are never saved (see transient)
+TRANSIENT = "transient"
 
-@dataclass
-class Component(object):
+
+class _ManagerSlot:
+    """
+    Hold the back-reference to the ComponentManager a component is in.
+
+    A slotted dataclass cannot give a non-field slot a class-level default,
+    so the slot lives here and is filled in by __new__, which runs for every
+    construction and copy whatever __init__ a subclass generates.
+    """
+
+    __slots__ = ("_manager",)
+
+    def __new__(cls, *args, **kwargs):
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "_manager", None)
+        return instance
+
+
+@dataclass(slots=True)
+class Component(_ManagerSlot):
     id: int = field(default_factory=get_id)
     entity: int = constants.INVALID
 
     subclasses = {}
 
+    # Fields whose assignment is reported to the ComponentManager holding the
+    # component, so that it can keep derived indexes (e.g. the spatial index)
+    # up to date. Only classes that declare watched fields pay for the hook.
+    watched_fields: ClassVar[FrozenSet[str]] = frozenset()
+    # Fields the ComponentManager keeps a hash index on (see cm.get_by).
+    # Indexed fields are always watched. Their values must be hashable.
+    indexed_fields: ClassVar[FrozenSet[str]] = frozenset()
+
     def on_component_delete(self, cm):
         """
         Called by the CM when the component is deleted.
@@ -37,4 +67,113 @@ class Component(object):
         )
 
     def __init_subclass__(cls, **kwargs):
+        # Zero-argument super() breaks on slotted dataclasses, which are
+        # rebuilt as a new class after the class body has been compiled.
+        super(Component, cls).__init_subclass__(**kwargs)
         Component.subclasses[cls.__name__] = cls
+        if not cls.indexed_fields <= cls.watched_fields:
+            cls.watched_fields = cls.watched_fields | cls.indexed_fields
+        if cls.watched_fields and "__setattr__" not in cls.__dict__:
+            cls.__setattr__ = _notifying_setattr
+
+
+def _notifying_setattr(self, name, value):
+    """
+    Set an attribute and report changes to watched fields to the manager.
+
+    While writes are reported (see report_writes), assignments to other
+    fields are reported too, whether or not the value changed.
+    """
+    manager = self._manager
+    if manager is None:
+        object.__setattr__(self, name, value)
+        return
+    if name not in self.watched_fields:
+        if not manager.tracks_writes:
+            object.__setattr__(self, name, value)
+            return
+        old = getattr(self, name, None)
+        object.__setattr__(self, name, value)
+        manager._on_component_written(self, name, old)
+        return
+    old = getattr(self, name)
+    object.__setattr__(self, name, value)
+    if old != value:
+        manager._on_component_changed(self, name, old)
+
+
+# Number of consumers that asked for every field write to be reported
+_write_reporters = 0
+
+
+def report_writes(enabled: bool) -> None:
+    """
+    Start or stop reporting assignments to every component field.
+
+    Only classes with watched fields pay for a __setattr__ hook normally.
+    While at least one consumer has asked for writes, every component class
+    gets it, so each write costs a Python call; the hook is removed again
+    once the last consumer stops. Calls are counted, so every start must be
+    matched by a stop.
+
+    :param enabled: True to start, False to stop
+    :type enabled: bool
+    :return: None
+
+    """
+    global _write_reporters
+    _write_reporters += 1 if enabled else -1
+    # Subclasses without a hook of their own inherit this one
+    if _write_reporters == 1 and "__setattr__" not in Component.__dict__:
+        Component.__setattr__ = _notifying_setattr
+    elif _write_reporters == 0 and "__setattr__" in Component.__dict__:
+        del Component.__setattr__
+
+
+def transient(default=None, *, default_factory=MISSING):
+    """
+    Declare a component field holding runtime state that is never saved.
+
+    Use it for caches and other state that can be rebuilt, such as a cost map
+    a brain computes each turn. Transient fields are not constructor
+    arguments and are left out of saves, comparisons and reprs, so a loaded
+    component starts with the default and rebuilds the value when it needs
+    it::
+
+        cost_map: Optional[np.ndarray] = transient()
+
+    :param default: The value the field starts with
+    :param default_factory: Called for the starting value instead, for
+        mutable defaults
+    :return: The dataclass field
+
+    """
+    options = dict(
+        init=False, repr=False, compare=False, metadata={TRANSIENT: True}
+    )
+    if default_factory is not MISSING:
+        return field(default_factory=default_factory, **options)
+    return field(default=default, **options)
+
+
+_saved_fields: Dict[type, Tuple[str, ...]] = {}
+
+
+def saved_fields(cls) -> Tuple[str, ...]:
+    """
+    Get the names of the fields a save holds for a component class: its
+    constructor arguments, in order. Transient fields are never among them.
+
+    :param cls: A component class
+    :return: The field names
+    :rtype: Tuple[str, ...]
+
+    """
+    names = _saved_fields.get(cls)
+    if names is None:
+        names = _saved_fields[cls] = tuple(
+            f.name
+            for f in dataclasses.fields(cls)
+            if f.init and not f.metadata.get(TRANSIENT)
+        )
+    return names
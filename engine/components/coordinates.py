@@ -1,17 +1,24 @@
 import math
 from dataclasses import dataclass
-from typing import Tuple
+from typing import ClassVar, FrozenSet, Tuple
 
 from engine.components.component import Component
 from engine.constants import PRIORITY_MEDIUM
 
 
-@dataclass
+@dataclass(slots=True)
 class Coordinates(Component):
     """
     Provide location information.
+
+    Moves are reported to the ComponentManager, which keeps its spatial index
+    (``cm.at`` / ``cm.in_rect``) current without callers doing anything.
     """
 
+    watched_fields: ClassVar[FrozenSet[str]] = frozenset(
+        {"x", "y", "priority"}
+    )
+
     x: int = None
     y: int = None
     priority: int = PRIORITY_MEDIUM
@@ -4,7 +4,7 @@ from engine.components.actor import Actor
 from engine.constants import PRIORITY_MEDIUM
 
 
-@dataclass
+@dataclass(slots=True)
 class EnergyActor(Actor):
     """
     Track scheduling metadata for actors that act on the world timeline.
@@ -3,10 +3,12 @@ from dataclasses import dataclass
 
 from engine import GameScene
 from engine.components.component import Component
-from engine.logging import get_logger
+from engine.logging import get_hot_path_logger
 
+_hot_logger = get_hot_path_logger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class Event(Component):
     """
     Define an event that notifies listeners.
@@ -25,14 +27,14 @@ class Event(Component):
             - Executes before/after hooks on the event.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(
-            "Dispatching event",
-            extra={
-                "event_type": type(self).__name__,
-                "entity": self.entity,
-            },
-        )
+        if __debug__ and _hot_logger.debug_enabled:
+            _hot_logger.debug(
+                "Dispatching event",
+                extra={
+                    "event_type": type(self).__name__,
+                    "entity": self.entity,
+                },
+            )
         dispatch_event(scene, self)
 
     @abstractmethod
@@ -13,7 +13,7 @@ primitive used across multiple game systems.
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class Updateable(Component, ABC):
     """Abstract base class for entities that require periodic updates.
 
@@ -16,7 +16,8 @@ Key features include:
 
 from time import perf_counter_ns
 
-from engine.logging import get_logger
+from engine.id_allocator import IdAllocator
+from engine.logging import get_hot_path_logger, get_logger
 
 
 def time_ms():
@@ -30,9 +31,7 @@ def time_ms():
     :rtype: int
 
     """
-    logger = get_logger("core")
-    result = int(perf_counter_ns() / 1000000)
-    return result
+    return int(perf_counter_ns() / 1000000)
 
 
 def timed(ms, module):
@@ -53,33 +52,37 @@ def timed(ms, module):
     """
 
     def outer(func):
+        logger = get_logger(module)
+        hot_logger = get_hot_path_logger(module)
+
         def inner(*args, **kwargs):
-            logger = get_logger(module)
-            logger.debug(
-                "Starting timed function execution",
-                extra={
-                    "function": func.__name__,
-                    "threshold_ms": ms,
-                    "args_count": len(args),
-                    "kwargs_count": len(kwargs),
-                },
-            )
+            if __debug__ and hot_logger.debug_enabled:
+                hot_logger.debug(
+                    "Starting timed function execution",
+                    extra={
+                        "function": func.__name__,
+                        "threshold_ms": ms,
+                        "args_count": len(args),
+                        "kwargs_count": len(kwargs),
+                    },
+                )
 
             t0 = time_ms()
             result = func(*args, **kwargs)
             t1 = time_ms()
             duration = t1 - t0
 
-            # Always log the duration for performance tracking
-            logger.debug(
-                "Completed timed function execution",
-                extra={
-                    "function": func.__name__,
-                    "duration_ms": duration,
-                    "threshold_ms": ms,
-                    "threshold_exceeded": duration > ms,
-                },
-            )
+            # Log the duration for performance tracking
+            if __debug__ and hot_logger.debug_enabled:
+                hot_logger.debug(
+                    "Completed timed function execution",
+                    extra={
+                        "function": func.__name__,
+                        "duration_ms": duration,
+                        "threshold_ms": ms,
+                        "threshold_exceeded": duration > ms,
+                    },
+                )
 
             # Warn if the threshold is exceeded
             if duration > ms:
@@ -314,99 +317,107 @@ def get_id(name=None):
     """
     Generate or retrieve a unique ID, optionally associated with a name.
 
-    This function either generates a new sequential ID or retrieves a previously created
+    This function either allocates a new ID or retrieves a previously created
     ID associated with the given name. If a name is provided and has not been seen
     before, a new ID will be created and associated with that name for future reference.
 
+    IDs come from a generational allocator (see engine.id_allocator): the
+    index of a released ID is reused, under a new generation, by a later call.
+
     :param name: A name to associate with the ID
     :type name: str or None
     :return: A unique identifier, either newly generated or retrieved from the mapping
     :rtype: int
 
     """
-    global ID_SEQ
-    global NAME_ID_MAP
-    logger = get_logger("core")
-
-    start = time_ms()
-    logger.debug(
-        "Function entry",
-        extra={
-            "function": "get_id",
-            "function_args": name,
-            "function_kwargs": "{}",
-        },
+    if not name:
+        return ID_ALLOCATOR.allocate()
+    existing = NAME_ID_MAP.get(name)
+    if existing is not None:
+        return existing
+    new_id = ID_ALLOCATOR.allocate()
+    NAME_ID_MAP[name] = new_id
+    get_logger("core").debug(
+        "Created new ID mapping",
+        extra={"action": "get_id", "entity_name": name, "id_value": new_id},
     )
+    return new_id
 
-    if not name:
-        ID_SEQ += 1
-        logger.debug(
-            "Generated new anonymous ID",
-            extra={"action": "get_id", "id_value": ID_SEQ},
-        )
-        # Log function exit with return value
-        duration = time_ms() - start
-        logger.debug(
-            "Function exit",
-            extra={
-                "function": "get_id",
-                "duration_ms": duration,
-                "return_value": str(ID_SEQ),
-            },
-        )
-        return ID_SEQ
-    if name in NAME_ID_MAP:
-        logger.debug(
-            "Retrieved existing named ID",
-            extra={
-                "action": "get_id",
-                "entity_name": name,
-                "id_value": NAME_ID_MAP[name],
-            },
-        )
 
-        # Log function exit with return value
-        duration = time_ms() - start
-        logger.debug(
-            "Function exit",
-            extra={
-                "function": "get_id",
-                "event": "function_exit",
-                "duration_ms": duration,
-                "return_value": str(NAME_ID_MAP[name]),
-            },
-        )
-        return NAME_ID_MAP[name]
-    else:
-        new_id = get_id()
-        NAME_ID_MAP[name] = new_id
-        logger.debug(
-            "Created new ID mapping",
-            extra={
-                "action": "get_id",
-                "entity_name": name,
-                "id_value": new_id,
-            },
-        )
+def get_ids(count):
+    """
+    Allocate several anonymous IDs at once.
 
-        # Log function exit with return value
-        duration = time_ms() - start
-        logger.debug(
-            "Function exit",
-            extra={
-                "function": "get_id",
-                "event": "function_exit",
-                "duration_ms": duration,
-                "return_value": str(new_id),
-            },
-        )
-        return new_id
+    Factories that build an entity and its components together use this to
+    pay for allocation once rather than once per component.
+
+    :param count: The number of IDs to allocate
+    :type count: int
+    :return: The new IDs
+    :rtype: list[int]
+
+    """
+    return ID_ALLOCATOR.allocate_many(count)
+
+
+def release_id(id_value):
+    """
+    Release an ID so that its index can be recycled.
+
+    The released value itself is never issued again. Releasing an ID twice,
+    or one that was never allocated, does nothing.
+
+    :param id_value: The ID to release
+    :type id_value: int
+    :return: None
+
+    """
+    ID_ALLOCATOR.release(id_value)
 
 
-ID_SEQ = 100
+# Indexes up to 100 are left for hard-coded IDs.
+ID_ALLOCATOR = IdAllocator(first_index=101)
 NAME_ID_MAP = {}
 
 
+def get_id_state():
+    """
+    Get the state of the ID allocator, for saving alongside the named IDs.
+
+    :return: A JSON-compatible snapshot of the allocator
+    :rtype: dict
+
+    """
+    return ID_ALLOCATOR.get_state()
+
+
+def set_id_state(state):
+    """
+    Restore the ID allocator from a saved snapshot.
+
+    :param state: A snapshot returned by get_id_state
+    :type state: dict
+    :return: None
+
+    """
+    ID_ALLOCATOR.set_state(state)
+
+
+def reserve_ids(ids):
+    """
+    Make sure IDs that are already in use are never allocated again.
+
+    Used when loading data that was saved without allocator state.
+
+    :param ids: IDs that are in use
+    :type ids: Iterable[int]
+    :return: None
+
+    """
+    for id_value in ids:
+        ID_ALLOCATOR.reserve(id_value)
+
+
 def get_named_ids():
     """
     Get the dictionary mapping names to their associated unique IDs.
@@ -444,3 +455,4 @@ def set_named_ids(new_mapping):
         extra={"action": "set_named_ids", "mapping_size": len(new_mapping)},
     )
     NAME_ID_MAP = new_mapping
+    reserve_ids(new_mapping.values())
@@ -0,0 +1,152 @@
+"""
+Hash indexes on declared component field values for ComponentManager.
+
+A component class opts in by listing fields in ``indexed_fields``::
+
+    @dataclass(slots=True)
+    class Tag(Component):
+        indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"tag_type"})
+        tag_type: TagType = TagType.NONE
+
+FieldIndex then maps ``(class, field) -> value -> components`` for that class
+and every subclass of it, so ``cm.get_by(Tag, tag_type=...)`` costs the size of
+the result rather than a scan. Indexed fields are watched (see
+Component.watched_fields), which lets the manager re-index a component when one
+of those fields is assigned. Indexed values must be hashable.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from engine.components.component import Component
+from engine.types import ComponentType
+
+IndexKey = Tuple[ComponentType, str]
+Bucket = Dict[int, Component]
+
+
+class FieldIndex:
+    """
+    Map declared field values to the components holding them.
+
+    """
+
+    __slots__ = ("buckets", "_keys")
+
+    def __init__(self):
+        """
+        Create an empty index.
+
+        """
+        self.buckets: Dict[IndexKey, Dict[Hashable, Bucket]] = {}
+        self._keys: Dict[ComponentType, List[IndexKey]] = {}
+
+    def keys_for(self, component_type: ComponentType) -> List[IndexKey]:
+        """
+        Get the (class, field) pairs a component of a concrete type is indexed
+        under: one per indexed field of each class in its MRO.
+
+        :param component_type: The concrete component type
+        :type component_type: ComponentType
+        :return: The index keys, cached per type
+        :rtype: List[Tuple[ComponentType, str]]
+
+        """
+        keys = self._keys.get(component_type)
+        if keys is None:
+            keys = [
+                (component_class, name)
+                for component_class in component_type.mro()
+                for name in sorted(
+                    getattr(component_class, "indexed_fields", ())
+                )
+            ]
+            self._keys[component_type] = keys
+        return keys
+
+    def insert(self, component: Component) -> None:
+        """
+        Index a component under the current values of its indexed fields.
+
+        :param component: The component to index
+        :type component: Component
+        :return: None
+
+        """
+        for key in self.keys_for(type(component)):
+            self._insert(key, getattr(component, key[1]), component)
+
+    def remove(self, component: Component) -> None:
+        """
+        Remove a component from every index it is listed in.
+
+        :param component: The component to remove
+        :type component: Component
+        :return: None
+
+        """
+        for key in self.keys_for(type(component)):
+            self._remove(key, getattr(component, key[1]), component)
+
+    def move(self, component: Component, name: str, old: Hashable) -> None:
+        """
+        Re-index a component after one of its indexed fields was assigned.
+
+        Components that are not indexed under ``old`` are ignored.
+
+        :param component: The component that changed
+        :type component: Component
+        :param name: The field that was assigned
+        :type name: str
+        :param old: The field's previous value
+        :type old: Hashable
+        :return: None
+
+        """
+        new = getattr(component, name)
+        for key in self.keys_for(type(component)):
+            if key[1] == name and self._remove(key, old, component):
+                self._insert(key, new, component)
+
+    def lookup(
+        self, component_type: ComponentType, name: str, value: Hashable
+    ) -> Optional[Iterable[Component]]:
+        """
+        Get the components of a type whose field holds a value.
+
+        :param component_type: The (possibly base) type to look up
+        :type component_type: ComponentType
+        :param name: The field to match
+        :type name: str
+        :param value: The value to match
+        :type value: Hashable
+        :return: The matching components, or None if the field is not indexed
+                 for that type
+        :rtype: Optional[Iterable[Component]]
+
+        """
+        if name not in getattr(component_type, "indexed_fields", ()):
+            return None
+        bucket = self.buckets.get((component_type, name), {}).get(value)
+        return bucket.values() if bucket else ()
+
+    def _insert(
+        self, key: IndexKey, value: Hashable, component: Component
+    ) -> None:
+        values = self.buckets.get(key)
+        if values is None:
+            values = self.buckets[key] = {}
+        bucket = values.get(value)
+        if bucket is None:
+            bucket = values[value] = {}
+        bucket[id(component)] = component
+
+    def _remove(
+        self, key: IndexKey, value: Hashable, component: Component
+    ) -> bool:
+        values = self.buckets.get(key)
+        bucket = values.get(value) if values else None
+        if bucket is None or bucket.pop(id(component), None) is None:
+            return False
+        if not bucket:
+            del values[value]
+        return True
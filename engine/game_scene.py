@@ -2,7 +2,9 @@ from typing import TYPE_CHECKING, Any, final
 
 from engine import serialization
 from engine.component_manager import ComponentManager
-from engine.logging import get_logger
+from engine.logging import get_hot_path_logger, get_logger
+from engine.profiler import FrameProfiler
+from engine.save_journal import SaveJournal
 from engine.sound.sound_controller import SoundController
 from engine.ui_context import UiContext
 
@@ -47,7 +49,10 @@ class GameScene:
         self.ui_context: UiContext | None = None
         self.sound = None
         self.config = None
+        self.profiler = FrameProfiler()
+        self.journal: SaveJournal | None = None
         self.logger = get_logger(f"{self.__class__.__name__}")
+        self.hot_logger = get_hot_path_logger(self.logger.name)
 
     def add_gui_element(self, element: Any):
         """
@@ -181,7 +186,10 @@ class GameScene:
         if self.ui_context is None:
             raise RuntimeError("UI context is not configured for this scene.")
         self.ui_context.clear_root()
-        self.logger.debug(f"Rendering {len(self.gui_elements)} GUI elements")
+        if __debug__ and self.hot_logger.debug_enabled:
+            self.hot_logger.debug(
+                f"Rendering {len(self.gui_elements)} GUI elements"
+            )
         for element in self.gui_elements:
             element.update(self, dt_ms)
         self.gui_elements = [
@@ -204,7 +212,7 @@ class GameScene:
 
         """
         self.logger.info(f"Unloading scene: {self.__class__.__name__}")
-        pass
+        self.close_journal()
 
     @final
     def load(
@@ -241,6 +249,7 @@ class GameScene:
         self.sound = sound
         self.ui_context = ui_context
         self.config = controller.config
+        self.profiler = controller.profiler
         self.logger.debug(f"Calling on_load() for {self.__class__.__name__}")
         self.on_load()
 
@@ -269,14 +278,88 @@ class GameScene:
 
         """
         self.logger.info(f"Saving game to file: {file_name}")
+        if self.journal is not None and self.journal.path == file_name:
+            self.close_journal()
         try:
-            serialization.save(objects, file_name, extras)
+            self.profiler.call(
+                "save", serialization.save, objects, file_name, extras
+            )
             self.logger.debug(f"Game saved successfully to {file_name}")
         except Exception as e:
             self.logger.error(
                 f"Failed to save game to {file_name}: {str(e)}", exc_info=True
             )
 
+    def save_game_incremental(self, file_name, extras):
+        """
+        Save this scene's game state to a file, writing only what changed.
+
+        The first save to a file (and the first after a load) writes a full
+        snapshot; later ones append the changes to the file's journal, which
+        is compacted into the snapshot now and then. Only copying the state
+        happens here; it is written on a worker thread (see is_saving) one
+        save at a time. See engine.save_journal.
+
+        Parameters:
+            file_name (str): The name/path of the save file
+            extras: Additional data to be included in the save file
+
+        """
+        self.logger.info(f"Saving game incrementally to file: {file_name}")
+        journal = self.journal
+        if (
+            journal is None
+            or journal.path != file_name
+            or journal.cm is not self.cm
+        ):
+            self.close_journal()
+            journal = self.journal = SaveJournal(self.cm, file_name)
+        # The writes happen on the journal's worker, outside the "save" span
+        journal.tracer = self.profiler.tracer
+        try:
+            self.profiler.call("save", journal.save, extras)
+            self.logger.debug(f"Game save to {file_name} queued")
+        except Exception as e:
+            self.logger.error(
+                f"Failed to save game to {file_name}: {str(e)}", exc_info=True
+            )
+            # Start over from a full snapshot next time
+            self.close_journal()
+
+    def is_saving(self) -> bool:
+        """
+        Check whether an incremental save is still being written.
+
+        Returns:
+            bool: True while the save journal has unfinished writes
+
+        """
+        return self.journal is not None and self.journal.busy
+
+    def close_journal(self):
+        """
+        Finish any pending writes and drop the save journal, so the next
+        incremental save writes a full snapshot.
+
+        """
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def read_save_info(self, file_name):
+        """
+        Read a save file's info without loading it, for listing saves.
+
+        Parameters:
+            file_name (str): The name/path of the save file
+
+        Returns:
+            The save's info ("object_count" and the "extra" data it was saved
+            with), or None if the file is not a readable save
+
+        """
+        return serialization.read_info(file_name)
+
     def load_game(self, file_name):
         """
         Load game state from a save file.
@@ -291,8 +374,9 @@ class GameScene:
 
         """
         self.logger.info(f"Loading game from file: {file_name}")
+        self.close_journal()
         try:
-            data = serialization.load(file_name)
+            data = self.profiler.call("load", serialization.load, file_name)
             self.logger.debug(f"Game loaded successfully from {file_name}")
             return data
         except Exception as e:
@@ -5,7 +5,8 @@ from tcod import libtcodpy as tcd
 
 from engine import GameScene
 from engine.component_manager import ComponentManager
-from engine.logging import get_logger
+from engine.logging import get_hot_path_logger, get_logger
+from engine.profiler import FrameProfiler
 from engine.sound.default_sound_controller import DefaultSoundController
 from engine.ui_context import UiContext
 
@@ -56,6 +57,9 @@ class GameSceneController:
             gui (Any): The graphical user interface manager for rendering.
             cm (ComponentManager): Manages game components and their interactions.
             sound (DefaultSoundController): Controls game audio.
+            profiler (FrameProfiler): Times the sections of each frame and feeds
+                                      the trace recorder; shared with every
+                                      scene and disabled by default.
             _scene_stack (List[GameScene]): Stack of active game scenes with the
                                            most recent scene at the top.
 
@@ -66,8 +70,10 @@ class GameSceneController:
         self.ui_context = ui_context
         self.cm = ComponentManager()
         self.sound = DefaultSoundController(tracks)
+        self.profiler = FrameProfiler()
         self._scene_stack: List[GameScene] = []
         self.logger = get_logger(__name__)
+        self.hot_logger = get_hot_path_logger(__name__)
         self.logger.debug(
             "GameSceneController instantiated", extra={"title": self.title}
         )
@@ -165,6 +171,7 @@ class GameSceneController:
         3. Calls update() to process game logic, input, and state changes
         4. Calls render() to draw the scene to the screen
         5. Flushes the console to display the rendered frame
+        6. Closes the frame in the profiler
 
         The loop continues until either:
         - The scene stack becomes empty (all scenes are popped)
@@ -187,16 +194,21 @@ class GameSceneController:
             dt_ms = int((now - last_frame_time) * 1000)
             last_frame_time = now
 
-            self.logger.debug(
-                f"Processing frame for scene: {scene_name}",
-                extra={
-                    "scene_type": scene_name,
-                    "stack_position": len(self._scene_stack) - 1,
-                    "phase": "before_frame",
-                },
+            if __debug__ and self.hot_logger.debug_enabled:
+                self.hot_logger.debug(
+                    f"Processing frame for scene: {scene_name}",
+                    extra={
+                        "scene_type": scene_name,
+                        "stack_position": len(self._scene_stack) - 1,
+                        "phase": "before_frame",
+                    },
+                )
+
+            profiler = self.profiler
+            profiler.call(
+                "scene.before_update", current_scene.before_update, dt_ms
             )
-
-            current_scene.before_update(dt_ms)
-            current_scene.update(dt_ms)
-            current_scene.render(dt_ms)
-            tcd.console_flush()
+            profiler.call("scene.update", current_scene.update, dt_ms)
+            profiler.call("scene.render", current_scene.render, dt_ms)
+            profiler.call("console_flush", tcd.console_flush)
+            profiler.end_frame()
@@ -0,0 +1,206 @@
+"""
+Generational ID allocation with index recycling.
+
+An ID packs a dense *index* into its low INDEX_BITS bits and a *generation*
+into the bits above::
+
+    id = generation << INDEX_BITS | index
+
+Releasing an ID puts its index on a free list and advances the index's
+generation, so the index is handed out again under a new ID. Because the
+generation is part of the value, a released ID is never issued twice, and a
+stale reference to it can never match the entity or component that reuses
+the index. Indexes stay small and dense, so per-entity data can live in
+arrays indexed by ``index_of(id)``.
+"""
+
+from typing import Dict, List
+
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+def index_of(id_value: int) -> int:
+    """
+    Get the dense index part of an ID.
+
+    :param id_value: An ID issued by an IdAllocator
+    :type id_value: int
+    :return: The ID's index
+    :rtype: int
+
+    """
+    return id_value & INDEX_MASK
+
+
+def generation_of(id_value: int) -> int:
+    """
+    Get the generation part of an ID.
+
+    :param id_value: An ID issued by an IdAllocator
+    :type id_value: int
+    :return: The ID's generation
+    :rtype: int
+
+    """
+    return id_value >> INDEX_BITS
+
+
+class IdAllocator:
+    """
+    Issue unique IDs, recycling the indexes of released ones.
+
+    """
+
+    __slots__ = ("first_index", "next_index", "free", "generations", "_free")
+
+    def __init__(self, first_index: int = 1):
+        """
+        Create an allocator.
+
+        :param first_index: The lowest index to issue; lower values are left
+                            for hard-coded IDs
+        :type first_index: int
+
+        """
+        self.first_index = first_index
+        self.next_index = first_index
+        # Released indexes, reused last-in first-out.
+        self.free: List[int] = []
+        # Current generation of every index that has been released at least
+        # once; all other indexes are at generation 0.
+        self.generations: Dict[int, int] = {}
+        self._free = set()
+
+    def allocate(self) -> int:
+        """
+        Issue one ID.
+
+        :return: A new ID
+        :rtype: int
+
+        """
+        if self.free:
+            index = self.free.pop()
+            self._free.discard(index)
+            return self.generations[index] << INDEX_BITS | index
+        index = self.next_index
+        self.next_index = index + 1
+        return index
+
+    def allocate_many(self, count: int) -> List[int]:
+        """
+        Issue several IDs at once.
+
+        Recycled indexes are used first; the rest is a single contiguous run
+        of fresh indexes.
+
+        :param count: The number of IDs to issue
+        :type count: int
+        :return: The new IDs
+        :rtype: List[int]
+
+        """
+        ids = []
+        while self.free and len(ids) < count:
+            ids.append(self.allocate())
+        start = self.next_index
+        self.next_index = start + count - len(ids)
+        ids.extend(range(start, self.next_index))
+        return ids
+
+    def release(self, id_value: int) -> bool:
+        """
+        Return an ID so that its index can be reused.
+
+        IDs that were never issued, were already released, or belong to an
+        older generation of their index are ignored, so releasing is safe to
+        repeat.
+
+        :param id_value: The ID to release
+        :type id_value: int
+        :return: True if the index was freed
+        :rtype: bool
+
+        """
+        if not self.is_live(id_value):
+            return False
+        index = id_value & INDEX_MASK
+        self.generations[index] = (id_value >> INDEX_BITS) + 1
+        self.free.append(index)
+        self._free.add(index)
+        return True
+
+    def is_live(self, id_value: int) -> bool:
+        """
+        Report whether an ID has been issued and not released.
+
+        :param id_value: The ID to check
+        :type id_value: int
+        :return: True if the ID is live
+        :rtype: bool
+
+        """
+        index = id_value & INDEX_MASK
+        if id_value < 0 or not self.first_index <= index < self.next_index:
+            return False
+        if index in self._free:
+            return False
+        return self.generations.get(index, 0) == id_value >> INDEX_BITS
+
+    def reserve(self, id_value: int) -> None:
+        """
+        Make sure an ID's index is never issued as a fresh index.
+
+        Used when IDs from elsewhere (a save file, a name mapping) are adopted
+        without the allocator state that issued them.
+
+        Negative values, such as constants.INVALID, are ignored.
+
+        :param id_value: An ID that is already in use
+        :type id_value: int
+        :return: None
+
+        """
+        if id_value < 0:
+            return
+        index = id_value & INDEX_MASK
+        if index >= self.next_index:
+            self.next_index = index + 1
+        generation = id_value >> INDEX_BITS
+        if index in self._free:
+            # The next ID issued for this index must be newer than this one.
+            if generation >= self.generations[index]:
+                self.generations[index] = generation + 1
+        elif generation > self.generations.get(index, 0):
+            self.generations[index] = generation
+
+    def get_state(self) -> dict:
+        """
+        Get a JSON-compatible snapshot of the allocator.
+
+        :return: The allocator state
+        :rtype: dict
+
+        """
+        return {
+            "first_index": self.first_index,
+            "next_index": self.next_index,
+            "free": list(self.free),
+            "generations": [[k, v] for k, v in self.generations.items()],
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restore a snapshot taken by get_state.
+
+        :param state: The allocator state
+        :type state: dict
+        :return: None
+
+        """
+        self.first_index = state["first_index"]
+        self.next_index = state["next_index"]
+        self.free = list(state["free"])
+        self._free = set(self.free)
+        self.generations = {k: v for k, v in state["generations"]}
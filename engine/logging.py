@@ -3,13 +3,18 @@ Logging configuration for HordeRL engine.
 
 This module provides a standard logging configuration for the HordeRL engine,
 with support for both file and console logging, different environments, and
-consistent log formatting.
+consistent log formatting. Handlers can optionally be moved to a background
+thread behind a bounded queue, so that disk I/O stays off the game loop. Code
+that runs many times per frame logs through a HotPathLogger, which skips
+building log payloads when nothing is emitted.
 """
 
+import atexit
 import logging
 import logging.config
 import logging.handlers
 import os
+import queue
 import sys
 from typing import Any, Dict, Optional
 
@@ -26,6 +31,19 @@ DEFAULT_FILE_LEVEL = {
     "production": logging.INFO,
 }
 
+# What a full log queue does with a new record: drop it or wait for room
+QUEUE_POLICIES = ("drop", "block")
+
+# Whether hot-path logging is switched off regardless of logger levels
+_PRODUCTION_MODE = False
+
+# Hot-path loggers by name, so that they can be refreshed on reconfiguration
+_HOT_PATH_LOGGERS: Dict[str, "HotPathLogger"] = {}
+
+# The active queue handler and its listener, when queued logging is enabled
+_QUEUE_HANDLER: Optional["BoundedQueueHandler"] = None
+_QUEUE_LISTENER: Optional["_FlushingQueueListener"] = None
+
 
 def configure_logging(
     environment: str = "development",
@@ -35,6 +53,10 @@ def configure_logging(
     file_level: Optional[int] = None,
     capture_warnings: bool = True,
     console_enabled: bool = False,
+    production_mode: Optional[bool] = None,
+    queue_enabled: bool = False,
+    queue_size: int = 10000,
+    queue_policy: str = "drop",
 ) -> None:
     """
     Configure the logging system for the application.
@@ -47,12 +69,23 @@ def configure_logging(
         file_level: Override the default file logging level for the environment
         capture_warnings: Whether to capture warnings via logging
         console_enabled: Whether to enable console logging
+        production_mode: Whether to switch hot-path logging off; defaults to
+            True in the production environment
+        queue_enabled: Whether to write records on a background thread
+        queue_size: The most records the queue holds before the policy applies
+        queue_policy: 'drop' to discard records while the queue is full, or
+            'block' to wait for room
 
     Returns:
         None
     """
     if environment not in ("development", "test", "production"):
         raise ValueError(f"Unknown environment: {environment}")
+    if queue_policy not in QUEUE_POLICIES:
+        raise ValueError(f"Unknown queue policy: {queue_policy}")
+
+    # Write out anything still queued from an earlier configuration
+    shutdown_logging()
 
     # Create log directory if it doesn't exist
     if log_file is not None and not os.path.exists(log_dir):
@@ -107,6 +140,13 @@ def configure_logging(
         }
         handler_names.append("file")
 
+    # Let the root logger drop records that no handler would emit, so that
+    # isEnabledFor (and the hot-path flags) reflect what is actually written.
+    root_level = min(
+        (handler["level"] for handler in handlers.values()),
+        default=logging.WARNING,
+    )
+
     logging.config.dictConfig(
         {
             "version": 1,
@@ -117,14 +157,21 @@ def configure_logging(
             },
             "handlers": handlers,
             "root": {
-                "level": "DEBUG",
+                "level": root_level,
                 "handlers": handler_names,
             },
         }
     )
 
+    if queue_enabled and root_logger.handlers:
+        _start_queue_logging(root_logger, queue_size, queue_policy)
+
     # Capture warnings from the warnings module
     logging.captureWarnings(capture_warnings)
+
+    if production_mode is None:
+        production_mode = environment == "production"
+    set_production_mode(production_mode)
 
     # Log the configuration
     logger = logging.getLogger(__name__)
@@ -139,10 +186,133 @@ def configure_logging(
             f", file_level={logging.getLevelName(file_level)}, "
             f"log_file={log_file_path}"
         )
+    if _QUEUE_LISTENER is not None:
+        log_message += (
+            f", queue_size={queue_size}, queue_policy={queue_policy}"
+        )
 
     logger.info(log_message)
 
 
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hand records to a bounded queue, dropping or blocking when it is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str):
+        """
+        Create a handler for a queue.
+
+        Args:
+            log_queue: The bounded queue read by the listener
+            policy: One of QUEUE_POLICIES
+        """
+        super().__init__(log_queue)
+        self.policy = policy
+        # Records discarded under the drop policy; guarded by the handler lock
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue according to the policy.
+
+        Args:
+            record: The prepared record
+
+        Returns:
+            None
+        """
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    A QueueListener whose stop waits for room in a full queue.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        # The listener thread is still draining, so this cannot deadlock.
+        self.queue.put(self._sentinel)
+
+
+def _start_queue_logging(
+    root_logger: logging.Logger, queue_size: int, policy: str
+) -> None:
+    """
+    Move the root logger's handlers behind a queue and a listener thread.
+
+    Args:
+        root_logger: The configured root logger
+        queue_size: The queue's capacity
+        policy: One of QUEUE_POLICIES
+
+    Returns:
+        None
+    """
+    global _QUEUE_HANDLER, _QUEUE_LISTENER
+    handlers = list(root_logger.handlers)
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _QUEUE_HANDLER = BoundedQueueHandler(log_queue, policy)
+    _QUEUE_LISTENER = _FlushingQueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(_QUEUE_HANDLER)
+    _QUEUE_LISTENER.start()
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background log writer after it has written every queued record.
+
+    The handlers go back on the root logger, so records logged afterwards are
+    written directly. Does nothing unless queued logging is running. Runs
+    automatically at interpreter exit.
+
+    Returns:
+        None
+    """
+    global _QUEUE_HANDLER, _QUEUE_LISTENER
+    if _QUEUE_LISTENER is None:
+        return
+    queue_handler, listener = _QUEUE_HANDLER, _QUEUE_LISTENER
+    _QUEUE_HANDLER = _QUEUE_LISTENER = None
+
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+        handler.flush()
+    if queue_handler.dropped:
+        logging.getLogger(__name__).warning(
+            "Dropped %d log records because the log queue was full",
+            queue_handler.dropped,
+        )
+
+
+def get_dropped_record_count() -> int:
+    """
+    Get how many records the running log queue has dropped.
+
+    Returns:
+        The number of dropped records, or 0 when logging is not queued
+    """
+    if _QUEUE_HANDLER is None:
+        return 0
+    return _QUEUE_HANDLER.dropped
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(
     name: str, extra: Optional[Dict[str, Any]] = None
 ) -> logging.Logger:
@@ -163,3 +333,139 @@ def get_logger(
         return logging.LoggerAdapter(logger, extra)
 
     return logger
+
+
+class HotPathLogger:
+    """
+    Log from code that runs many times per frame.
+
+    Whether each level is enabled is cached on the instance, so call sites can
+    skip building their ``extra`` payload when the record would be dropped::
+
+        if __debug__ and hot_logger.debug_enabled:
+            hot_logger.debug("Adding component", extra={...})
+
+    Under ``python -O`` the ``__debug__`` guard compiles the whole block away.
+    Where a guard is inconvenient, ``extra`` may be a callable that builds the
+    payload; it is only called when the record is emitted.
+
+    The cached flags are refreshed by configure_logging and
+    set_production_mode. Call refresh_hot_path_loggers after changing logger
+    levels by other means.
+    """
+
+    __slots__ = ("logger", "debug_enabled", "info_enabled")
+
+    def __init__(self, logger: logging.Logger):
+        """
+        Wrap a logger.
+
+        Args:
+            logger: The logger that records are sent to
+        """
+        self.logger = logger
+        self.debug_enabled = False
+        self.info_enabled = False
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Re-read the logger's effective level into the cached flags.
+
+        Returns:
+            None
+        """
+        enabled = not _PRODUCTION_MODE
+        self.debug_enabled = enabled and self.logger.isEnabledFor(
+            logging.DEBUG
+        )
+        self.info_enabled = enabled and self.logger.isEnabledFor(logging.INFO)
+
+    def debug(self, msg: str, extra: Any = None) -> None:
+        """
+        Log a debug message if debug records are enabled.
+
+        Args:
+            msg: The message
+            extra: A dict of extra fields, or a callable returning one
+
+        Returns:
+            None
+        """
+        if self.debug_enabled:
+            self._log(logging.DEBUG, msg, extra)
+
+    def info(self, msg: str, extra: Any = None) -> None:
+        """
+        Log an info message if info records are enabled.
+
+        Args:
+            msg: The message
+            extra: A dict of extra fields, or a callable returning one
+
+        Returns:
+            None
+        """
+        if self.info_enabled:
+            self._log(logging.INFO, msg, extra)
+
+    def _log(self, level: int, msg: str, extra: Any) -> None:
+        if callable(extra):
+            extra = extra()
+        # Attribute the record to the hot-path call site, not this module.
+        self.logger.log(level, msg, extra=extra, stacklevel=3)
+
+
+def get_hot_path_logger(name: str) -> HotPathLogger:
+    """
+    Get the hot-path logger for a name, creating it on first use.
+
+    Args:
+        name: The logger name, typically the module name (__name__)
+
+    Returns:
+        The shared HotPathLogger for that name
+    """
+    hot_logger = _HOT_PATH_LOGGERS.get(name)
+    if hot_logger is None:
+        hot_logger = HotPathLogger(logging.getLogger(name))
+        _HOT_PATH_LOGGERS[name] = hot_logger
+    return hot_logger
+
+
+def refresh_hot_path_loggers() -> None:
+    """
+    Update the cached level flags of every hot-path logger.
+
+    Returns:
+        None
+    """
+    for hot_logger in _HOT_PATH_LOGGERS.values():
+        hot_logger.refresh()
+
+
+def set_production_mode(enabled: bool) -> None:
+    """
+    Switch hot-path logging off (or back on) regardless of logger levels.
+
+    Ordinary loggers are unaffected.
+
+    Args:
+        enabled: True to silence hot-path logging
+
+    Returns:
+        None
+    """
+    global _PRODUCTION_MODE
+    _PRODUCTION_MODE = enabled
+    refresh_hot_path_loggers()
+
+
+def is_production_mode() -> bool:
+    """
+    Report whether hot-path logging is switched off.
+
+    Returns:
+        True in production mode
+    """
+    return _PRODUCTION_MODE
@@ -0,0 +1,291 @@
+"""
+Per-section frame profiling.
+
+A FrameProfiler times named sections of each frame (a system, an Updateable,
+the render pass) and keeps the cost of each section over the last few hundred
+frames in a ring buffer, so the sections that eat the frame budget can be
+found while the game runs:
+
+    profiler.call("move", move.run, scene)
+    ...
+    profiler.end_frame()
+    for stats in profiler.stats():
+        print(stats.name, stats.p95_ms)
+
+A section that runs several times in a frame is summed into one sample for
+that frame. Frames in which a section does not run add no sample for it. The
+time between two end_frame calls is recorded as the section "frame".
+
+A profiler can also forward every section to a TraceRecorder (see
+engine.tracing), which keeps the individual spans for a timeline view, and run
+chosen sections under a CallProfiler (see engine.call_profiler) for a cProfile
+capture. When none of these is on, the profiler calls straight through, so
+instrumented code can stay in place.
+"""
+
+import csv
+import dataclasses
+import json
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+from engine.call_profiler import CallProfiler
+from engine.tracing import TraceRecorder
+
+R = TypeVar("R")
+
+# The section name given to whole frames
+FRAME = "frame"
+
+
+@dataclass(frozen=True, slots=True)
+class SectionStats:
+    """
+    Summarize the recent cost of one profiled section.
+
+    """
+
+    name: str
+    samples: int
+    last_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+class FrameProfiler:
+    """
+    Time named sections of each frame and keep their recent history.
+
+    """
+
+    def __init__(self, history: int = 240, enabled: bool = False):
+        """
+        Create a profiler.
+
+        :param history: How many frames of samples to keep per section
+        :type history: int
+        :param enabled: Whether to start timing immediately
+        :type enabled: bool
+
+        """
+        self.history = history
+        self.enabled = enabled
+        self.tracer: Optional[TraceRecorder] = None
+        self.call_profiler: Optional[CallProfiler] = None
+        # Whether sections are measured at all: timing, tracing or a capture
+        self.active = enabled
+        self.frames = 0
+        # Nanoseconds spent in each section during the current frame
+        self._frame: Dict[str, int] = {}
+        self._samples: Dict[str, Deque[int]] = {}
+        self._frame_start: Optional[int] = None
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Start or stop timing.
+
+        Time spent while disabled is not counted in the next frame sample.
+
+        :param enabled: Whether to time sections
+        :type enabled: bool
+        :return: None
+
+        """
+        self.enabled = enabled
+        self._update_active()
+        self._frame = {}
+        self._frame_start = None
+
+    def set_tracer(self, tracer: Optional[TraceRecorder]) -> None:
+        """
+        Start or stop forwarding every section to a trace recorder.
+
+        :param tracer: The recorder, or None to stop tracing
+        :type tracer: Optional[TraceRecorder]
+        :return: None
+
+        """
+        self.tracer = tracer
+        self._update_active()
+        self._frame_start = None
+
+    def set_call_profiler(self, call_profiler: Optional[CallProfiler]) -> None:
+        """
+        Start or stop running the sections a call profiler is scoped to
+        under it.
+
+        Starting and stopping the capture itself is left to the caller.
+
+        :param call_profiler: The capture, or None to detach it
+        :type call_profiler: Optional[CallProfiler]
+        :return: None
+
+        """
+        self.call_profiler = call_profiler
+        self._update_active()
+
+    def _update_active(self) -> None:
+        self.active = (
+            self.enabled
+            or self.tracer is not None
+            or self.call_profiler is not None
+        )
+
+    def call(self, name: str, func: Callable[..., R], *args, **kwargs) -> R:
+        """
+        Call a function, timing it as a section of the current frame.
+
+        :param name: The section name
+        :type name: str
+        :param func: The function to call
+        :type func: Callable
+        :return: Whatever the function returns
+
+        """
+        if not self.active:
+            return func(*args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            capture = self.call_profiler
+            if capture is not None and capture.wants(name):
+                return capture.call(func, *args, **kwargs)
+            return func(*args, **kwargs)
+        finally:
+            self._record(name, start, perf_counter_ns())
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """
+        Time the body of a with block as a section of the current frame.
+
+        :param name: The section name
+        :type name: str
+
+        """
+        if not self.active:
+            yield
+            return
+        start = perf_counter_ns()
+        try:
+            capture = self.call_profiler
+            if capture is not None and capture.wants(name):
+                with capture.profiling():
+                    yield
+            else:
+                yield
+        finally:
+            self._record(name, start, perf_counter_ns())
+
+    def end_frame(self) -> None:
+        """
+        Close the current frame and push its section costs into the history.
+
+        :return: None
+
+        """
+        if not self.active:
+            return
+        now = perf_counter_ns()
+        if self._frame_start is not None:
+            if self.tracer is not None:
+                self.tracer.span(FRAME, self._frame_start, now)
+            self._frame[FRAME] = now - self._frame_start
+        self._frame_start = now
+        if not self.enabled:
+            self._frame = {}
+            return
+        for name, elapsed in self._frame.items():
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.history)
+                self._samples[name] = samples
+            samples.append(elapsed)
+        self._frame = {}
+        self.frames += 1
+
+    def _record(self, name: str, start: int, end: int) -> None:
+        if self.enabled:
+            self._frame[name] = self._frame.get(name, 0) + end - start
+        if self.tracer is not None:
+            self.tracer.span(name, start, end)
+
+    def reset(self) -> None:
+        """
+        Forget every recorded sample.
+
+        :return: None
+
+        """
+        self._samples.clear()
+        self._frame = {}
+        self._frame_start = None
+        self.frames = 0
+
+    def stats(self) -> List[SectionStats]:
+        """
+        Summarize every section, costliest p95 first.
+
+        :return: One entry per section that has samples
+        :rtype: List[SectionStats]
+
+        """
+        output = [
+            _summarize(name, samples)
+            for name, samples in self._samples.items()
+            if samples
+        ]
+        output.sort(key=lambda stats: stats.p95_ms, reverse=True)
+        return output
+
+    def export(self, path: str) -> Path:
+        """
+        Write the current stats to a file.
+
+        A ``.json`` path gets a JSON list of objects; any other path gets CSV
+        with one row per section.
+
+        :param path: Where to write
+        :type path: str
+        :return: The path written
+        :rtype: Path
+
+        """
+        path = Path(path)
+        rows = [dataclasses.asdict(stats) for stats in self.stats()]
+        if path.suffix.lower() == ".json":
+            path.write_text(json.dumps(rows, indent=2))
+            return path
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(
+                file,
+                fieldnames=[f.name for f in dataclasses.fields(SectionStats)],
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+
+def _summarize(name: str, samples: Deque[int]) -> SectionStats:
+    ordered = sorted(samples)
+    count = len(ordered)
+    return SectionStats(
+        name=name,
+        samples=count,
+        last_ms=samples[-1] / 1e6,
+        mean_ms=sum(ordered) / count / 1e6,
+        p50_ms=_percentile(ordered, 50) / 1e6,
+        p95_ms=_percentile(ordered, 95) / 1e6,
+        max_ms=ordered[-1] / 1e6,
+    )
+
+
+def _percentile(ordered: List[int], percent: int) -> int:
+    # Nearest-rank percentile of an already sorted, non-empty list.
+    rank = max(1, -(-percent * len(ordered) // 100))
+    return ordered[rank - 1]
@@ -0,0 +1,108 @@
+"""
+Cached join views for ComponentManager.query.
+
+A QueryView holds one row per entity that matches a join: every required
+component type is present and no excluded type is. A row is a tuple of the
+first component of each required type followed by the first component of each
+optional type (or None), in the order the types were requested.
+
+Views are built once by a scan and are then kept up to date by the component
+manager, which calls ``refresh`` for every entity whose components change.
+Refreshing only recomputes that entity's row, so the cost of maintaining a view
+is proportional to the number of changes rather than to the size of the world.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from engine.components.component import Component
+from engine.types import ComponentType
+
+Row = Tuple[Optional[Component], ...]
+
+
+class QueryView:
+    """
+    Keep the rows of a single join query up to date.
+
+    """
+
+    __slots__ = ("types", "optional", "exclude", "rows")
+
+    def __init__(
+        self,
+        types: Tuple[ComponentType, ...],
+        optional: Tuple[ComponentType, ...],
+        exclude: Tuple[ComponentType, ...],
+    ):
+        """
+        Create an empty view.
+
+        :param types: Component types every row must have
+        :type types: Tuple[ComponentType, ...]
+        :param optional: Component types to include when present
+        :type optional: Tuple[ComponentType, ...]
+        :param exclude: Component types that disqualify an entity
+        :type exclude: Tuple[ComponentType, ...]
+
+        """
+        self.types = types
+        self.optional = optional
+        self.exclude = exclude
+        self.rows: Dict[int, Row] = {}
+
+    @property
+    def watched(self) -> Tuple[ComponentType, ...]:
+        """
+        Get every component type whose changes can affect this view.
+
+        :return: The required, optional and excluded types
+        :rtype: Tuple[ComponentType, ...]
+
+        """
+        return self.types + self.optional + self.exclude
+
+    def build(self, cm) -> None:
+        """
+        Fill the view by scanning the entities that hold the first required type.
+
+        :param cm: The component manager to read from
+        :type cm: ComponentManager
+        :return: None
+
+        """
+        self.rows = {}
+        candidates = dict.fromkeys(c.entity for c in cm.get(self.types[0]))
+        for entity in candidates:
+            self.refresh(cm, entity)
+
+    def refresh(self, cm, entity: int) -> None:
+        """
+        Recompute the row of a single entity after its components changed.
+
+        :param cm: The component manager to read from
+        :type cm: ComponentManager
+        :param entity: The entity whose row may have changed
+        :type entity: int
+        :return: None
+
+        """
+        row = self._row(cm, entity)
+        if row is None:
+            self.rows.pop(entity, None)
+        else:
+            self.rows[entity] = row
+
+    def _row(self, cm, entity: int) -> Optional[Row]:
+        get_one = cm.get_one
+        for component_type in self.exclude:
+            if get_one(component_type, entity) is not None:
+                return None
+        row = []
+        for component_type in self.types:
+            component = get_one(component_type, entity)
+            if component is None:
+                return None
+            row.append(component)
+        for component_type in self.optional:
+            row.append(get_one(component_type, entity))
+        return tuple(row)
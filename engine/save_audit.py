@@ -0,0 +1,140 @@
+"""
+List what takes up the space in a save.
+
+Sizes are grouped by component class, largest first, with the largest fields
+of each, so a cache that leaked into a save (see
+engine.components.component.transient) stands out. Binary saves are
+measured column by column from the file, so the sizes are exact; tile
+positions (see engine.binary_save) are listed on their own line. JSON saves
+are measured by encoding each field of each record again. A save's journal
+is not included.
+
+Usage::
+
+    poetry run python -m engine.save_audit village.world --fields 3
+"""
+
+import argparse
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from engine import binary_save, save_journal
+
+
+@dataclass
+class TypeSize:
+    """
+    The space one component class takes up in a save.
+    """
+
+    name: str
+    count: int = 0
+    size: int = 0
+    fields: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, count: int, field_sizes: Dict[str, int]) -> None:
+        self.count += count
+        for name, size in field_sizes.items():
+            self.fields[name] = self.fields.get(name, 0) + size
+            self.size += size
+
+    def largest_fields(self, limit: int) -> List[str]:
+        return sorted(self.fields, key=self.fields.get, reverse=True)[:limit]
+
+
+def audit(file) -> List[TypeSize]:
+    """
+    Measure a save by component class.
+
+    :param file: The path of a binary or JSON save
+    :return: The size of each class, largest first
+    :rtype: List[TypeSize]
+
+    """
+    sizes: Dict[str, TypeSize] = {}
+
+    def add(name, count, field_sizes):
+        type_size = sizes.get(name)
+        if type_size is None:
+            type_size = sizes[name] = TypeSize(name)
+        type_size.add(count, field_sizes)
+
+    if binary_save.is_binary_save(file):
+        with open(file, "rb") as f:
+            binary_save.read_header(f)
+            for name, count, field_sizes in binary_save.iter_sizes(f):
+                add(name, count, field_sizes)
+    else:
+        encode = json.JSONEncoder().encode
+        with open(file, "r") as f:
+            objects = json.load(f)["objects"]
+        for section in ("active_components", "stashed_components"):
+            for record in objects.get(section, {}).values():
+                # Each field is written as '"name": value, '
+                add(
+                    record["class"],
+                    1,
+                    {
+                        name: len(encode(name)) + len(encode(value)) + 4
+                        for name, value in record.items()
+                        if name != "class"
+                    },
+                )
+    return sorted(sizes.values(), key=lambda s: s.size, reverse=True)
+
+
+def format_audit(sizes: List[TypeSize], file_size: int, fields: int) -> str:
+    """
+    Render one row per class, with its largest fields.
+    """
+    lines = [
+        f"{'class':<40}{'count':>9}{'KB':>10}{'share':>8}  largest fields",
+        "-" * 90,
+    ]
+    for type_size in sizes:
+        largest = ", ".join(
+            f"{name} {type_size.fields[name] / 1024:.1f}KB"
+            for name in type_size.largest_fields(fields)
+        )
+        lines.append(
+            f"{type_size.name:<40}{type_size.count:>9}"
+            f"{type_size.size / 1024:>10.1f}"
+            f"{type_size.size / max(file_size, 1):>8.1%}  {largest}"
+        )
+    other = file_size - sum(type_size.size for type_size in sizes)
+    lines.append(
+        f"{'(headers and framing)':<40}{'':>9}{other / 1024:>10.1f}"
+        f"{other / max(file_size, 1):>8.1%}"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("save", help="the save file to measure")
+    parser.add_argument(
+        "--fields",
+        type=int,
+        default=3,
+        help="how many of the largest fields to list per class",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = audit(args.save)
+    file_size = os.path.getsize(args.save)
+    table = format_audit(sizes, file_size, args.fields)
+    print(f"{args.save}: {file_size / 1024:.1f}KB\n")
+    print(table)
+    journal_file = save_journal.journal_path(args.save)
+    if os.path.exists(journal_file):
+        print(
+            f"\nNot included: journal of"
+            f" {os.path.getsize(journal_file) / 1024:.1f}KB"
+        )
+    return sizes, table
+
+
+if __name__ == "__main__":
+    main()
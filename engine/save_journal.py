@@ -0,0 +1,689 @@
+"""
+Incremental saves: a binary snapshot plus an append-only journal.
+
+A SaveJournal keeps one save file up to date for a ComponentManager. Its
+first save writes a full binary snapshot (see engine.binary_save); later
+saves append one entry to ``<file>.journal`` holding only what changed since
+the previous save:
+
+- the IDs of components that were deleted
+- the components that were added or modified, in full
+- the stashed components and entities, the ID allocator and the save info,
+  which are small and are written whole every time
+
+Additions, deletions and field writes come from the manager's change
+tracking: the journal's reader tracks writes (see ComponentManager.track), so
+every assignment to a saved field marks its component, and unchanged
+components are never visited. A marked component is written when one of its
+saved field values differs from the copy kept when it was last saved, so a
+field set back to its old value costs nothing; transient fields are ignored.
+Lists, dicts and sets can be edited in place without an assignment, so the
+few components holding one are compared on every save.
+
+Only finding and copying the changes happens on the caller's thread. The
+copies are encoded and written on the journal's worker thread, one save at a
+time, while the game goes on. Snapshots are written to a temporary file,
+synced and renamed into place, and only then is the journal emptied, so a
+crash mid-write leaves the previous snapshot and its journal intact. Given a
+TraceRecorder (see engine.tracing), the worker records a span for each write,
+which a trace shows on the worker's own thread.
+
+Once the journal grows past a fraction of the snapshot, the worker compacts
+it: the snapshot and journal are read back from disk, folded into a new
+snapshot that replaces the old one, and the journal is emptied.
+serialization.load replays the journal on top of the snapshot, so a save
+loads the same either way::
+
+    journal = SaveJournal(cm, "village.world")
+    journal.save({"season": "spring"})
+    ...
+    journal.close()  # waits for pending writes
+
+Each entry is framed by its length and a CRC-32 checksum, and replay stops at
+the first entry that is incomplete or damaged, so a crash while appending
+loses at most that entry. Entries carry increasing sequence numbers, which
+a new SaveJournal continues from what is on disk, and the snapshot records
+the last one folded into it, so entries left behind by an interrupted
+checkpoint or compaction are skipped instead of applied twice.
+"""
+
+import copy
+import io
+import os
+import struct
+import traceback
+import zlib
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from operator import attrgetter
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from engine.change_tracker import ChangeReader
+from engine.component_manager import ComponentManager
+from engine.components.component import Component, saved_fields
+
+from . import binary_save, core
+from .logging import get_logger
+from .tracing import TraceRecorder
+from .utilities import gc_paused
+
+JOURNAL_SUFFIX = ".journal"
+
+# Compact once the journal is this large relative to the snapshot
+DEFAULT_COMPACT_RATIO = 0.5
+
+# The sections of a journal entry
+UPSERTS = "upserts"
+STASHED = "stashed_components"
+
+_FRAME = struct.Struct("<II")
+
+# Field values copied into the snapshot of a row, since they can be edited in
+# place without the component noticing
+_MUTABLE_FIELD_TYPES = (list, dict, set)
+
+_ID = attrgetter("id")
+
+
+def journal_path(file) -> str:
+    """
+    Get the journal file that belongs to a save file.
+
+    :param file: The save file
+    :return: The journal's path
+    :rtype: str
+
+    """
+    return os.fspath(file) + JOURNAL_SUFFIX
+
+
+class SaveJournal:
+    """
+    Keep a save file current by journaling what changed between saves.
+
+    """
+
+    def __init__(
+        self,
+        cm: ComponentManager,
+        file,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        tracer: Optional[TraceRecorder] = None,
+    ):
+        """
+        Create a journal. Nothing is written until the first save.
+
+        :param cm: The component manager to save
+        :type cm: ComponentManager
+        :param file: The save file; the journal is written next to it
+        :param compact_ratio: Compact once the journal is this large
+            relative to the snapshot, or never if 0
+        :type compact_ratio: float
+        :param tracer: Records a span on the worker thread for each
+            snapshot, journal entry and compaction written; can be changed
+            at any time
+        :type tracer: Optional[TraceRecorder]
+
+        """
+        self.cm = cm
+        self.path = os.fspath(file)
+        self.journal_path = journal_path(file)
+        self.compact_ratio = compact_ratio
+        self.tracer = tracer
+        # Continue from the entries already on disk, so a snapshot written by
+        # this journal never counts as older than them
+        self.sequence = last_sequence(file)
+        self.logger = get_logger(__name__)
+        self._key = ("save_journal", self.path)
+        # Field values as last saved, by concrete type and component ID
+        self._rows: Dict[type, Dict[int, tuple]] = {}
+        # Components whose saved values include a list, dict or set, by ID
+        self._containers: Dict[int, Component] = {}
+        self._getters: Dict[type, Callable[[Component], tuple]] = {}
+        self._names: Dict[type, Tuple[str, ...]] = {}
+        self._snapshot_size = 0
+        self._journal_size = 0
+        # Set by the worker when a write fails, so the next save starts over
+        self._failed = False
+        self._worker = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="save-journal"
+        )
+        self._pending: List[Future] = []
+
+    @property
+    def busy(self) -> bool:
+        """
+        Report whether saves or a compaction are still being written.
+
+        :return: True while the worker has unfinished writes
+        :rtype: bool
+
+        """
+        return any(not future.done() for future in self._pending)
+
+    def save(self, extra=None) -> Future:
+        """
+        Save what changed since the previous save.
+
+        The changes are found and copied on the calling thread, so later edits
+        to the world do not leak into the save. They are encoded and written
+        on the journal's worker thread, one save at a time and in order. The
+        first save, the first after the manager was cleared and the first
+        after a failed write write a full snapshot instead.
+
+        :param extra: Extra data stored in the save's info block
+        :return: Resolves to the number of bytes written
+        :rtype: Future
+
+        """
+        changes = self._track().drain()
+        if changes.rebuild or self._failed:
+            return self.checkpoint(extra)
+
+        rows = self._rows
+        containers = self._containers
+        for component in changes.removed:
+            type_rows = rows.get(type(component))
+            if type_rows is not None:
+                type_rows.pop(component.id, None)
+            containers.pop(component.id, None)
+        active = self.cm.components_by_id
+        removed = [
+            component.id
+            for component in changes.removed
+            if component.id not in active
+        ]
+        # Only what was added or written since the last save, and whatever
+        # may have been edited in place; a component without a row is new.
+        marked = {
+            component.id: component
+            for component in chain(
+                changes.added, changes.modified, containers.values()
+            )
+            if active.get(component.id) is component
+        }
+        upserted = []
+        for component in marked.values():
+            component_type = type(component)
+            values = self._getter(component_type)(component)
+            type_rows = rows.setdefault(component_type, {})
+            if values == type_rows.get(component.id):
+                continue
+            row = _copy_row(values)
+            type_rows[component.id] = row
+            if row is values:
+                containers.pop(component.id, None)
+            else:
+                containers[component.id] = component
+            upserted.append((component_type, row))
+
+        self.sequence += 1
+        header = self._header(extra)
+        header["sequence"] = self.sequence
+        header["removed"] = removed
+        return self._submit(
+            self._append, header, upserted, self._stashed_rows()
+        )
+
+    def checkpoint(self, extra=None) -> Future:
+        """
+        Save a full snapshot of the manager and empty the journal.
+
+        Like save, the snapshot is copied on the calling thread and written
+        on the worker thread.
+
+        :param extra: Extra data stored in the save's info block
+        :return: Resolves to the number of bytes written
+        :rtype: Future
+
+        """
+        self._track().drain()
+        self._failed = False
+        active = self.cm.components_by_id.values()
+        self._containers = {}
+        with gc_paused():
+            self._rows = {
+                component_type: self._type_rows(component_type, components)
+                for component_type, components in self._by_type().items()
+            }
+            # The original order, as two flat lists
+            types = list(map(type, active))
+            ids = list(map(_ID, active))
+        header = self._header(extra)
+        header["journal_sequence"] = self.sequence
+        return self._submit(
+            self._write_checkpoint,
+            header,
+            types,
+            ids,
+            # Later saves replace rows in place
+            {t: dict(type_rows) for t, type_rows in self._rows.items()},
+            self._stashed_rows(),
+        )
+
+    def compact(self) -> Future:
+        """
+        Fold the journal into the snapshot on the worker thread.
+
+        :return: Resolves when the compaction is done
+        :rtype: Future
+
+        """
+        return self._submit(self._compact)
+
+    def wait(self) -> None:
+        """
+        Wait until every save and compaction so far has been written.
+
+        :return: None
+
+        """
+        for future in self._pending:
+            # Failures are logged by the worker
+            future.exception()
+        self._pending = []
+
+    def close(self) -> None:
+        """
+        Finish writing, stop the worker and stop tracking the manager.
+
+        :return: None
+
+        """
+        self.wait()
+        self._worker.shutdown()
+        self.cm.untrack(self._key)
+
+    def _submit(self, job: Callable[..., object], *args) -> Future:
+        self._pending = [f for f in self._pending if not f.done()]
+        future = self._worker.submit(self._run, job, *args)
+        self._pending.append(future)
+        return future
+
+    def _run(self, job: Callable[..., object], *args):
+        try:
+            return job(*args)
+        except Exception as e:
+            # The previous snapshot and the journal up to its last complete
+            # entry are intact, but the rows no longer match what was written.
+            self._failed = True
+            self.logger.error(
+                f"Failed to write save: {str(e)}",
+                extra={
+                    "action": "journal_save_error",
+                    "file_path": self.path,
+                    "error": str(e),
+                    "error_type": e.__class__.__name__,
+                    "traceback": traceback.format_exc(),
+                },
+            )
+            raise
+
+    @contextmanager
+    def _span(self, name: str) -> Iterator[None]:
+        tracer = self.tracer
+        if tracer is None:
+            yield
+            return
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            tracer.span(name, start, perf_counter_ns())
+
+    def _append(self, header: dict, upserted: list, stashed: list) -> int:
+        with self._span("save_append"):
+            buffer = io.BytesIO()
+            binary_save.write(
+                buffer,
+                header,
+                {
+                    UPSERTS: self._build_all(upserted),
+                    STASHED: self._build_all(stashed),
+                },
+            )
+            payload = buffer.getvalue()
+            entry = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+            with open(self.journal_path, "ab") as f:
+                f.write(entry)
+            self._journal_size += len(entry)
+            self.logger.info(
+                "Journaled game state",
+                extra={
+                    "action": "journal_save",
+                    "file_path": self.path,
+                    "sequence": header["sequence"],
+                    "upserted_count": len(upserted),
+                    "removed_count": len(header["removed"]),
+                    "entry_bytes": len(entry),
+                    "journal_bytes": self._journal_size,
+                },
+            )
+        if (
+            self.compact_ratio
+            and self._journal_size > self.compact_ratio * self._snapshot_size
+        ):
+            self._compact()
+        return len(entry)
+
+    def _write_checkpoint(
+        self,
+        header: dict,
+        types: list,
+        ids: list,
+        rows: dict,
+        stashed: list,
+    ) -> int:
+        with self._span("save_checkpoint"):
+            active = _Built(
+                self._build(component_type, rows[component_type][component_id])
+                for component_type, component_id in zip(types, ids)
+            )
+            written = _write_snapshot(
+                self.path,
+                header,
+                {
+                    "active_components": active,
+                    "stashed_components": self._build_all(stashed),
+                },
+            )
+            self._snapshot_size = written
+            # Only once the snapshot is in place: until then the old snapshot
+            # and journal are the save. Entries left behind by a crash here
+            # are no newer than the snapshot's journal_sequence, so replay
+            # skips them.
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_size = 0
+            self.logger.info(
+                "Wrote save snapshot",
+                extra={
+                    "action": "journal_checkpoint",
+                    "file_path": self.path,
+                    "sequence": header["journal_sequence"],
+                    "data_size_bytes": written,
+                },
+            )
+            return written
+
+    def _compact(self) -> int:
+        with self._span("save_compact"):
+            try:
+                with open(self.journal_path, "rb") as f:
+                    journal = f.read()
+                classes = Component.subclasses
+                with open(self.path, "rb") as f:
+                    header, sections = binary_save.read(f, classes)
+                replay(header, sections, journal, classes)
+                written = _write_snapshot(self.path, header, sections)
+                # Saves queue behind the compaction, so every entry is folded
+                _replace(self.journal_path, b"")
+                self._journal_size = 0
+                self._snapshot_size = written
+                self.logger.info(
+                    "Compacted save journal",
+                    extra={
+                        "action": "journal_compact",
+                        "file_path": self.path,
+                        "sequence": header.get("journal_sequence", 0),
+                        "data_size_bytes": written,
+                    },
+                )
+                return written
+            except (IOError, ValueError) as e:
+                # The snapshot and journal on disk are still consistent
+                self.logger.error(
+                    f"Failed to compact save journal: {str(e)}",
+                    extra={
+                        "action": "journal_compact_error",
+                        "file_path": self.path,
+                        "error": str(e),
+                        "error_type": e.__class__.__name__,
+                    },
+                )
+                return 0
+
+    def _track(self) -> ChangeReader:
+        return self.cm.track(Component, key=self._key, writes=True)
+
+    def _header(self, extra) -> dict:
+        # Copied, since the worker encodes it while the game goes on
+        return {
+            "info": {
+                "object_count": len(self.cm.components_by_id),
+                "extra": copy.deepcopy({} if extra is None else extra),
+            },
+            "named_ids": dict(core.get_named_ids()),
+            "id_allocator": core.get_id_state(),
+            "stashed_entities": copy.deepcopy(self.cm.stashed_entities),
+        }
+
+    def _stashed_rows(self) -> list:
+        return [
+            (
+                type(component),
+                _copy_row(self._getter(type(component))(component)),
+            )
+            for component in self.cm.stashed_components.values()
+        ]
+
+    def _by_type(self) -> Dict[type, List[Component]]:
+        by_type = defaultdict(list)
+        for component in self.cm.components_by_id.values():
+            by_type[type(component)].append(component)
+        return by_type
+
+    def _getter(self, component_type: type) -> Callable[[Component], tuple]:
+        getter = self._getters.get(component_type)
+        if getter is None:
+            names = saved_fields(component_type)
+            # Every component has at least id and entity, so this is a tuple
+            getter = attrgetter(*names)
+            self._names[component_type] = names
+            self._getters[component_type] = getter
+        return getter
+
+    def _type_rows(
+        self, component_type: type, components: List[Component]
+    ) -> Dict[int, tuple]:
+        values = list(map(self._getter(component_type), components))
+        value_types = set(map(type, chain.from_iterable(values)))
+        if any(issubclass(t, _MUTABLE_FIELD_TYPES) for t in value_types):
+            copies = list(map(_copy_row, values))
+            self._containers.update(
+                (component.id, component)
+                for component, row, copied in zip(components, values, copies)
+                if copied is not row
+            )
+            values = copies
+        return dict(zip(map(_ID, components), values))
+
+    def _build(self, component_type: type, row: tuple) -> Component:
+        # Like _copy_component in the manager: no __init__, no watch hook
+        component = component_type.__new__(component_type)
+        for name, value in zip(self._names[component_type], row):
+            object.__setattr__(component, name, value)
+        return component
+
+    def _build_all(self, rows: list) -> Dict[int, Component]:
+        components = (self._build(t, row) for t, row in rows)
+        return {component.id: component for component in components}
+
+
+class _Built:
+    """
+    Components built from saved rows only as binary_save asks for them, so a
+    snapshot never holds a second copy of the whole world.
+    """
+
+    def __init__(self, components: Iterator[Component]):
+        self._components = components
+
+    def values(self) -> Iterator[Component]:
+        return self._components
+
+
+def _copy_row(row: tuple) -> tuple:
+    for value in row:
+        if isinstance(value, _MUTABLE_FIELD_TYPES):
+            return tuple(
+                (
+                    copy.deepcopy(value)
+                    if isinstance(value, _MUTABLE_FIELD_TYPES)
+                    else value
+                )
+                for value in row
+            )
+    return row
+
+
+def replay(
+    header: dict,
+    sections: Dict[str, dict],
+    journal: bytes,
+    loadable_classes: Dict[str, type],
+) -> int:
+    """
+    Apply journal entries to a snapshot that was read with binary_save.read.
+
+    Entries already folded into the snapshot are skipped. Replay stops at
+    the first incomplete or damaged entry.
+
+    :param header: The snapshot's header; updated in place
+    :type header: dict
+    :param sections: The snapshot's components by section; updated in place
+    :type sections: Dict[str, dict]
+    :param journal: The journal's contents
+    :type journal: bytes
+    :param loadable_classes: Component classes by name
+    :type loadable_classes: Dict[str, type]
+    :return: How many bytes of the journal were read
+    :rtype: int
+
+    """
+    active = sections.setdefault("active_components", {})
+    offset = 0
+    for end, entry_header, entry_sections in _entries(
+        journal, loadable_classes
+    ):
+        offset = end
+        sequence = entry_header["sequence"]
+        if sequence <= header.get("journal_sequence", 0):
+            continue
+        for component_id in entry_header["removed"]:
+            active.pop(component_id, None)
+        active.update(entry_sections.get(UPSERTS, {}))
+        sections[STASHED] = entry_sections.get(STASHED, {})
+        for key in ("info", "named_ids", "id_allocator", "stashed_entities"):
+            header[key] = entry_header[key]
+        header["journal_sequence"] = sequence
+    return offset
+
+
+def last_sequence(file) -> int:
+    """
+    Find the last journal sequence number recorded for a save, in its
+    snapshot or in its journal.
+
+    :param file: The save file
+    :return: The sequence number, or 0 if there is none
+    :rtype: int
+
+    """
+    sequence = 0
+    try:
+        with open(file, "rb") as f:
+            sequence = binary_save.read_header(f).get("journal_sequence", 0)
+    except (IOError, ValueError):
+        # No save yet, or not a binary one
+        pass
+    try:
+        with open(journal_path(file), "rb") as f:
+            journal = f.read()
+    except IOError:
+        return sequence
+    for _, payload in _payloads(journal):
+        entry_header = binary_save.read_header(io.BytesIO(payload))
+        sequence = max(sequence, entry_header["sequence"])
+    return sequence
+
+
+def latest_info(journal: bytes, after: int = 0) -> Optional[dict]:
+    """
+    Read the save info of a journal's last entry without building its
+    components.
+
+    Sequence numbers only grow within a journal, so the last entry is the
+    newest. It is ignored if the snapshot already holds it, as after an
+    interrupted checkpoint or compaction.
+
+    :param journal: The journal's contents
+    :type journal: bytes
+    :param after: The snapshot's journal_sequence
+    :type after: int
+    :return: The info, or None if the journal holds no complete entry newer
+        than the snapshot
+    :rtype: Optional[dict]
+
+    """
+    last = None
+    for _, payload in _payloads(journal):
+        last = payload
+    if last is None:
+        return None
+    entry_header = binary_save.read_header(io.BytesIO(last))
+    if entry_header["sequence"] <= after:
+        return None
+    return entry_header["info"]
+
+
+def _entries(
+    journal: bytes, loadable_classes: Dict[str, type]
+) -> Iterator[Tuple[int, dict, Dict[str, dict]]]:
+    for end, payload in _payloads(journal):
+        entry_header, entry_sections = binary_save.read(
+            io.BytesIO(payload), loadable_classes
+        )
+        yield end, entry_header, entry_sections
+
+
+def _payloads(journal: bytes) -> Iterator[Tuple[int, bytes]]:
+    offset = 0
+    while offset + _FRAME.size <= len(journal):
+        size, checksum = _FRAME.unpack_from(journal, offset)
+        start = offset + _FRAME.size
+        payload = journal[start : start + size]
+        if len(payload) != size or zlib.crc32(payload) != checksum:
+            get_logger(__name__).warning(
+                "Ignoring damaged save journal entry",
+                extra={"action": "journal_damaged", "offset": offset},
+            )
+            return
+        offset = start + size
+        yield offset, payload
+
+
+def _write_snapshot(path: str, header: dict, sections: dict) -> int:
+    """
+    Write a binary save next to its destination and move it into place, so
+    the previous snapshot survives a failed write.
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        written = binary_save.write(f, header, sections)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    return written
+
+
+def _replace(path: str, data: bytes) -> None:
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
@@ -1,12 +1,26 @@
 import dataclasses
 import json
+import os
 import traceback
+from enum import Enum
+from operator import itemgetter
 from pathlib import Path
 
-from engine.components.component import Component
+from engine.components.component import Component, saved_fields
 
-from . import core
+from . import binary_save, core, save_journal
 from .logging import get_logger
+from .utilities import gc_paused
+
+FORMATS = ("binary", "json")
+DEFAULT_FORMAT = "binary"
+
+# How a JSON save written by _save_json begins
+_JSON_INFO_PREFIX = '{"info": '
+_JSON_INFO_CHUNK = 4096
+
+# The key marking an enum member in a JSON save, holding its type's path
+_JSON_ENUM = "__enum__"
 
 
 class EnhancedJSONEncoder(json.JSONEncoder):
@@ -15,17 +29,51 @@ class EnhancedJSONEncoder(json.JSONEncoder):
     """
 
     def default(self, o):
+        if isinstance(o, Component):
+            # Transient fields are left out
+            data = {name: getattr(o, name) for name in saved_fields(type(o))}
+            data["class"] = o.__class__.__name__
+            return data
         if dataclasses.is_dataclass(o):
             data = dataclasses.asdict(o)
             data["class"] = o.__class__.__name__
             return data
+        if isinstance(o, Enum):
+            # Tagged with its type, like in binary saves, so a load gets the
+            # member back rather than its value (see _decode_json_object).
+            # Enums that are also str or int never get here: they are written
+            # as plain strings and numbers, which compare equal to them.
+            return {
+                _JSON_ENUM: binary_save.enum_path(type(o)),
+                "value": o.value,
+            }
+        if isinstance(o, (set, frozenset)):
+            return list(o)
         return super().default(o)
 
 
-def save(components, file, extra=None):
+def save(components, file, extra=None, save_format=DEFAULT_FORMAT):
+    """
+    Write the game state to a file.
+
+    Binary saves (see engine.binary_save) are smaller and faster to write and
+    read; JSON saves are readable by hand. load() reads either. The file is
+    replaced atomically, so a failed save leaves the previous one intact.
+
+    :param components: The component manager's serial form
+    :param file: The path to write
+    :param extra: Extra data stored in the save's info block
+    :param save_format: One of FORMATS
+    :raises ValueError: If the format is unknown
+
+    """
     logger = get_logger(__name__)
     if extra is None:
         extra = {}
+    if save_format not in FORMATS:
+        raise ValueError(
+            f"Unknown save format {save_format!r}; expected one of {FORMATS}"
+        )
 
     object_count = len(components["active_components"])
     file_path = Path(file).resolve()
@@ -38,6 +86,7 @@ def save(components, file, extra=None):
             "object_count": object_count,
             "stashed_count": len(components.get("stashed_components", {})),
             "extra_data": bool(extra),
+            "save_format": save_format,
         },
     )
 
@@ -47,23 +96,41 @@ def save(components, file, extra=None):
             "extra": extra,
         },
         "named_ids": core.get_named_ids(),
+        "id_allocator": core.get_id_state(),
         "objects": components,
     }
 
     try:
-        save_data = json.dumps(save_info, cls=EnhancedJSONEncoder)
-        with open(file, "w+") as f:
-            f.write(save_data)
+        journal_file = save_journal.journal_path(file)
+        if save_format == "binary" and os.path.exists(journal_file):
+            # Any journal entries left behind if the journal cannot be
+            # removed below are older than this save, and are skipped
+            save_info["journal_sequence"] = save_journal.last_sequence(file)
+        # Written next to the destination and renamed into place, so a
+        # failed write never damages the previous save or its journal
+        temporary = f"{os.fspath(file)}.tmp"
+        try:
+            if save_format == "binary":
+                data_size = _save_binary(save_info, temporary)
+            else:
+                data_size = _save_json(save_info, temporary)
+            os.replace(temporary, file)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        # A full save supersedes any journal kept for the file
+        if os.path.exists(journal_file):
+            os.remove(journal_file)
 
         logger.debug(
             "Game state successfully saved",
             extra={
                 "action": "save_complete",
                 "file_path": str(file_path),
-                "data_size_bytes": len(save_data),
+                "data_size_bytes": data_size,
             },
         )
-    except (IOError, json.JSONEncodeError) as e:
+    except (IOError, TypeError, ValueError) as e:
         logger.error(
             f"Failed to save game state: {str(e)}",
             extra={
@@ -98,17 +165,27 @@ def load(file):
     )
 
     try:
-        with open(file, "r") as f:
-            data = json.load(f)
+        binary = binary_save.is_binary_save(file)
+        if binary:
+            data = _load_binary(file, loadable_classes)
+            build_components = _already_built
+        else:
+            with open(file, "r") as f, gc_paused():
+                data = json.load(f, object_hook=_decode_json_object)
+            build_components = _load_from_data
 
         logger.debug(
             "Successfully parsed save file",
-            extra={"action": "parse_save", "file_path": str(file_path)},
+            extra={
+                "action": "parse_save",
+                "file_path": str(file_path),
+                "save_format": "binary" if binary else "json",
+            },
         )
 
         core.set_named_ids(data["named_ids"])
 
-        active_components = _load_from_data(
+        active_components = build_components(
             data["objects"]["active_components"], loadable_classes
         )
         expected_count = data["info"]["object_count"]
@@ -127,10 +204,22 @@ def load(file):
                 },
             )
 
-        stashed_components = _load_from_data(
+        stashed_components = build_components(
             data["objects"]["stashed_components"], loadable_classes
         )
 
+        if "id_allocator" in data:
+            core.set_id_state(data["id_allocator"])
+        else:
+            # Older saves did not record the allocator; make sure no loaded
+            # ID is handed out again.
+            core.reserve_ids(
+                id_value
+                for components in (active_components, stashed_components)
+                for component in components.values()
+                for id_value in (component.id, component.entity)
+            )
+
         logger.info(
             "Game state successfully loaded",
             extra={
@@ -151,7 +240,7 @@ def load(file):
         }
         return loaded_data
 
-    except (IOError, json.JSONDecodeError) as e:
+    except (IOError, ValueError) as e:
         logger.error(
             f"Failed to load game state: {str(e)}",
             extra={
@@ -165,9 +254,169 @@ def load(file):
         raise
 
 
+def read_info(file):
+    """
+    Read a save's info block without loading its components.
+
+    This is what a load menu lists. A binary save's info block is read on its
+    own (see engine.binary_save.read_info), and replaced by the last entry of
+    its journal, if any is newer. A JSON save's info is written first, so it is
+    decoded from the start of the file; a JSON save that puts it elsewhere is
+    parsed whole.
+
+    :param file: The path of a binary or JSON save
+    :return: The info ("object_count" and "extra"), or None if the file is
+        not a readable save
+    :rtype: Optional[dict]
+
+    """
+    try:
+        if not binary_save.is_binary_save(file):
+            return _read_json_info(file)
+        journal_file = save_journal.journal_path(file)
+        if not os.path.exists(journal_file):
+            with open(file, "rb") as f:
+                return binary_save.read_info(f)
+        with open(file, "rb") as f:
+            header = binary_save.read_header(f)
+        with open(journal_file, "rb") as f:
+            info = save_journal.latest_info(
+                f.read(), header.get("journal_sequence", 0)
+            )
+        return header["info"] if info is None else info
+    except (IOError, ValueError) as e:
+        get_logger(__name__).warning(
+            f"Could not read save info: {str(e)}",
+            extra={
+                "action": "read_info_error",
+                "file_path": str(Path(file).resolve()),
+                "error": str(e),
+                "error_type": e.__class__.__name__,
+            },
+        )
+        return None
+
+
+def _read_json_info(file):
+    decoder = json.JSONDecoder(object_hook=_decode_json_object)
+    with open(file, "r") as f:
+        if f.read(len(_JSON_INFO_PREFIX)) == _JSON_INFO_PREFIX:
+            text = ""
+            while True:
+                chunk = f.read(_JSON_INFO_CHUNK)
+                text += chunk
+                try:
+                    info, _ = decoder.raw_decode(text)
+                    return info
+                except json.JSONDecodeError:
+                    # The info is not complete yet
+                    if not chunk:
+                        raise
+        f.seek(0)
+        return json.load(f, object_hook=_decode_json_object).get("info")
+
+
+def _decode_json_object(obj: dict):
+    """
+    Turn the tagged enum members in a JSON save back into members. Their
+    types are looked up with binary_save.resolve_enum, never imported.
+    """
+    if _JSON_ENUM in obj:
+        return binary_save.resolve_enum(obj[_JSON_ENUM])(obj["value"])
+    return obj
+
+
+def _save_json(save_info, file) -> int:
+    """
+    Write a JSON save one component at a time, rather than building the
+    whole document in memory first.
+
+    The output is what json.dumps(save_info) would produce.
+    """
+    encode = EnhancedJSONEncoder().encode
+    written = 0
+    with open(file, "w") as f:
+
+        def put(text):
+            nonlocal written
+            f.write(text)
+            written += len(text)
+
+        put("{")
+        for key in ("info", "named_ids", "id_allocator"):
+            put(f"{encode(key)}: {encode(save_info[key])}, ")
+        put('"objects": {')
+        for index, (key, value) in enumerate(save_info["objects"].items()):
+            put(f"{', ' if index else ''}{encode(key)}: {{")
+            separator = ""
+            for component_id, item in value.items():
+                put(f"{separator}{encode(str(component_id))}: {encode(item)}")
+                separator = ", "
+            put("}")
+        put("}}")
+        f.flush()
+        os.fsync(f.fileno())
+    return written
+
+
+def _save_binary(save_info, file) -> int:
+    objects = save_info["objects"]
+    header = {
+        "info": save_info["info"],
+        "named_ids": save_info["named_ids"],
+        "id_allocator": save_info["id_allocator"],
+        "stashed_entities": objects["stashed_entities"],
+    }
+    if "journal_sequence" in save_info:
+        header["journal_sequence"] = save_info["journal_sequence"]
+    with open(file, "wb") as f:
+        written = binary_save.write(
+            f,
+            header,
+            {
+                "active_components": objects["active_components"],
+                "stashed_components": objects["stashed_components"],
+            },
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    return written
+
+
+def _load_binary(file, loadable_classes):
+    """
+    Read a binary save into the same shape as a parsed JSON save, with the
+    components already built and its journal (see engine.save_journal), if
+    any, replayed.
+    """
+    with open(file, "rb") as f, gc_paused():
+        header, sections = binary_save.read(f, loadable_classes)
+    journal_file = save_journal.journal_path(file)
+    if os.path.exists(journal_file):
+        with open(journal_file, "rb") as f, gc_paused():
+            save_journal.replay(header, sections, f.read(), loadable_classes)
+    return {
+        "info": header["info"],
+        "named_ids": header["named_ids"],
+        "id_allocator": header["id_allocator"],
+        "objects": {
+            "active_components": sections.get("active_components", {}),
+            "stashed_components": sections.get("stashed_components", {}),
+            "stashed_entities": header["stashed_entities"],
+        },
+    }
+
+
+def _already_built(components, _loadable_classes):
+    return components
+
+
 def _load_from_data(data, loadable_classes):
     """
-    Load a set of data from loadable classes.
+    Build components from the records of a JSON save.
+
+    Each class gets a constructor the first time one of its records is seen
+    (see _record_constructor). The records are left as they were parsed.
     """
     logger = get_logger(__name__)
     active_components = {}
@@ -177,29 +426,28 @@ def _load_from_data(data, loadable_classes):
         extra={"action": "load_component_data", "component_count": len(data)},
     )
 
-    missing_classes = []
-    loaded_count = 0
-
-    for key, obj in data.items():
-        obj_class = obj["class"]
-        if obj_class not in loadable_classes:
-            missing_classes.append(obj_class)
-            logger.error(
-                f"Component class not found: {obj_class}",
-                extra={
-                    "action": "class_not_found",
-                    "missing_class": obj_class,
-                    "component_id": key,
-                    "available_classes": list(loadable_classes.keys()),
-                },
-            )
-            raise ValueError(f"class not found: {obj_class}")
-        else:
+    constructors = {}
+    with gc_paused():
+        for key, obj in data.items():
+            obj_class = obj["class"]
+            build = constructors.get(obj_class)
+            if build is None:
+                if obj_class not in loadable_classes:
+                    logger.error(
+                        f"Component class not found: {obj_class}",
+                        extra={
+                            "action": "class_not_found",
+                            "missing_class": obj_class,
+                            "component_id": key,
+                            "available_classes": list(loadable_classes),
+                        },
+                    )
+                    raise ValueError(f"class not found: {obj_class}")
+                build = constructors[obj_class] = _record_constructor(
+                    loadable_classes[obj_class]
+                )
             try:
-                del obj["class"]
-                clz = loadable_classes[obj_class]
-                active_components[key] = clz(**obj)
-                loaded_count += 1
+                active_components[key] = build(obj)
             except Exception as e:
                 logger.error(
                     f"Failed to instantiate component {obj_class}: {str(e)}",
@@ -215,16 +463,53 @@ def _load_from_data(data, loadable_classes):
                 raise
 
     logger.debug(
-        f"Successfully loaded {loaded_count} components",
+        f"Successfully loaded {len(active_components)} components",
         extra={
             "action": "load_components_complete",
-            "component_count": loaded_count,
+            "component_count": len(active_components),
         },
     )
 
     return active_components
 
 
+def _record_constructor(cls):
+    """
+    Build the function that turns one JSON record into a component.
+
+    A record holding exactly the class's init fields plus its class name,
+    which is every record this version saves, is passed positionally, so no
+    keyword dictionary is built per record. Other records fall back to
+    keyword arguments.
+    """
+    init_fields = [f for f in dataclasses.fields(cls) if f.init]
+    names = [f.name for f in init_fields]
+    # Every component has at least id and entity, so this returns a tuple
+    get_values = itemgetter(*names)
+    size = len(names) + 1
+    positional = not any(f.kw_only for f in init_fields)
+
+    def build(record):
+        if len(record) == size:
+            try:
+                values = get_values(record)
+            except KeyError:
+                pass
+            else:
+                if positional:
+                    return cls(*values)
+                return cls(**dict(zip(names, values)))
+        return cls(
+            **{
+                name: value
+                for name, value in record.items()
+                if name != "class"
+            }
+        )
+
+    return build
+
+
 def _gather_loadable_classes():
     """
     Read the base_components directory to discover loadable base_components.
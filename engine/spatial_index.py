@@ -0,0 +1,138 @@
+"""
+Spatial hash of Coordinates components for ComponentManager.
+
+The index maps each (x, y) tile to the Coordinates components standing on it,
+in the order they arrived. ComponentManager keeps it current as Coordinates are
+added, deleted, stashed and moved, so tile lookups no longer scan every
+Coordinates component in the world.
+"""
+
+from typing import Dict, Iterable, Iterator, Tuple
+
+from engine.components.coordinates import Coordinates
+
+Position = Tuple[int, int]
+
+
+class SpatialIndex:
+    """
+    Map tile positions to the Coordinates components on them.
+
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self):
+        """
+        Create an empty index.
+
+        """
+        self.cells: Dict[Position, Dict[int, Coordinates]] = {}
+
+    def insert(self, coords: Coordinates) -> None:
+        """
+        Add a Coordinates component at its current position.
+
+        :param coords: The component to add
+        :type coords: Coordinates
+        :return: None
+
+        """
+        position = (coords.x, coords.y)
+        cell = self.cells.get(position)
+        if cell is None:
+            cell = self.cells[position] = {}
+        cell[id(coords)] = coords
+
+    def remove(self, coords: Coordinates, position: Position = None) -> bool:
+        """
+        Remove a Coordinates component.
+
+        :param coords: The component to remove
+        :type coords: Coordinates
+        :param position: The tile it is indexed under; defaults to its current
+                         position
+        :type position: Tuple[int, int]
+        :return: True if the component was indexed at that position
+        :rtype: bool
+
+        """
+        if position is None:
+            position = (coords.x, coords.y)
+        cell = self.cells.get(position)
+        if cell is None or cell.pop(id(coords), None) is None:
+            return False
+        if not cell:
+            del self.cells[position]
+        return True
+
+    def move(self, coords: Coordinates, old_position: Position) -> None:
+        """
+        Re-index a component whose position changed.
+
+        Components that are not indexed at ``old_position`` are ignored, so a
+        component that has been removed from the manager can move freely.
+
+        :param coords: The component that moved
+        :type coords: Coordinates
+        :param old_position: The tile it was indexed under
+        :type old_position: Tuple[int, int]
+        :return: None
+
+        """
+        if self.remove(coords, old_position):
+            self.insert(coords)
+
+    def at(self, x: int, y: int) -> Iterable[Coordinates]:
+        """
+        Get the components on a tile.
+
+        :param x: The tile's x coordinate
+        :type x: int
+        :param y: The tile's y coordinate
+        :type y: int
+        :return: The components on the tile, in arrival order
+        :rtype: Iterable[Coordinates]
+
+        """
+        cell = self.cells.get((x, y))
+        return cell.values() if cell else ()
+
+    def in_rect(
+        self, x: int, y: int, width: int, height: int
+    ) -> Iterator[Coordinates]:
+        """
+        Iterate over the components inside a rectangle.
+
+        Walks the rectangle's tiles when it is smaller than the number of
+        occupied tiles, and the occupied tiles otherwise.
+
+        :param x: The left edge
+        :type x: int
+        :param y: The top edge
+        :type y: int
+        :param width: The number of columns covered
+        :type width: int
+        :param height: The number of rows covered
+        :type height: int
+        :return: An iterator over the components in the rectangle
+        :rtype: Iterator[Coordinates]
+
+        """
+        if width <= 0 or height <= 0:
+            return
+        cells = self.cells
+        if width * height <= len(cells):
+            for tile_x in range(x, x + width):
+                for tile_y in range(y, y + height):
+                    cell = cells.get((tile_x, tile_y))
+                    if cell:
+                        yield from cell.values()
+            return
+        right = x + width
+        bottom = y + height
+        for (tile_x, tile_y), cell in list(cells.items()):
+            if tile_x is None or tile_y is None:
+                continue
+            if x <= tile_x < right and y <= tile_y < bottom:
+                yield from cell.values()
@@ -0,0 +1,278 @@
+import io
+import sys
+import unittest
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from engine import binary_save, core
+from engine.components import Coordinates
+from engine.components.component import Component
+from engine.components.entity import Entity
+
+
+class Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass(slots=True)
+class SaveSample(Component):
+    count: int = 0
+    ratio: float = 0.0
+    visible: bool = True
+    label: str = ""
+    color: Color = Color.RED
+    rgb: Tuple[int, int, int] = (0, 0, 0)
+    path: List[int] = field(default_factory=list)
+    target: Optional[int] = None
+
+
+@dataclass(slots=True)
+class SaveMarker(Component):
+    pass
+
+
+@dataclass(slots=True)
+class SaveRenamed(Component):
+    kept: int = 0
+    added: str = "default"
+
+
+CLASSES = {
+    cls.__name__: cls for cls in (SaveSample, SaveMarker, Entity, Coordinates)
+}
+
+
+def _count(i):
+    return {"count": i} if i % 3 else {}
+
+
+def _tile(x, y, static=True, label="grass"):
+    entity = core.get_id()
+    return [
+        Entity(id=entity, entity=entity, name="grass", static=static),
+        Coordinates(entity=entity, x=x, y=y),
+        SaveSample(entity=entity, label=label, path=[1]),
+    ]
+
+
+def _size(components):
+    buffer = io.BytesIO()
+    binary_save.write(buffer, {}, {"active": {c.id: c for c in components}})
+    return len(buffer.getvalue())
+
+
+def _round_trip(sections, header=None, classes=CLASSES):
+    buffer = io.BytesIO()
+    binary_save.write(buffer, header or {}, sections)
+    buffer.seek(0)
+    return binary_save.read(buffer, classes)
+
+
+class TestBinarySave(unittest.TestCase):
+    def test_round_trip_keeps_values_types_and_order(self):
+        components = [
+            SaveSample(
+                entity=1,
+                count=-5,
+                ratio=0.25,
+                visible=False,
+                label="ümlaut",
+                color=Color.BLUE,
+                rgb=(1, 2, 3),
+                path=[4, 5],
+                target=7,
+            ),
+            SaveMarker(entity=1),
+            SaveSample(entity=2, count=2**70, label="nul\x00byte"),
+            SaveSample(entity=3),
+        ]
+        stashed = SaveMarker(entity=4)
+        header = {"named_ids": {"world": 3}, "stashed": {4: {stashed.id}}}
+
+        loaded_header, sections = _round_trip(
+            {
+                "active_components": {c.id: c for c in components},
+                "stashed_components": {stashed.id: stashed},
+            },
+            header,
+        )
+
+        self.assertEqual(header, loaded_header)
+        active = sections["active_components"]
+        self.assertEqual([c.id for c in components], list(active))
+        self.assertEqual(components, list(active.values()))
+        self.assertIs(Color.BLUE, active[components[0].id].color)
+        self.assertEqual((1, 2, 3), active[components[0].id].rgb)
+        self.assertEqual(
+            [stashed], list(sections["stashed_components"].values())
+        )
+
+    def test_components_stream_in_blocks(self):
+        components = [
+            (SaveSample if i % 3 else SaveMarker)(entity=i, **_count(i))
+            for i in range(10)
+        ]
+        buffer = io.BytesIO()
+        binary_save.write(
+            buffer, {"turn": 4}, {"active": {c.id: c for c in components}}, 4
+        )
+        buffer.seek(0)
+
+        self.assertEqual({"turn": 4}, binary_save.read_header(buffer))
+        streamed = binary_save.iter_components(buffer, CLASSES)
+        self.assertEqual(("active", components[0]), next(streamed))
+        self.assertEqual(components[1:], [c for _, c in streamed])
+
+    def test_static_entities_round_trip_as_tiles(self):
+        components = [
+            *_tile(0, 0),
+            *_tile(1, 0),
+            SaveMarker(entity=core.get_id()),
+            *_tile(2, 0, label="flowers"),
+            *_tile(3, 0),
+            *_tile(4, 0, static=False),
+        ]
+
+        _, sections = _round_trip({"active": {c.id: c for c in components}})
+
+        active = sections["active"]
+        self.assertEqual([c.id for c in components], list(active))
+        self.assertEqual(components, list(active.values()))
+        self.assertEqual(
+            [type(c) for c in components], list(map(type, active.values()))
+        )
+        first, second, *_ = (
+            c for c in active.values() if isinstance(c, SaveSample)
+        )
+        first.path.append(2)
+        self.assertEqual([1], second.path)
+
+    def test_tiles_share_their_prefab(self):
+        tiles = [c for x in range(50) for c in _tile(x, x % 7)]
+        entities = [c for x in range(50) for c in _tile(x, 0, static=False)]
+
+        self.assertLess(_size(tiles) * 5, _size(entities))
+
+    def test_truncated_saves_are_rejected(self):
+        marker = SaveMarker(entity=1)
+        buffer = io.BytesIO()
+        binary_save.write(buffer, {}, {"active": {marker.id: marker}})
+
+        with self.assertRaises(binary_save.SaveFormatError):
+            binary_save.read(io.BytesIO(buffer.getvalue()[:-3]), CLASSES)
+
+    def test_equal_mutable_values_are_not_shared(self):
+        components = [SaveSample(entity=i, path=[1]) for i in range(3)]
+
+        _, sections = _round_trip({"active": {c.id: c for c in components}})
+
+        first, second, _ = sections["active"].values()
+        first.path.append(2)
+        self.assertEqual([1], second.path)
+
+    def test_fields_are_matched_by_name(self):
+        saved = SaveSample(entity=1, count=9, label="x")
+
+        _, sections = _round_trip(
+            {"active": {saved.id: saved}}, classes={"SaveSample": SaveRenamed}
+        )
+
+        (loaded,) = sections["active"].values()
+        self.assertIsInstance(loaded, SaveRenamed)
+        self.assertEqual(
+            (saved.id, 1, "default"), (loaded.id, loaded.entity, loaded.added)
+        )
+
+    def test_unknown_class_is_rejected(self):
+        marker = SaveMarker(entity=1)
+
+        with self.assertRaisesRegex(ValueError, "class not found: SaveMarker"):
+            _round_trip({"active": {marker.id: marker}}, classes={})
+
+    def test_newer_versions_are_rejected(self):
+        buffer = io.BytesIO()
+        binary_save.write(buffer, {}, {})
+        data = bytearray(buffer.getvalue())
+        data[len(binary_save.MAGIC)] = binary_save.VERSION + 1
+
+        with self.assertRaises(binary_save.SaveFormatError):
+            binary_save.read(io.BytesIO(bytes(data)), CLASSES)
+
+    def test_info_is_read_without_the_rest_of_the_save(self):
+        marker = SaveMarker(entity=1)
+        buffer = io.BytesIO()
+        binary_save.write(
+            buffer,
+            {"info": {"extra": {"year": 1218}}, "named_ids": {"world": 3}},
+            {"active": {marker.id: marker}},
+        )
+
+        buffer.seek(0)
+        self.assertEqual(
+            {"extra": {"year": 1218}}, binary_save.read_info(buffer)
+        )
+        # A truncated save still has a readable info block
+        self.assertEqual(
+            {"extra": {"year": 1218}},
+            binary_save.read_info(io.BytesIO(buffer.getvalue()[:-3])),
+        )
+        buffer.seek(0)
+        header, _ = binary_save.read(buffer, CLASSES)
+        self.assertEqual(
+            {"info": {"extra": {"year": 1218}}, "named_ids": {"world": 3}},
+            header,
+        )
+
+    def test_info_is_read_from_saves_without_an_info_block(self):
+        header = {"info": {"object_count": 0}, "named_ids": {}}
+        encoded = bytearray()
+        binary_save._write_value(encoded, header)
+        data = (
+            binary_save.MAGIC
+            + binary_save._U16.pack(2)
+            + binary_save._U32.pack(len(encoded))
+            + encoded
+            + binary_save._U8.pack(binary_save._END)
+        )
+
+        self.assertEqual(
+            {"object_count": 0}, binary_save.read_info(io.BytesIO(data))
+        )
+        self.assertEqual(
+            (header, {}), binary_save.read(io.BytesIO(data), CLASSES)
+        )
+
+    def test_only_known_enum_types_are_loaded(self):
+        class Undeclared(Enum):
+            ONE = 1
+
+        buffer = io.BytesIO()
+        binary_save.write(buffer, {"value": Undeclared.ONE}, {})
+
+        with self.assertRaises(binary_save.SaveFormatError):
+            binary_save.read(io.BytesIO(buffer.getvalue()), CLASSES)
+
+        binary_save.register_enum(Undeclared)
+        header, _ = binary_save.read(io.BytesIO(buffer.getvalue()), CLASSES)
+        self.assertIs(Undeclared.ONE, header["value"])
+
+    def test_saves_cannot_import_modules(self):
+        value = bytearray(binary_save._U8.pack(binary_save._V_ENUM))
+        binary_save._write_str(value, "antigravity:Flight")
+        binary_save._write_value(value, 1)
+
+        with self.assertRaises(binary_save.SaveFormatError):
+            binary_save._read_value(memoryview(bytes(value)), 0)
+        self.assertNotIn("antigravity", sys.modules)
+
+    def test_unsupported_values_raise_type_error(self):
+        sample = SaveSample(entity=1, target=object())
+
+        with self.assertRaises(TypeError):
+            binary_save.write(io.BytesIO(), {}, {"active": {1: sample}})
+
+
+if __name__ == "__main__":
+    unittest.main()
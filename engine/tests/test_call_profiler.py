@@ -0,0 +1,108 @@
+import os
+import pstats
+import tempfile
+import unittest
+
+from engine.call_profiler import CallProfiler, collapsed_stacks
+from engine.profiler import FrameProfiler
+
+
+def _leaf(n):
+    return sum(range(n))
+
+
+def _system():
+    for _ in range(20):
+        _leaf(5000)
+
+
+def _other_system():
+    _leaf(5000)
+
+
+class TestCallProfiler(unittest.TestCase):
+    def _capture(self, sections, frames=3):
+        profiler = FrameProfiler()
+        capture = CallProfiler(sections)
+        capture.start()
+        profiler.set_call_profiler(capture)
+        for _ in range(frames):
+            profiler.call("system", _system)
+            profiler.call("other", _other_system)
+            profiler.end_frame()
+        profiler.set_call_profiler(None)
+        return capture
+
+    def test_only_scoped_sections_are_profiled(self):
+        capture = self._capture(["system"])
+        stats = pstats.Stats(capture._profile)
+        functions = {name for _, _, name in stats.stats}
+
+        self.assertIn("_system", functions)
+        self.assertNotIn("_other_system", functions)
+
+    def test_stop_writes_pstats_and_collapsed_stacks(self):
+        capture = self._capture(["system"])
+        with tempfile.TemporaryDirectory() as directory:
+            pstats_path, collapsed_path = capture.stop(
+                os.path.join(directory, "nested", "capture")
+            )
+            stats = pstats.Stats(str(pstats_path))
+            with open(collapsed_path) as file:
+                lines = file.read().splitlines()
+
+        self.assertFalse(capture.running)
+        self.assertEqual(3, stats.stats[_key(stats, "_system")][1])
+        self.assertTrue(
+            any(
+                line.startswith("_system (") and "_leaf (" in line
+                for line in lines
+            )
+        )
+        for line in lines:
+            stack, microseconds = line.rsplit(" ", 1)
+            self.assertGreater(int(microseconds), 0)
+
+    def test_nested_sections_are_profiled_once(self):
+        profiler = FrameProfiler()
+        capture = CallProfiler(["outer", "inner"])
+        capture.start()
+        profiler.set_call_profiler(capture)
+        profiler.call("outer", profiler.call, "inner", _system)
+        profiler.set_call_profiler(None)
+        with tempfile.TemporaryDirectory() as directory:
+            capture.stop(os.path.join(directory, "capture"))
+
+        self.assertEqual(0, capture._depth)
+
+    def test_start_twice_raises(self):
+        capture = CallProfiler()
+        capture.start()
+        try:
+            with self.assertRaises(RuntimeError):
+                capture.start()
+        finally:
+            capture._profile.disable()
+
+    def test_collapsed_stacks_split_shared_callees_by_caller(self):
+        capture = CallProfiler(None)
+        capture.start()
+        _system()
+        _other_system()
+        capture._profile.disable()
+
+        stacks = collapsed_stacks(pstats.Stats(capture._profile))
+        by_caller = {
+            stack.split(";")[0].split(" ")[0]: microseconds
+            for stack, microseconds in stacks.items()
+            if stack.count(";") == 2 and "_leaf" in stack
+        }
+        self.assertGreater(by_caller["_system"], by_caller["_other_system"])
+
+
+def _key(stats, name):
+    return next(key for key in stats.stats if key[2] == name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,24 +1,30 @@
 import unittest
+from typing import ClassVar, FrozenSet, List
 
 import pytest
 
 pytest.importorskip("tcod")
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from engine import constants, core
+from engine.archetype_component_manager import ArchetypeComponentManager
 from engine.component_manager import ComponentManager
-from engine.components.component import Component
+from engine.components.component import Component, transient
+from engine.components.coordinates import Coordinates
 
 
 class TestComponentManager(unittest.TestCase):
+    manager_class = ComponentManager
+
     def test_instantiation(self):
-        ComponentManager()
+        self.manager_class()
 
     def test_add_retrieve_component(self):
         @dataclass
         class FakeComponent(Component):
             pass
 
-        cm = ComponentManager()
+        cm = self.manager_class()
         fc = FakeComponent(id=1, entity=2)
 
         cm.add(fc)
@@ -32,7 +38,7 @@ class TestComponentManager(unittest.TestCase):
         class FakeComponent(Component):
             pass
 
-        cm = ComponentManager()
+        cm = self.manager_class()
         fc = FakeComponent(id=1, entity=2)
         cm.add(fc)
         cs = cm.get(Component)
@@ -40,12 +46,43 @@ class TestComponentManager(unittest.TestCase):
         self.assertIn(fc, cs)
         self.assertEqual(1, len(cs))
 
+    def test_base_type_queries_cover_every_stored_subclass(self):
+        @dataclass
+        class Base(Component):
+            pass
+
+        @dataclass
+        class Left(Base):
+            pass
+
+        @dataclass
+        class Right(Base):
+            pass
+
+        cm = self.manager_class()
+        left = Left(entity=1)
+        cm.add(left)
+        self.assertEqual([left], cm.get(Base))
+        self.assertIs(left, cm.get_one(Base, entity=1))
+
+        right = Right(entity=1)
+        cm.add(right)
+        self.assertCountEqual([left, right], cm.get(Base))
+        self.assertCountEqual([left, right], cm.get_all(Base, entity=1))
+        self.assertCountEqual([left, right], cm.get_entity(1)[Component])
+        self.assertEqual([right], cm.get(Right))
+
+        cm.delete_component(left)
+        self.assertEqual([right], cm.get(Base))
+        self.assertIs(right, cm.get_one(Base, entity=1))
+        self.assertEqual([], cm.get(Left))
+
     def test_get_one_by_supertype(self):
         @dataclass
         class FakeComponent(Component):
             pass
 
-        cm = ComponentManager()
+        cm = self.manager_class()
         fc = FakeComponent(id=1, entity=2)
         cm.add(fc)
         cs = cm.get_one(Component, entity=2)
@@ -57,7 +94,7 @@ class TestComponentManager(unittest.TestCase):
         class FakeComponent(Component):
             pass
 
-        cm = ComponentManager()
+        cm = self.manager_class()
         fc = FakeComponent(id=1, entity=2)
         cm.add(fc)
 
@@ -75,7 +112,7 @@ class TestComponentManager(unittest.TestCase):
         class B(Component):
             pass
 
-        cm = ComponentManager()
+        cm = self.manager_class()
         cm.add(A(entity=2))
         cm.add(B(entity=2))
         cm.delete(2)
@@ -94,6 +131,617 @@ class TestComponentManager(unittest.TestCase):
             " orphaned",
         )
 
+    def test_get_all_multiple_of_same_type(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        cm = self.manager_class()
+        first = A(entity=2)
+        second = A(entity=2)
+        cm.add(first, second)
+
+        self.assertEqual([first, second], cm.get_all(A, entity=2))
+
+        cm.delete_component(first)
+        self.assertEqual([second], cm.get_all(A, entity=2))
+
+    def test_stash_and_unstash_entity(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        @dataclass
+        class B(Component):
+            pass
+
+        cm = self.manager_class()
+        a = A(entity=2)
+        b = B(entity=2)
+        cm.add(a, b)
+
+        cm.stash_entity(2)
+        self.assertEqual([], cm.get(Component))
+        self.assertEqual({a.id, b.id}, cm.stashed_entities[2])
+
+        cm.unstash_entity(2)
+        self.assertIs(a, cm.get_one(A, entity=2))
+        self.assertIs(b, cm.get_one(B, entity=2))
+
+    def test_delete_component_removes_by_identity(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        cm = self.manager_class()
+        first = A(id=1, entity=2)
+        twin = A(id=1, entity=2)
+        cm.add(first, twin)
+
+        cm.delete_component(twin)
+
+        self.assertEqual(1, len(cm.get(A)))
+        self.assertIs(first, cm.get(A)[0])
+        self.assertIs(first, cm.get_one(A, entity=2))
+
+    def test_delete_preserves_order_of_remaining_components(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        cm = self.manager_class()
+        components = [A(entity=e) for e in range(1, 6)]
+        cm.add(*components)
+
+        cm.delete(2)
+        cm.delete(4)
+
+        self.assertEqual(
+            [components[0], components[2], components[4]], cm.get(A)
+        )
+
+    def test_lookup_of_unknown_entity_does_not_create_it(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        cm = self.manager_class()
+        self.assertIsNone(cm.get_one(A, entity=7))
+        self.assertEqual([], cm.get_all(A, entity=7))
+        self.assertNotIn(7, cm.entities)
+
+    def test_query_joins_components_per_entity(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        @dataclass
+        class B(Component):
+            pass
+
+        cm = self.manager_class()
+        a1, b1 = A(entity=1), B(entity=1)
+        a2 = A(entity=2)
+        cm.add(a1, b1, a2)
+
+        self.assertEqual([(a1, b1)], cm.query(A, B))
+        self.assertEqual([(b1, a1)], cm.query(B, A))
+
+    def test_query_optional_and_exclude(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        @dataclass
+        class B(Component):
+            pass
+
+        @dataclass
+        class C(Component):
+            pass
+
+        cm = self.manager_class()
+        a1, b1 = A(entity=1), B(entity=1)
+        a2, c2 = A(entity=2), C(entity=2)
+        a3 = A(entity=3)
+        cm.add(a1, b1, a2, c2, a3)
+
+        self.assertCountEqual(
+            [(a1, b1), (a2, None), (a3, None)], cm.query(A, optional=[B])
+        )
+        self.assertCountEqual([(a1,), (a3,)], cm.query(A, exclude=[C]))
+
+    def test_query_view_updates_incrementally(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        @dataclass
+        class B(Component):
+            pass
+
+        @dataclass
+        class C(Component):
+            pass
+
+        cm = self.manager_class()
+        a1 = A(entity=1)
+        cm.add(a1)
+        self.assertEqual([], cm.query(A, B, exclude=[C]))
+
+        b1 = B(entity=1)
+        cm.add(b1)
+        self.assertEqual([(a1, b1)], cm.query(A, B, exclude=[C]))
+
+        c1 = C(entity=1)
+        cm.add(c1)
+        self.assertEqual([], cm.query(A, B, exclude=[C]))
+
+        cm.delete_component(c1)
+        self.assertEqual([(a1, b1)], cm.query(A, B, exclude=[C]))
+
+        cm.stash_entity(1)
+        self.assertEqual([], cm.query(A, B, exclude=[C]))
+
+        cm.unstash_entity(1)
+        self.assertEqual([(a1, b1)], cm.query(A, B, exclude=[C]))
+
+        cm.delete(1)
+        self.assertEqual([], cm.query(A, B, exclude=[C]))
+        self.assertEqual(1, len(cm.views))
+
+    def test_query_by_supertype(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        @dataclass
+        class B(A):
+            pass
+
+        cm = self.manager_class()
+        cm.query(A)
+        b = B(entity=1)
+        cm.add(b)
+
+        self.assertEqual([(b,)], cm.query(A))
+
+    def test_query_requires_a_type(self):
+        with self.assertRaises(ValueError):
+            self.manager_class().query()
+
+    def test_spatial_index_tracks_add_delete_and_stash(self):
+        cm = self.manager_class()
+        a = Coordinates(entity=1, x=3, y=4)
+        b = Coordinates(entity=2, x=3, y=4)
+        cm.add(a, b)
+        self.assertEqual([1, 2], cm.at(3, 4))
+        self.assertEqual([a, b], cm.coordinates_at(3, 4))
+
+        cm.delete(1)
+        self.assertEqual([2], cm.at(3, 4))
+
+        cm.stash_entity(2)
+        self.assertEqual([], cm.at(3, 4))
+
+        cm.unstash_entity(2)
+        self.assertEqual([2], cm.at(3, 4))
+
+    def test_spatial_index_follows_mutation(self):
+        cm = self.manager_class()
+        coords = Coordinates(entity=1, x=0, y=0)
+        cm.add(coords)
+
+        coords.x += 2
+        coords.y = 5
+
+        self.assertEqual([], cm.at(0, 0))
+        self.assertEqual([1], cm.at(2, 5))
+
+        cm.delete_component(coords)
+        coords.x = 9
+        self.assertEqual([], cm.at(2, 5))
+        self.assertEqual([], cm.at(9, 5))
+
+    def test_in_rect(self):
+        cm = self.manager_class()
+        for entity, (x, y) in enumerate([(0, 0), (2, 2), (3, 3), (9, 9)]):
+            cm.add(Coordinates(entity=entity + 1, x=x, y=y))
+
+        self.assertCountEqual([2, 3], cm.in_rect(1, 1, 3, 3))
+        self.assertEqual([3], cm.in_rect(3, 3, 1, 2))
+        self.assertCountEqual([1, 2, 3, 4], cm.in_rect(0, 0, 10, 10))
+        self.assertEqual([], cm.in_rect(0, 0, 0, 10))
+
+        cm.clear()
+        self.assertEqual([], cm.in_rect(0, 0, 10, 10))
+
+    def test_get_by_indexed_field(self):
+        @dataclass
+        class Kind(Component):
+            indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"kind"})
+            kind: str = ""
+            size: int = 0
+
+        @dataclass
+        class SubKind(Kind):
+            pass
+
+        cm = self.manager_class()
+        big = Kind(entity=1, kind="a", size=2)
+        small = SubKind(entity=2, kind="a", size=1)
+        other = Kind(entity=3, kind="b")
+        cm.add(big, small, other)
+
+        self.assertEqual([big, small], cm.get_by(Kind, kind="a"))
+        self.assertEqual([small], cm.get_by(SubKind, kind="a"))
+        self.assertEqual([big], cm.get_by(Kind, kind="a", size=2))
+        self.assertEqual([small], cm.get_by(Kind, kind="a", entity=2))
+        self.assertEqual([], cm.get_by(Kind, kind="c"))
+        # Fields without an index fall back to a scan.
+        self.assertEqual([small], cm.get_by(Kind, size=1))
+
+    def test_get_by_follows_mutation_and_delete(self):
+        @dataclass
+        class Kind(Component):
+            indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"kind"})
+            kind: str = ""
+
+        cm = self.manager_class()
+        first = Kind(entity=1, kind="a")
+        second = Kind(entity=2, kind="a")
+        cm.add(first, second)
+
+        first.kind = "b"
+        self.assertEqual([second], cm.get_by(Kind, kind="a"))
+        self.assertEqual([first], cm.get_by(Kind, kind="b"))
+
+        cm.stash_entity(2)
+        self.assertEqual([], cm.get_by(Kind, kind="a"))
+        cm.unstash_entity(2)
+        self.assertEqual([second], cm.get_by(Kind, kind="a"))
+
+        cm.delete(1)
+        first.kind = "a"
+        self.assertEqual([second], cm.get_by(Kind, kind="a"))
+        self.assertEqual([], cm.get_by(Kind, kind="b"))
+
+    def test_add_many(self):
+        cm = self.manager_class()
+        coords = [Coordinates(entity=e, x=e, y=0) for e in range(1, 4)]
+        cm.add_many(coords)
+
+        self.assertEqual(coords, cm.get(Coordinates))
+        self.assertEqual([2], cm.at(2, 0))
+        self.assertEqual(0, cm._batch_depth)
+
+    def test_batch_defers_and_coalesces_index_updates(self):
+        @dataclass
+        class Kind(Component):
+            indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"kind"})
+            kind: str = ""
+
+        cm = self.manager_class()
+        kept = Coordinates(entity=1, x=0, y=0)
+        cm.add(kept)
+        self.assertEqual([(kept,)], cm.query(Coordinates))
+
+        with cm.batch():
+            transient = Coordinates(entity=2, x=0, y=0)
+            cm.add(transient, Kind(entity=2, kind="a"))
+            cm.delete(2)
+            cm.delete_component(kept)
+            cm.add(kept)
+            kept.x = 4
+            added = Kind(entity=3, kind="b")
+            cm.add(added)
+            # Primary storage is current inside the batch.
+            self.assertIs(added, cm.get_one(Kind, entity=3))
+            self.assertEqual(1, len(cm._pending))
+
+        self.assertEqual({}, cm._pending)
+        self.assertEqual([], cm.at(0, 0))
+        self.assertEqual([1], cm.at(4, 0))
+        self.assertEqual([added], cm.get_by(Kind, kind="b"))
+        self.assertEqual([], cm.get_by(Kind, kind="a"))
+        self.assertEqual([(kept,)], cm.query(Coordinates))
+        self.assertIsNone(transient._manager)
+
+    def test_secondary_reads_flush_an_open_batch(self):
+        cm = self.manager_class()
+        with cm.batch():
+            cm.add(Coordinates(entity=1, x=1, y=1))
+            self.assertEqual([1], cm.at(1, 1))
+            cm.delete(1)
+            self.assertEqual([], cm.at(1, 1))
+
+    def test_tile_lookups_in_a_batch_defer_the_other_indexes(self):
+        cm = self.manager_class()
+        indexed = []
+        index = cm._index
+        cm._index = lambda component, spatial=True: (
+            indexed.append(component),
+            index(component, spatial),
+        )
+
+        with cm.batch():
+            for x in range(10):
+                self.assertEqual([], cm.at(x, 0))
+                cm.add(Coordinates(entity=x + 1, x=x, y=0))
+                self.assertEqual([x + 1], cm.at(x, 0))
+            cm.delete(1)
+            self.assertEqual([], cm.coordinates_at(0, 0))
+            self.assertEqual([], indexed)
+
+        self.assertEqual(9, len(indexed))
+        self.assertEqual([2], cm.at(1, 0))
+        self.assertEqual(9, len(cm.query(Coordinates)))
+
+    def test_batch_flushes_when_the_block_raises(self):
+        cm = self.manager_class()
+        with self.assertRaises(RuntimeError):
+            with cm.batch():
+                cm.add(Coordinates(entity=1, x=1, y=1))
+                raise RuntimeError()
+        self.assertEqual([1], cm.at(1, 1))
+
+    def test_track_reports_coalesced_changes(self):
+        cm = self.manager_class()
+        reader = cm.track(Coordinates, key="test")
+        self.assertTrue(reader.drain().rebuild)
+
+        first = Coordinates(entity=1, x=0, y=0)
+        second = Coordinates(entity=2, x=0, y=0)
+        cm.add(first, second)
+        first.x = 3
+        changes = reader.drain()
+        self.assertFalse(changes.rebuild)
+        self.assertEqual([first, second], changes.added)
+        self.assertEqual([], changes.modified)
+
+        first.x = 5
+        first.x = 6
+        changes = reader.drain()
+        self.assertEqual([first], changes.modified)
+        self.assertEqual(3, changes.old_value(first, "x"))
+        self.assertEqual(0, changes.old_value(first, "y"))
+
+        second.y = 2
+        cm.delete(2)
+        changes = reader.drain()
+        self.assertEqual([second], changes.removed)
+        self.assertEqual(0, changes.old_value(second, "y"))
+
+        cm.add(Coordinates(entity=3))
+        cm.delete(3)
+        self.assertFalse(reader.pending)
+        self.assertFalse(reader.drain())
+
+    def test_track_stash_clear_and_batch(self):
+        cm = self.manager_class()
+        coords = Coordinates(entity=1, x=1, y=1)
+        cm.add(coords)
+        reader = cm.track(Coordinates, key="test")
+        reader.drain()
+
+        cm.stash_entity(1)
+        cm.unstash_entity(1)
+        self.assertEqual([coords], reader.drain().modified)
+
+        with cm.batch():
+            cm.delete(1)
+            self.assertEqual(
+                [coords], cm.track(Coordinates, key="test").drain().removed
+            )
+            cm.add(coords)
+        self.assertEqual([coords], reader.drain().added)
+
+        generation = cm.generation
+        cm.clear()
+        changes = reader.drain()
+        self.assertTrue(changes.rebuild)
+        self.assertGreater(changes.generation, generation)
+
+    def test_from_data_replaces_the_world(self):
+        cm = self.manager_class()
+        outgoing = Coordinates(entity=1, x=1, y=1)
+        cm.add(outgoing)
+        reader = cm.track(Coordinates, key="test")
+        reader.drain()
+
+        loaded = Coordinates(entity=2, x=3, y=4)
+        stashed = Coordinates(entity=3, x=5, y=5)
+        cm.from_data(
+            {
+                "active_components": {loaded.id: loaded},
+                "stashed_components": {stashed.id: stashed},
+                "stashed_entities": {3: [stashed.id]},
+            }
+        )
+
+        self.assertEqual([loaded], list(cm.get(Coordinates)))
+        self.assertEqual([2], cm.at(3, 4))
+        self.assertEqual([], cm.at(1, 1))
+        self.assertEqual(loaded, cm.get_one(Coordinates, entity=2))
+        self.assertIn(3, cm.stashed_entities)
+        self.assertTrue(reader.drain().rebuild)
+
+        # The outgoing component no longer reports field writes
+        outgoing.x = 7
+        self.assertFalse(reader.pending)
+        loaded.x = 6
+        self.assertEqual([2], cm.at(6, 4))
+
+    def test_from_data_rejects_invalid_entities(self):
+        cm = self.manager_class()
+        damaged = Coordinates(entity=1)
+        damaged.entity = constants.INVALID
+        with self.assertRaises(ValueError):
+            cm.from_data(
+                {
+                    "active_components": {damaged.id: damaged},
+                    "stashed_components": {},
+                    "stashed_entities": {},
+                }
+            )
+
+    def test_track_validates_types(self):
+        cm = self.manager_class()
+        cm.track(Coordinates, key="test")
+        with self.assertRaises(ValueError):
+            cm.track(Component, key="test")
+        with self.assertRaises(ValueError):
+            cm.track(key="other")
+        cm.untrack("test")
+        self.assertIsNotNone(cm.track(Component, key="test"))
+
+    def test_track_writes_reports_unwatched_fields(self):
+        @dataclass
+        class Health(Component):
+            hp: int = 0
+            cache: object = transient()
+
+        cm = self.manager_class()
+        health = Health(entity=1, hp=5)
+        cm.add(health, Coordinates(entity=1))
+        watched = cm.track(Component, key="watched")
+        reader = cm.track(Component, key="saves", writes=True)
+        watched.drain()
+        reader.drain()
+        with self.assertRaises(ValueError):
+            cm.track(Component, key="saves")
+
+        health.hp = 4
+        health.cache = object()
+        changes = reader.drain()
+        self.assertEqual([health], changes.modified)
+        self.assertEqual(5, changes.old_value(health, "hp"))
+        self.assertFalse(watched.pending)
+
+        # Transient fields are not reported
+        health.cache = None
+        self.assertFalse(reader.pending)
+
+        cm.untrack("saves")
+        self.assertFalse(cm.tracks_writes)
+        health.hp = 3
+        self.assertEqual(3, health.hp)
+        self.assertFalse(watched.pending)
+
+    def test_changed_tiles(self):
+        @dataclass
+        class Marker(Component):
+            pass
+
+        cm = self.manager_class()
+        moved = Coordinates(entity=1, x=0, y=0)
+        cm.add(moved, Coordinates(entity=2, x=5, y=5))
+        reader = cm.track(Coordinates, Marker, key="test")
+        reader.drain()
+
+        moved.x = 1
+        cm.add(Marker(entity=2))
+        self.assertEqual(
+            {(0, 0), (1, 0), (5, 5)}, cm.changed_tiles(reader.drain())
+        )
+
+    def test_delete_releases_ids(self):
+        entity, coords_id, stashed_id = core.get_ids(3)
+        cm = self.manager_class()
+        cm.add(
+            Coordinates(id=coords_id, entity=entity, x=1, y=1),
+            Coordinates(id=stashed_id, entity=entity, x=2, y=2),
+        )
+
+        cm.stash_component(stashed_id)
+        self.assertTrue(core.ID_ALLOCATOR.is_live(stashed_id))
+
+        cm.delete(entity)
+        self.assertFalse(core.ID_ALLOCATOR.is_live(entity))
+        self.assertFalse(core.ID_ALLOCATOR.is_live(coords_id))
+        self.assertTrue(core.ID_ALLOCATOR.is_live(stashed_id))
+
+    def test_clone_is_independent(self):
+        @dataclass
+        class Path(Component):
+            steps: List[int] = field(default_factory=list)
+
+        cm = self.manager_class()
+        coords = Coordinates(entity=1, x=1, y=1)
+        path = Path(entity=1, steps=[1])
+        cm.add(coords, path, Coordinates(entity=2, x=2, y=2))
+        cm.stash_entity(2)
+
+        clone = cm.clone()
+        self.assertIsInstance(clone, self.manager_class)
+        clone_coords = clone.get_one(Coordinates, entity=1)
+        self.assertIsNot(coords, clone_coords)
+        self.assertEqual(coords, clone_coords)
+        self.assertEqual([1], clone.at(1, 1))
+
+        clone_coords.x = 5
+        clone.get_one(Path, entity=1).steps.append(2)
+        clone.delete(1)
+        coords.y = 3
+        clone.unstash_entity(2)
+
+        self.assertEqual((1, 3), (coords.x, coords.y))
+        self.assertEqual([1], path.steps)
+        self.assertEqual([1], cm.at(1, 3))
+        self.assertEqual([], cm.at(2, 2))
+        self.assertEqual([], clone.at(1, 3))
+        self.assertEqual([2], clone.at(2, 2))
+        self.assertIn(2, cm.stashed_entities)
+
+
+class TestArchetypeComponentManager(TestComponentManager):
+    manager_class = ArchetypeComponentManager
+
+    def test_delete_preserves_order_of_remaining_components(self):
+        # Archetype rows are swap-removed, so only membership is guaranteed.
+        @dataclass
+        class A(Component):
+            pass
+
+        cm = self.manager_class()
+        components = [A(entity=e) for e in range(1, 6)]
+        cm.add(*components)
+
+        cm.delete(2)
+        cm.delete(4)
+
+        self.assertCountEqual(
+            [components[0], components[2], components[4]], cm.get(A)
+        )
+
+    def test_entities_move_between_archetypes(self):
+        @dataclass
+        class A(Component):
+            pass
+
+        @dataclass
+        class B(Component):
+            pass
+
+        cm = self.manager_class()
+        a = A(entity=2)
+        cm.add(a, A(entity=3))
+        b = B(entity=2)
+        cm.add(b)
+
+        self.assertEqual(2, len(cm.archetypes))
+        self.assertIs(
+            cm.archetypes[frozenset({A, B})], cm.entity_archetypes[2]
+        )
+        self.assertEqual(2, len(cm.get(A)))
+
+        cm.delete_component(b)
+        self.assertIs(cm.archetypes[frozenset({A})], cm.entity_archetypes[2])
+        self.assertEqual([3, 2], cm.archetypes[frozenset({A})].entities)
+
+        cm.delete(3)
+        self.assertEqual([a], cm.get(Component))
+
 
 if __name__ == "__main__":
     unittest.main()
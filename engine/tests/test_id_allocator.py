@@ -0,0 +1,73 @@
+import json
+import unittest
+
+from engine.id_allocator import IdAllocator, generation_of, index_of
+
+
+class TestIdAllocator(unittest.TestCase):
+    def test_released_index_is_reused_under_new_generation(self):
+        allocator = IdAllocator()
+        first = allocator.allocate()
+        allocator.allocate()
+
+        self.assertTrue(allocator.release(first))
+        reused = allocator.allocate()
+
+        self.assertNotEqual(first, reused)
+        self.assertEqual(index_of(first), index_of(reused))
+        self.assertEqual(generation_of(first) + 1, generation_of(reused))
+        self.assertFalse(allocator.is_live(first))
+        self.assertTrue(allocator.is_live(reused))
+
+    def test_release_is_idempotent(self):
+        allocator = IdAllocator()
+        first = allocator.allocate()
+
+        self.assertTrue(allocator.release(first))
+        self.assertFalse(allocator.release(first))
+        self.assertFalse(allocator.release(12345))
+        self.assertFalse(allocator.release(-1))
+        self.assertEqual([index_of(first)], allocator.free)
+
+    def test_allocate_many_uses_free_indexes_then_a_fresh_run(self):
+        allocator = IdAllocator(first_index=10)
+        old = allocator.allocate_many(3)
+        allocator.release(old[1])
+
+        ids = allocator.allocate_many(4)
+
+        self.assertEqual(4, len(set(ids)))
+        self.assertEqual(11, index_of(ids[0]))
+        self.assertEqual([13, 14, 15], ids[1:])
+        self.assertEqual(16, allocator.allocate())
+
+    def test_state_round_trips_through_json(self):
+        allocator = IdAllocator()
+        ids = allocator.allocate_many(5)
+        allocator.release(ids[2])
+        allocator.release(ids[4])
+
+        restored = IdAllocator()
+        restored.set_state(json.loads(json.dumps(allocator.get_state())))
+
+        self.assertEqual(allocator.allocate_many(3), restored.allocate_many(3))
+        self.assertTrue(restored.is_live(ids[0]))
+        self.assertFalse(restored.is_live(ids[2]))
+
+    def test_reserve_keeps_adopted_ids_from_being_issued(self):
+        allocator = IdAllocator(first_index=101)
+        allocator.reserve(500)
+        allocator.reserve(-1)
+
+        self.assertEqual(501, allocator.allocate())
+
+        released = allocator.allocate()
+        allocator.release(released)
+        adopted = (generation_of(released) + 3) << 32 | index_of(released)
+        allocator.reserve(adopted)
+
+        self.assertGreater(allocator.allocate(), adopted)
+
+
+if __name__ == "__main__":
+    unittest.main()
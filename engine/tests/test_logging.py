@@ -0,0 +1,156 @@
+import logging
+import os
+import queue
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from engine.logging import (
+    BoundedQueueHandler,
+    configure_logging,
+    get_hot_path_logger,
+    is_production_mode,
+    set_production_mode,
+    shutdown_logging,
+)
+
+
+class TestHotPathLogger(unittest.TestCase):
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = list(self.root.handlers)
+        self.saved_level = self.root.level
+        self.log_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        shutdown_logging()
+        for handler in self.root.handlers:
+            handler.close()
+        self.root.handlers[:] = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+        set_production_mode(False)
+        logging.captureWarnings(False)
+        self.log_dir.cleanup()
+
+    def _configure(self, environment, **kwargs):
+        configure_logging(
+            environment=environment, log_dir=self.log_dir.name, **kwargs
+        )
+
+    def test_flags_follow_configured_levels(self):
+        hot_logger = get_hot_path_logger("engine.tests.hot_path")
+
+        self._configure("development")
+        self.assertTrue(hot_logger.debug_enabled)
+
+        self._configure("production", production_mode=False)
+        self.assertFalse(hot_logger.debug_enabled)
+        self.assertTrue(hot_logger.info_enabled)
+
+    def test_payload_is_only_built_when_emitted(self):
+        hot_logger = get_hot_path_logger("engine.tests.hot_path")
+        built = []
+
+        def payload():
+            built.append(True)
+            return {"value": 1}
+
+        self._configure("production", production_mode=False)
+        hot_logger.debug("skipped", extra=payload)
+        self.assertEqual([], built)
+
+        self._configure("development")
+        with self.assertLogs("engine.tests.hot_path", logging.DEBUG) as logs:
+            hot_logger.debug("emitted", extra=payload)
+        self.assertEqual([True], built)
+        self.assertEqual(1, logs.records[0].value)
+        self.assertEqual(
+            "test_payload_is_only_built_when_emitted",
+            logs.records[0].funcName,
+        )
+
+    def test_production_mode_silences_hot_paths_only(self):
+        hot_logger = get_hot_path_logger("engine.tests.hot_path")
+
+        self._configure("development", production_mode=True)
+
+        self.assertTrue(is_production_mode())
+        self.assertFalse(hot_logger.debug_enabled)
+        self.assertFalse(hot_logger.info_enabled)
+        self.assertTrue(
+            logging.getLogger("engine.tests.hot_path").isEnabledFor(
+                logging.DEBUG
+            )
+        )
+
+
+class TestQueuedLogging(unittest.TestCase):
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved_handlers = list(self.root.handlers)
+        self.saved_level = self.root.level
+        self.log_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        shutdown_logging()
+        for handler in self.root.handlers:
+            handler.close()
+        self.root.handlers[:] = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+        set_production_mode(False)
+        logging.captureWarnings(False)
+        self.log_dir.cleanup()
+
+    def test_records_are_written_off_thread_and_flushed(self):
+        configure_logging(
+            environment="test", log_dir=self.log_dir.name, queue_enabled=True
+        )
+        self.assertEqual(1, len(self.root.handlers))
+        self.assertIsInstance(self.root.handlers[0], BoundedQueueHandler)
+
+        queue_handler = self.root.handlers[0]
+        threads = []
+        write = logging.handlers.RotatingFileHandler.emit
+
+        def emit(handler, record):
+            threads.append(threading.current_thread())
+            write(handler, record)
+
+        with mock.patch.object(
+            logging.handlers.RotatingFileHandler, "emit", emit
+        ):
+            for i in range(100):
+                logging.getLogger("engine.tests.queue").info("line %d", i)
+            shutdown_logging()
+
+        self.assertNotIn(queue_handler, self.root.handlers)
+        self.assertNotIn(threading.main_thread(), threads)
+        with open(os.path.join(self.log_dir.name, "engine.log")) as log:
+            lines = log.read().splitlines()
+        self.assertTrue(lines[-1].endswith("line 99"))
+
+    def test_rejects_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            configure_logging(
+                log_file=None, queue_enabled=True, queue_policy="wait"
+            )
+
+    def test_drop_policy_counts_records_that_do_not_fit(self):
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), "drop")
+        logger = logging.getLogger("engine.tests.queue.drop")
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for i in range(5):
+                logger.warning("line %d", i)
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+
+        self.assertEqual(2, handler.queue.qsize())
+        self.assertEqual(3, handler.dropped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from engine.profiler import FRAME, FrameProfiler
+
+
+def _clock(*times_ms):
+    return mock.patch(
+        "engine.profiler.perf_counter_ns",
+        side_effect=[int(t * 1e6) for t in times_ms],
+    )
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_disabled_profiler_calls_through(self):
+        profiler = FrameProfiler()
+
+        self.assertEqual(3, profiler.call("add", lambda a, b: a + b, 1, 2))
+        profiler.end_frame()
+
+        self.assertEqual([], profiler.stats())
+        self.assertEqual(0, profiler.frames)
+
+    def test_sections_are_summed_per_frame(self):
+        profiler = FrameProfiler(enabled=True)
+        # start/stop of two "move" calls, one "act", then end_frame
+        with _clock(0, 2, 2, 5, 5, 6, 10):
+            profiler.call("move", lambda: None)
+            profiler.call("move", lambda: None)
+            with profiler.section("act"):
+                pass
+            profiler.end_frame()
+
+        stats = {entry.name: entry for entry in profiler.stats()}
+        self.assertEqual(5.0, stats["move"].last_ms)
+        self.assertEqual(1.0, stats["act"].last_ms)
+        self.assertNotIn(FRAME, stats)
+        self.assertEqual(1, profiler.frames)
+
+    def test_history_is_a_ring_buffer_with_percentiles(self):
+        profiler = FrameProfiler(history=20, enabled=True)
+        clock = []
+        for cost in range(1, 31):
+            clock.extend([0, cost, 0])
+        with _clock(*clock):
+            for _ in range(30):
+                profiler.call("system", lambda: None)
+                profiler.end_frame()
+
+        (system,) = [e for e in profiler.stats() if e.name == "system"]
+        self.assertEqual(20, system.samples)
+        self.assertEqual(20.0, system.p50_ms)
+        self.assertEqual(29.0, system.p95_ms)
+        self.assertEqual(30.0, system.max_ms)
+
+    def test_export_csv_and_json(self):
+        profiler = FrameProfiler(enabled=True)
+        with _clock(0, 4, 4, 10):
+            profiler.call("move", lambda: None)
+            profiler.end_frame()
+            profiler.end_frame()
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = profiler.export(os.path.join(directory, "p.csv"))
+            json_path = profiler.export(os.path.join(directory, "p.json"))
+            with open(csv_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+            with open(json_path) as file:
+                entries = json.load(file)
+
+        self.assertEqual(["frame", "move"], [row["name"] for row in rows])
+        self.assertEqual("6.0", rows[0]["max_ms"])
+        self.assertEqual(rows[1]["p95_ms"], str(entries[1]["p95_ms"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+pytest.importorskip("tcod")
+
+from engine import core, save_audit, serialization
+from engine.component_manager import ComponentManager
+from engine.components.component import Component
+
+
+@dataclass(slots=True)
+class AuditSmall(Component):
+    flag: bool = False
+
+
+@dataclass(slots=True)
+class AuditLarge(Component):
+    label: str = ""
+    history: List[int] = field(default_factory=list)
+
+
+class TestSaveAudit(unittest.TestCase):
+    def setUp(self):
+        self._named_ids = dict(core.get_named_ids())
+        self._id_state = core.get_id_state()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "audit.world")
+        self.cm = ComponentManager()
+        for _ in range(3):
+            entity = core.get_id()
+            self.cm.add(
+                AuditSmall(entity=entity),
+                AuditLarge(entity=entity, label="x", history=list(range(200))),
+            )
+
+    def tearDown(self):
+        core.set_named_ids(self._named_ids)
+        core.set_id_state(self._id_state)
+        self.directory.cleanup()
+
+    def test_largest_classes_and_fields_come_first(self):
+        for save_format in serialization.FORMATS:
+            with self.subTest(save_format=save_format):
+                serialization.save(
+                    self.cm.get_serial_form(),
+                    self.path,
+                    save_format=save_format,
+                )
+
+                sizes = save_audit.audit(self.path)
+
+                self.assertEqual(
+                    ["AuditLarge", "AuditSmall"], [s.name for s in sizes]
+                )
+                self.assertEqual([3, 3], [s.count for s in sizes])
+                self.assertEqual(["history"], sizes[0].largest_fields(1))
+                self.assertLessEqual(
+                    sum(s.size for s in sizes), os.path.getsize(self.path)
+                )
+
+    def test_report_lists_every_class(self):
+        serialization.save(self.cm.get_serial_form(), self.path)
+
+        _, table = save_audit.main([self.path, "--fields", "1"])
+
+        self.assertIn("AuditLarge", table)
+        self.assertIn("history", table)
+        self.assertIn("AuditSmall", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,289 @@
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+pytest.importorskip("tcod")
+
+from engine import core, serialization
+from engine.component_manager import ComponentManager
+from engine.components.component import Component, transient
+from engine.save_journal import SaveJournal, journal_path
+from engine.tracing import TraceRecorder
+
+
+@dataclass(slots=True)
+class JournalSample(Component):
+    count: int = 0
+    path: List[int] = field(default_factory=list)
+    cache: object = transient()
+
+
+@dataclass(slots=True)
+class JournalCounter(Component):
+    count: int = 0
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self):
+        self._named_ids = dict(core.get_named_ids())
+        self._id_state = core.get_id_state()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.world")
+        self.cm = ComponentManager()
+        self.entity = core.get_id()
+        self.kept = JournalSample(entity=self.entity, count=1)
+        self.edited = JournalSample(entity=self.entity, count=2)
+        self.deleted = JournalSample(entity=self.entity, count=3)
+        self.cm.add(self.kept, self.edited, self.deleted)
+
+    def tearDown(self):
+        # Journals left open would keep reporting component writes
+        for key in list(self.cm.readers):
+            self.cm.untrack(key)
+        core.set_named_ids(self._named_ids)
+        core.set_id_state(self._id_state)
+        self.directory.cleanup()
+
+    def _loaded(self):
+        data = serialization.load(self.path)
+        return {
+            component.id: (component.count, component.path)
+            for component in data["active_components"].values()
+        }
+
+    def _expected(self):
+        return {
+            component.id: (component.count, list(component.path))
+            for component in self.cm.components_by_id.values()
+        }
+
+    def test_saves_append_only_the_changes(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save().result()
+        self.assertFalse(os.path.exists(journal_path(self.path)))
+
+        self.edited.count = 20
+        self.kept.path.append(7)
+        self.cm.delete_component(self.deleted)
+        added = JournalSample(entity=self.entity, count=4)
+        self.cm.add(added)
+        journal.save({"season": "spring"}).result()
+
+        with open(journal_path(self.path), "rb") as f:
+            entry = f.read()
+        self.assertIn(b"spring", entry)
+        self.assertEqual(self._expected(), self._loaded())
+
+        # Nothing saved changed: the entry carries no components
+        self.kept.cache = object()
+        unchanged = journal.save().result()
+        self.assertLess(unchanged, len(entry))
+        self.assertEqual(self._expected(), self._loaded())
+        journal.close()
+
+    def test_saves_visit_only_written_components(self):
+        untouched = [JournalCounter(entity=self.entity) for _ in range(50)]
+        self.cm.add(*untouched)
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save().result()
+        visited = []
+        for component_type in (JournalSample, JournalCounter):
+            getter = journal._getter(component_type)
+
+            def counting_getter(component, getter=getter):
+                visited.append(component.id)
+                return getter(component)
+
+            journal._getters[component_type] = counting_getter
+
+        self.edited.count = 20
+        untouched[0].count = 0
+        journal.save().result()
+
+        # The write that changed nothing is visited but not saved, and the
+        # components with a list are compared each time, since lists can
+        # change in place
+        self.assertCountEqual(
+            [untouched[0].id, self.kept.id, self.edited.id, self.deleted.id],
+            visited,
+        )
+        visited.clear()
+        self.kept.path.append(1)
+        journal.save().result()
+        self.assertCountEqual(
+            [self.kept.id, self.edited.id, self.deleted.id], visited
+        )
+        loaded = serialization.load(self.path)["active_components"]
+        self.assertEqual([1], loaded[self.kept.id].path)
+        self.assertEqual(20, loaded[self.edited.id].count)
+        self.assertEqual(len(self.cm.components_by_id), len(loaded))
+        journal.close()
+
+    def test_writes_are_traced_on_the_worker_thread(self):
+        recorder = TraceRecorder()
+        journal = SaveJournal(self.cm, self.path, tracer=recorder)
+        recorder.span("frame", recorder.origin, recorder.origin + 1000)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        journal.compact()
+        journal.close()
+
+        threads = {
+            event["tid"]: event["args"]["name"]
+            for event in recorder.events()
+            if event["ph"] == "M"
+        }
+        spans = {
+            event["name"]: threads[event["tid"]]
+            for event in recorder.events()
+            if event["ph"] == "X"
+        }
+        self.assertEqual(
+            {"frame", "save_checkpoint", "save_append", "save_compact"},
+            set(spans),
+        )
+        self.assertTrue(spans["save_append"].startswith("save-journal"))
+        self.assertEqual(spans["save_checkpoint"], spans["save_append"])
+        self.assertNotEqual(spans["frame"], spans["save_append"])
+
+    def test_compaction_folds_the_journal_into_the_snapshot(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        self.cm.delete_component(self.deleted)
+        journal.save()
+
+        journal.compact().result()
+        self.assertEqual(0, os.path.getsize(journal_path(self.path)))
+        self.assertEqual(self._expected(), self._loaded())
+
+        # Saves after a compaction are replayed over the new snapshot
+        self.kept.count = 10
+        journal.save()
+        journal.wait()
+        self.assertEqual(self._expected(), self._loaded())
+        journal.close()
+
+    def test_saves_are_copied_before_they_are_written(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        expected = self._expected()
+
+        # Edits made while the saves are still being written stay out
+        self.edited.count = 30
+        self.kept.path.append(9)
+        journal.close()
+
+        self.assertEqual(expected, self._loaded())
+
+    def test_load_ignores_a_damaged_last_entry(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        expected = self._expected()
+        self.kept.count = 10
+        journal.save()
+        journal.close()
+
+        with open(journal_path(self.path), "r+b") as f:
+            f.truncate(os.path.getsize(journal_path(self.path)) - 1)
+
+        self.assertEqual(expected, self._loaded())
+
+    def test_info_comes_from_the_last_entry(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save({"season": "spring"})
+        journal.save({"season": "summer"})
+        journal.wait()
+        self.assertEqual(
+            {"object_count": 3, "extra": {"season": "summer"}},
+            serialization.read_info(self.path),
+        )
+
+        journal.compact().result()
+        self.assertEqual(
+            {"object_count": 3, "extra": {"season": "summer"}},
+            serialization.read_info(self.path),
+        )
+        journal.close()
+
+    def test_failed_checkpoint_keeps_the_journal(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        expected = self._expected()
+
+        # The snapshot cannot encode this, so the checkpoint fails
+        self.kept.path.append(object())
+        self.assertIsNotNone(journal.checkpoint().exception())
+        journal.close()
+
+        self.assertEqual(expected, self._loaded())
+
+    def test_failed_full_save_keeps_the_journal(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        journal.close()
+        expected = self._expected()
+
+        with self.assertRaises(TypeError):
+            serialization.save(
+                self.cm.get_serial_form(),
+                self.path,
+                extra={"bad": object()},
+            )
+
+        self.assertTrue(os.path.exists(journal_path(self.path)))
+        self.assertEqual(expected, self._loaded())
+
+    def test_entries_left_by_a_checkpoint_are_not_replayed(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save({"season": "spring"})
+        journal.close()
+        with open(journal_path(self.path), "rb") as f:
+            stale = f.read()
+
+        # A new journal continues the sequence on disk
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        self.assertEqual(1, journal.sequence)
+        self.edited.count = 30
+        journal.save({"season": "summer"}).result()
+        journal.close()
+        # As if the checkpoint crashed before removing the old journal
+        with open(journal_path(self.path), "wb") as f:
+            f.write(stale)
+
+        self.assertEqual(self._expected(), self._loaded())
+        self.assertEqual(
+            {"season": "summer"}, serialization.read_info(self.path)["extra"]
+        )
+
+    def test_full_save_discards_the_journal(self):
+        journal = SaveJournal(self.cm, self.path, compact_ratio=0)
+        journal.save()
+        self.edited.count = 20
+        journal.save()
+        journal.close()
+
+        serialization.save(self.cm.get_serial_form(), self.path)
+
+        self.assertFalse(os.path.exists(journal_path(self.path)))
+        self.assertEqual(self._expected(), self._loaded())
+
+
+if __name__ == "__main__":
+    unittest.main()
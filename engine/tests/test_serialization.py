@@ -0,0 +1,182 @@
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List
+
+import pytest
+
+pytest.importorskip("tcod")
+
+from engine import binary_save, core, serialization
+from engine.component_manager import ComponentManager
+from engine.components import Component, transient
+from engine.components.coordinates import Coordinates
+from engine.id_allocator import IdAllocator
+
+
+@dataclass(slots=True)
+class CachingSample(Component):
+    count: int = 0
+    cache: object = transient()
+
+
+class Shade(Enum):
+    DARK = 1
+    LIGHT = 2
+
+
+@dataclass(slots=True)
+class ShadedSample(Component):
+    shade: Shade = Shade.DARK
+    history: List[Shade] = field(default_factory=list)
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self._named_ids = dict(core.get_named_ids())
+        self._id_state = core.get_id_state()
+        handle, self.path = tempfile.mkstemp(suffix=".world")
+        os.close(handle)
+
+    def tearDown(self):
+        core.set_named_ids(self._named_ids)
+        core.set_id_state(self._id_state)
+        os.remove(self.path)
+
+    def test_ids_persist_through_save_and_load(self):
+        cm = ComponentManager()
+        entity = core.get_id("serialization test")
+        coords = Coordinates(entity=entity, x=1, y=2)
+        cm.add(coords)
+        # Leave a recycled index on the free list.
+        cm.delete(core.get_id())
+        serialization.save(cm.get_serial_form(), self.path)
+        expected = core.get_ids(3)
+
+        core.set_named_ids({})
+        core.set_id_state(IdAllocator(first_index=101).get_state())
+        data = serialization.load(self.path)
+
+        self.assertEqual(entity, core.get_id("serialization test"))
+        loaded = list(data["active_components"].values())
+        self.assertEqual([coords.id], [c.id for c in loaded])
+        self.assertEqual(expected, core.get_ids(3))
+
+    def test_load_reads_binary_and_json_saves(self):
+        cm = ComponentManager()
+        entity = core.get_id()
+        cm.add(Coordinates(entity=entity, x=3, y=4))
+        stashed = Coordinates(entity=entity, x=5, y=6)
+        cm.add(stashed)
+        cm.stash_component(stashed.id)
+
+        for save_format in serialization.FORMATS:
+            with self.subTest(save_format=save_format):
+                serialization.save(
+                    cm.get_serial_form(), self.path, save_format=save_format
+                )
+                data = serialization.load(self.path)
+
+                (loaded,) = data["active_components"].values()
+                self.assertEqual((3, 4), (loaded.x, loaded.y))
+                (loaded,) = data["stashed_components"].values()
+                self.assertEqual((5, 6), (loaded.x, loaded.y))
+
+        with open(self.path, "rb") as f:
+            self.assertFalse(f.read().startswith(binary_save.MAGIC))
+
+    def test_failed_save_keeps_the_previous_save(self):
+        cm = ComponentManager()
+        cm.add(Coordinates(entity=core.get_id(), x=3, y=4))
+        serialization.save(cm.get_serial_form(), self.path)
+        cm.add(Coordinates(entity=core.get_id(), x=5, y=6))
+
+        with self.assertRaises(TypeError):
+            serialization.save(
+                cm.get_serial_form(), self.path, extra={"bad": object()}
+            )
+
+        data = serialization.load(self.path)
+        self.assertEqual(1, len(data["active_components"]))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_transient_fields_are_not_saved(self):
+        cm = ComponentManager()
+        sample = CachingSample(entity=core.get_id(), count=2)
+        # Neither format could write this
+        sample.cache = object()
+        cm.add(sample)
+
+        for save_format in serialization.FORMATS:
+            with self.subTest(save_format=save_format):
+                serialization.save(
+                    cm.get_serial_form(), self.path, save_format=save_format
+                )
+                (loaded,) = serialization.load(self.path)[
+                    "active_components"
+                ].values()
+                self.assertEqual((sample.id, 2), (loaded.id, loaded.count))
+                self.assertIsNone(loaded.cache)
+
+    def test_enum_fields_load_as_members(self):
+        cm = ComponentManager()
+        sample = ShadedSample(
+            entity=core.get_id(), shade=Shade.LIGHT, history=[Shade.DARK]
+        )
+        cm.add(sample)
+
+        for save_format in serialization.FORMATS:
+            with self.subTest(save_format=save_format):
+                serialization.save(
+                    cm.get_serial_form(),
+                    self.path,
+                    extra={"shade": Shade.DARK},
+                    save_format=save_format,
+                )
+                (loaded,) = serialization.load(self.path)[
+                    "active_components"
+                ].values()
+                self.assertIs(Shade.LIGHT, loaded.shade)
+                self.assertIs(Shade.DARK, loaded.history[0])
+                self.assertIs(
+                    Shade.DARK,
+                    serialization.read_info(self.path)["extra"]["shade"],
+                )
+
+        # JSON saves name enum types the way binary saves do, and loading
+        # never imports what they name
+        with open(self.path) as f:
+            text = f.read()
+        with open(self.path, "w") as f:
+            f.write(text.replace(__name__, "antigravity"))
+        with self.assertRaises(binary_save.SaveFormatError):
+            serialization.load(self.path)
+
+    def test_info_is_read_without_loading(self):
+        cm = ComponentManager()
+        cm.add(Coordinates(entity=core.get_id(), x=3, y=4))
+        # Longer than one read of a JSON save
+        extra = {"village": "Oakvale", "notes": "x" * 10_000}
+
+        for save_format in serialization.FORMATS:
+            with self.subTest(save_format=save_format):
+                serialization.save(
+                    cm.get_serial_form(),
+                    self.path,
+                    extra=extra,
+                    save_format=save_format,
+                )
+                self.assertEqual(
+                    {"object_count": 1, "extra": extra},
+                    serialization.read_info(self.path),
+                )
+
+        with open(self.path, "w") as f:
+            f.write('{"info": {"object_count"')
+        self.assertIsNone(serialization.read_info(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
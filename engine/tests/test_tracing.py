@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from engine.profiler import FrameProfiler
+from engine.tracing import TraceRecorder
+
+
+class TestTraceRecorder(unittest.TestCase):
+    def test_spans_become_complete_events(self):
+        recorder = TraceRecorder(capacity=8)
+        recorder.span("update", recorder.origin + 1000, recorder.origin + 5000)
+
+        (thread, event) = recorder.events()
+        self.assertEqual("M", thread["ph"])
+        self.assertEqual(
+            threading.current_thread().name, thread["args"]["name"]
+        )
+        self.assertEqual(
+            {
+                "name": "update",
+                "ph": "X",
+                "ts": 1.0,
+                "dur": 4.0,
+                "pid": 1,
+                "tid": 0,
+            },
+            event,
+        )
+
+    def test_ring_buffer_keeps_the_newest_spans(self):
+        recorder = TraceRecorder(capacity=3)
+        for i in range(5):
+            recorder.span(f"s{i}", recorder.origin, recorder.origin + 1000)
+
+        names = [e["name"] for e in recorder.events() if e["ph"] == "X"]
+        self.assertEqual(["s2", "s3", "s4"], names)
+        self.assertEqual(2, recorder.dropped)
+
+    def test_spans_from_other_threads_get_their_own_track(self):
+        recorder = TraceRecorder(capacity=8)
+        recorder.span("frame", recorder.origin, recorder.origin + 1000)
+        worker = threading.Thread(
+            target=recorder.span,
+            args=("save", recorder.origin, recorder.origin + 2000),
+            name="saver",
+        )
+        worker.start()
+        worker.join()
+
+        threads = {
+            e["args"]["name"]: e["tid"]
+            for e in recorder.events()
+            if e["ph"] == "M"
+        }
+        spans = {
+            e["name"]: e["tid"] for e in recorder.events() if e["ph"] == "X"
+        }
+        self.assertEqual(threads["saver"], spans["save"])
+        self.assertNotEqual(spans["frame"], spans["save"])
+
+    def test_profiler_forwards_sections_and_frames(self):
+        profiler = FrameProfiler()
+        recorder = TraceRecorder(capacity=16)
+        profiler.set_tracer(recorder)
+        clock = [int(t * 1e6) for t in (0, 1, 3, 4, 5, 6, 8, 9)]
+        with mock.patch("engine.profiler.perf_counter_ns", side_effect=clock):
+            profiler.end_frame()
+            profiler.call("update", lambda: None)
+            profiler.call("render", lambda: None)
+            profiler.end_frame()
+            profiler.call("update", lambda: None)
+
+        spans = [
+            (e["name"], e["dur"]) for e in recorder.events() if e["ph"] == "X"
+        ]
+        self.assertEqual(
+            [("update", 2000.0), ("render", 1000.0), ("frame", 6000.0)],
+            spans[:3],
+        )
+        self.assertEqual([], profiler.stats())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = recorder.save(os.path.join(directory, "trace.json"))
+            with open(path) as file:
+                trace = json.load(file)
+        self.assertEqual(5, len(trace["traceEvents"]))
+        self.assertEqual(0, trace["otherData"]["dropped_spans"])
+
+
+if __name__ == "__main__":
+    unittest.main()
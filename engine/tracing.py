@@ -0,0 +1,177 @@
+"""
+Record timed spans and export them in the Chrome trace-event format.
+
+A TraceRecorder keeps one entry per span (a frame, a system run, a save) in a
+fixed-size ring buffer of packed arrays, so recording can stay on through a
+whole game session: once the buffer is full, the oldest spans are overwritten.
+``save`` writes the spans as Chrome trace-event JSON, which Perfetto
+(https://ui.perfetto.dev) and chrome://tracing open directly. Spans recorded
+on the same thread nest by their timestamps.
+
+Spans usually come from a FrameProfiler with a tracer attached; they can also
+be recorded directly::
+
+    start = perf_counter_ns()
+    ...
+    recorder.span("save", start, perf_counter_ns())
+"""
+
+import json
+import threading
+from array import array
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List
+
+# About 20 bytes per span; a million spans covers tens of minutes of play
+DEFAULT_CAPACITY = 1_000_000
+
+
+class TraceRecorder:
+    """
+    Keep the most recent timed spans for export as a trace.
+
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Create a recorder.
+
+        :param capacity: The most spans kept; older ones are overwritten
+        :type capacity: int
+
+        """
+        self.capacity = capacity
+        self.origin = perf_counter_ns()
+        self.count = 0
+        self._starts = array("q", bytes(8 * capacity))
+        self._durations = array("q", bytes(8 * capacity))
+        self._names = array("I", bytes(4 * capacity))
+        self._threads = array("I", bytes(4 * capacity))
+        self._name_ids: Dict[str, int] = {}
+        self._name_list: List[str] = []
+        self._thread_ids: Dict[int, int] = {}
+        self._thread_names: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Get how many spans were overwritten because the buffer was full.
+
+        :return: The number of lost spans
+        :rtype: int
+
+        """
+        return max(0, self.count - self.capacity)
+
+    def span(self, name: str, start: int, end: int) -> None:
+        """
+        Record a span on the calling thread. Safe to call from any thread.
+
+        :param name: The span name
+        :type name: str
+        :param start: The start time from perf_counter_ns
+        :type start: int
+        :param end: The end time from perf_counter_ns
+        :type end: int
+        :return: None
+
+        """
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._intern_name(name)
+        ident = threading.get_ident()
+        thread_id = self._thread_ids.get(ident)
+        if thread_id is None:
+            thread_id = self._intern_thread(ident)
+        with self._lock:
+            slot = self.count % self.capacity
+            self.count += 1
+            self._starts[slot] = start
+            self._durations[slot] = end - start
+            self._names[slot] = name_id
+            self._threads[slot] = thread_id
+
+    def clear(self) -> None:
+        """
+        Forget every recorded span.
+
+        :return: None
+
+        """
+        self.count = 0
+
+    def events(self) -> List[dict]:
+        """
+        Build the trace events for the recorded spans, oldest first.
+
+        Times are in microseconds since the recorder was created.
+
+        :return: Chrome trace-event dictionaries
+        :rtype: List[dict]
+
+        """
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in enumerate(self._thread_names)
+        ]
+        size = min(self.count, self.capacity)
+        first = self.count - size
+        for index in range(first, self.count):
+            slot = index % self.capacity
+            events.append(
+                {
+                    "name": self._name_list[self._names[slot]],
+                    "ph": "X",
+                    "ts": (self._starts[slot] - self.origin) / 1000,
+                    "dur": self._durations[slot] / 1000,
+                    "pid": 1,
+                    "tid": self._threads[slot],
+                }
+            )
+        return events
+
+    def save(self, path: str) -> Path:
+        """
+        Write the recorded spans as a Chrome trace-event JSON file.
+
+        :param path: Where to write
+        :type path: str
+        :return: The path written
+        :rtype: Path
+
+        """
+        path = Path(path)
+        trace = {
+            "traceEvents": self.events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_spans": self.dropped},
+        }
+        with open(path, "w") as file:
+            json.dump(trace, file)
+        return path
+
+    def _intern_name(self, name: str) -> int:
+        with self._lock:
+            name_id = self._name_ids.get(name)
+            if name_id is None:
+                name_id = len(self._name_list)
+                self._name_list.append(name)
+                self._name_ids[name] = name_id
+            return name_id
+
+    def _intern_thread(self, ident: int) -> int:
+        with self._lock:
+            thread_id = self._thread_ids.get(ident)
+            if thread_id is None:
+                thread_id = len(self._thread_names)
+                self._thread_names.append(threading.current_thread().name)
+                self._thread_ids[ident] = thread_id
+            return thread_id
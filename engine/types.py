@@ -7,6 +7,7 @@ U = TypeVar("U")
 EntityId = NewType("EntityId", int)
 ComponentType: TypeAlias = Type[Component]
 ComponentList: TypeAlias = List[Component]
+ComponentIndex: TypeAlias = Dict[int, Component]
 Entity = NewType("Entity", Tuple[EntityId, List[Component]])
 EntityDict: TypeAlias = Dict[ComponentType, List[Component]]
 EntityDictIndex: TypeAlias = Dict[EntityId, EntityDict]
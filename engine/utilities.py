@@ -1,4 +1,6 @@
+import gc
 import math
+from contextlib import contextmanager
 from itertools import product
 
 from engine.components import Coordinates
@@ -64,3 +66,22 @@ def get_all_positions(config):
             range(0, config.map_width), range(0, config.map_height)
         )
     }
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector around a bulk allocation.
+
+    Building, loading or copying a whole world allocates an object or more
+    per component, which triggers collection after collection, each walking
+    every live object. None of those objects form cycles, so nothing is lost
+    by collecting once, later.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
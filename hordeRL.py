@@ -17,6 +17,24 @@ def main(config):
 def cli():
     parser = argparse.ArgumentParser(description="Oh No! It's THE HORDE!")
     parser.add_argument("--prof", action="store_true", help="profile the game")
+    parser.add_argument(
+        "--trace",
+        dest="trace_path",
+        nargs="?",
+        const="trace.json",
+        default=None,
+        help=(
+            "record frames, systems, saves and loads as a Chrome trace"
+            " (written to PATH, default trace.json, on exit)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-frames",
+        dest="frame_profiler_enabled",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="time each system per frame and show the profiler overlay",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -130,6 +148,13 @@ def cli():
         default=None,
         help="enable or disable console logging",
     )
+    parser.add_argument(
+        "--log-queue",
+        dest="log_queue_enabled",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="write log records on a background thread",
+    )
     args = parser.parse_args()
     config = load_config(
         args.options_path or get_relative_path("options.yaml"),
@@ -149,6 +174,9 @@ def cli():
             "log_dir": args.log_dir,
             "log_file": args.log_file if args.log_file != "" else None,
             "log_console_enabled": args.log_console_enabled,
+            "log_queue_enabled": args.log_queue_enabled,
+            "frame_profiler_enabled": args.frame_profiler_enabled,
+            "trace_path": args.trace_path,
         },
     )
     load_locale(config.locale)
@@ -168,6 +196,9 @@ def cli():
         log_dir=config.log_dir or os.path.dirname(os.path.abspath(__file__)),
         log_file=config.log_file,
         console_enabled=config.log_console_enabled,
+        queue_enabled=config.log_queue_enabled,
+        queue_size=config.log_queue_size,
+        queue_policy=config.log_queue_policy,
     )
 
     if args.prof:
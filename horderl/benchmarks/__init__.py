@@ -0,0 +1,8 @@
+"""
+Benchmarks over worlds built from the game's own content.
+
+Like ``engine.benchmarks``, these are plain modules with a ``main()`` entry
+point and are not collected by pytest. Run one with, for example::
+
+    poetry run python -m horderl.benchmarks.save_load
+"""
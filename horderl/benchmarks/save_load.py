@@ -0,0 +1,319 @@
+"""
+Check save and load performance against stored baselines.
+
+Synthetic worlds of 1k to 500k components are built from the game's own
+factories (``make_tree``, ``make_water``, ``make_juvenile`` and
+``place_farmstead``), so the saves hold the same component classes, field
+values and static terrain as a real village. Each world is saved and loaded in
+every format, and each save and load runs in a fresh interpreter, which
+reports its wall time and peak RSS growth (see
+``engine.benchmarks.save_memory``) and the file size.
+
+The results are compared with ``save_load_baselines.json``; a result more than
+its tolerance above its baseline is a regression, and the run exits with
+status 1. Baselines are machine-specific: record them on the machine that runs
+the check with ``--update-baselines``.
+
+Usage::
+
+    poetry run python -m horderl.benchmarks.save_load
+    poetry run python -m horderl.benchmarks.save_load --sizes 1000 10000
+    poetry run python -m horderl.benchmarks.save_load --update-baselines
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+from engine import serialization
+from engine.benchmarks.save_memory import peak_rss_bytes, start_measuring
+from engine.component_manager import ComponentManager
+from horderl.content.enemies.juvenile import make_juvenile
+from horderl.content.farmsteads.houses import place_farmstead
+from horderl.content.terrain.trees import make_tree
+from horderl.content.terrain.water import make_water
+
+SIZES = (1_000, 10_000, 100_000, 500_000)
+BASELINES = Path(__file__).with_name("save_load_baselines.json")
+
+# Shares of a synthetic world's components
+FARMSTEAD_SHARE = 0.1
+JUVENILE_SHARE = 0.05
+# Share of the terrain tiles that are water rather than trees
+WATER_SHARE = 0.4
+
+# Terrain factories place 11 or 12 components per tile; the map gets some
+# room to spare so the terrain never runs out of free tiles
+_COMPONENTS_PER_TILE = 11
+_SPARE_TILES = 1.25
+
+# How far a result may rise above its baseline before it counts as a
+# regression: a share of the baseline plus an absolute allowance, which keeps
+# timer and allocator noise on small worlds from failing the check
+TOLERANCES: Dict[str, Tuple[float, float]] = {
+    "save_seconds": (0.5, 0.05),
+    "load_seconds": (0.5, 0.05),
+    "save_peak": (0.25, 4 * 2**20),
+    "load_peak": (0.25, 4 * 2**20),
+    "file_size": (0.05, 1024),
+}
+
+
+def build_world(components: int, seed: int = 0) -> ComponentManager:
+    """
+    Build a synthetic village of about ``components`` components.
+
+    Farmsteads are placed first, as world generation does, then the free
+    tiles are filled with trees and water, and hordelings are scattered last.
+
+    Args:
+        components: The number of components to aim for.
+        seed: Seed for the factories' random choices.
+
+    Returns:
+        ComponentManager: The world, within one entity of ``components``.
+    """
+    random.seed(seed)
+    side = max(
+        16,
+        math.ceil(math.sqrt(components / _COMPONENTS_PER_TILE * _SPARE_TILES)),
+    )
+    cm = ComponentManager()
+    scene = SimpleNamespace(
+        cm=cm, config=SimpleNamespace(map_width=side, map_height=side)
+    )
+
+    def size():
+        return len(cm.components_by_id)
+
+    while True:
+        place_farmstead(scene)
+        if size() >= components * FARMSTEAD_SHARE:
+            break
+
+    terrain_end = components * (1 - JUVENILE_SHARE)
+    tiles = ((x, y) for y in range(side) for x in range(side))
+    for x, y in tiles:
+        if size() >= terrain_end:
+            break
+        if cm.at(x, y):
+            continue
+        factory = make_water if random.random() < WATER_SHARE else make_tree
+        cm.add(*factory(x, y)[1])
+
+    while size() < components:
+        cm.add(
+            *make_juvenile(random.randrange(side), random.randrange(side))[1]
+        )
+    return cm
+
+
+def _worker(operation: str, save_format: str, path: str, components: int):
+    """
+    Run one save or load and print its measurements as JSON.
+    """
+    if operation == "save":
+        cm = build_world(components)
+        before = start_measuring()
+        start = perf_counter()
+        serialization.save(cm.get_serial_form(), path, save_format=save_format)
+        seconds = perf_counter() - start
+        count = len(cm.components_by_id)
+    else:
+        before = start_measuring()
+        start = perf_counter()
+        data = serialization.load(path)
+        seconds = perf_counter() - start
+        count = len(data["active_components"])
+    print(
+        json.dumps(
+            {
+                "components": count,
+                "seconds": seconds,
+                "peak": peak_rss_bytes() - before,
+                "file_size": os.path.getsize(path),
+            }
+        )
+    )
+
+
+def measure(
+    operation: str, save_format: str, path: str, components: int
+) -> Dict[str, float]:
+    """
+    Run one save or load in a fresh interpreter.
+
+    Args:
+        operation: "save" or "load".
+        save_format: One of serialization.FORMATS.
+        path: The save file to write or read.
+        components: The size of the world to save.
+
+    Returns:
+        Dict[str, float]: The component count, seconds, peak RSS growth in
+        bytes and file size.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            __spec__.name,
+            "--worker",
+            operation,
+            save_format,
+            path,
+            "--components",
+            str(components),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def run_suite(sizes, formats) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Save and load a world of each size in each format.
+
+    Args:
+        sizes: World sizes, in components.
+        formats: Save formats to measure.
+
+    Returns:
+        Dict: Metrics (see TOLERANCES) and component count by format, then
+        by size; sizes are strings, as in the baselines file.
+    """
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for save_format in formats:
+            for components in sizes:
+                path = os.path.join(directory, f"world.{save_format}")
+                save = measure("save", save_format, path, components)
+                load = measure("load", save_format, path, components)
+                results.setdefault(save_format, {})[str(components)] = {
+                    "components": save["components"],
+                    "save_seconds": save["seconds"],
+                    "load_seconds": load["seconds"],
+                    "save_peak": save["peak"],
+                    "load_peak": load["peak"],
+                    "file_size": save["file_size"],
+                }
+    return results
+
+
+def compare(results, baselines, tolerances=TOLERANCES) -> List[str]:
+    """
+    Find the results that rose past their baseline's tolerance.
+
+    Results without a baseline are not checked.
+
+    Args:
+        results: Results as returned by run_suite.
+        baselines: Baselines in the same shape.
+        tolerances: The share of the baseline and the absolute allowance
+            each metric may rise by.
+
+    Returns:
+        List[str]: One description per regression.
+    """
+    regressions = []
+    for save_format, by_size in results.items():
+        for size, metrics in by_size.items():
+            baseline = baselines.get(save_format, {}).get(size)
+            if baseline is None:
+                continue
+            for metric, (share, allowance) in tolerances.items():
+                limit = baseline[metric] * (1 + share) + allowance
+                if metrics[metric] > limit:
+                    regressions.append(
+                        f"{save_format} {size}: {metric} {metrics[metric]:.4g}"
+                        f" is above {limit:.4g} (baseline"
+                        f" {baseline[metric]:.4g})"
+                    )
+    return regressions
+
+
+def format_results(results, baselines) -> str:
+    """
+    Render one row per format and size, with each metric's change from its
+    baseline.
+    """
+    columns = (
+        ("save ms", "save_seconds", 1000),
+        ("load ms", "load_seconds", 1000),
+        ("save MB", "save_peak", 2**-20),
+        ("load MB", "load_peak", 2**-20),
+        ("file MB", "file_size", 2**-20),
+    )
+    header = f"{'format':<8}{'size':>8}{'components':>12}" + "".join(
+        f"{name:>16}" for name, _, _ in columns
+    )
+    lines = [header, "-" * len(header)]
+    for save_format, by_size in results.items():
+        for size, metrics in by_size.items():
+            baseline = baselines.get(save_format, {}).get(size)
+            row = f"{save_format:<8}{size:>8}{metrics['components']:>12}"
+            for _, metric, scale in columns:
+                change = (
+                    f"{metrics[metric] / baseline[metric] - 1:+.0%}"
+                    if baseline and baseline[metric]
+                    else "new"
+                )
+                row += f"{metrics[metric] * scale:>9.1f} {change:>6}"
+            lines.append(row)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument(
+        "--formats", nargs="+", default=list(serialization.FORMATS)
+    )
+    parser.add_argument("--baselines", type=Path, default=BASELINES)
+    parser.add_argument(
+        "--update-baselines",
+        action="store_true",
+        help="record these results as the baselines instead of checking them",
+    )
+    parser.add_argument("--components", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--worker", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _worker(*args.worker, args.components)
+        return []
+
+    baselines = {}
+    if args.baselines.exists():
+        baselines = json.loads(args.baselines.read_text())
+    results = run_suite(args.sizes, args.formats)
+    print(format_results(results, baselines))
+
+    if args.update_baselines:
+        for save_format, by_size in results.items():
+            baselines.setdefault(save_format, {}).update(by_size)
+        args.baselines.write_text(
+            json.dumps(baselines, indent=2, sort_keys=True) + "\n"
+        )
+        print(f"\nBaselines written to {args.baselines}")
+        return []
+
+    regressions = compare(results, baselines)
+    if regressions:
+        print("\nRegressions:\n" + "\n".join(regressions))
+    return regressions
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -6,6 +6,8 @@ from engine.components.component import Component
 from ..enums import Intention
 
 
+# Not slotted: ThwackAbility also derives from EnergyActor, and two slotted
+# bases that both add fields cannot be combined.
 @dataclass
 class Ability(Component):
     """
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..abilities.ability import Ability
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlModeAbility(Ability):
     """
     Describe a control-mode ability that swaps the active controller.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..abilities.ability import Ability
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugAbility(Ability):
     """
     Describe the debug toggle ability configuration.
@@ -5,7 +5,7 @@ from horderl import palettes
 from ..abilities.control_mode_ability import ControlModeAbility
 
 
-@dataclass
+@dataclass(slots=True)
 class DigHoleAbility(ControlModeAbility):
     """
     Describe the dig hole ability configuration.
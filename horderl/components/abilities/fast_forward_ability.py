@@ -5,7 +5,7 @@ from horderl import palettes
 from .control_mode_ability import ControlModeAbility
 
 
-@dataclass
+@dataclass(slots=True)
 class FastForwardAbility(ControlModeAbility):
     """
     Describe the fast-forward ability configuration.
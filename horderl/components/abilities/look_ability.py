@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .ability import Ability
 
 
-@dataclass
+@dataclass(slots=True)
 class LookAbility(Ability):
     """
     Describe the look-around ability configuration.
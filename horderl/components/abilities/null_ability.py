@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .ability import Ability
 
 
-@dataclass
+@dataclass(slots=True)
 class NullAbility(Ability):
     """
     Represent a placeholder ability with no behavior.
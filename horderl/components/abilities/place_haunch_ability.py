@@ -5,7 +5,7 @@ from horderl import palettes
 from .control_mode_ability import ControlModeAbility
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceHaunchAbility(ControlModeAbility):
     """
     Describe the place haunch ability configuration.
@@ -6,7 +6,7 @@ from horderl.components.abilities.control_mode_ability import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlantSaplingAbility(ControlModeAbility):
     """
     Describe the plant sapling ability configuration.
@@ -5,7 +5,7 @@ from horderl import palettes
 from .control_mode_ability import ControlModeAbility
 
 
-@dataclass
+@dataclass(slots=True)
 class SellAbility(ControlModeAbility):
     """
     Describe the sell things ability configuration.
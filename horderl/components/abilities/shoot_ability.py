@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .ability import Ability
 
 
-@dataclass
+@dataclass(slots=True)
 class ShootAbility(Ability):
     """
     Describe the ranged shoot ability configuration.
@@ -5,7 +5,7 @@ from engine.components import EnergyActor
 from .ability import Ability
 
 
-@dataclass
+@dataclass(slots=True)
 class ThwackAbility(Ability, EnergyActor):
     """
     Describe the thwack ability configuration and counters.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..components.events.attack_started_events import AttackStartListener
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityTracker(AttackStartListener):
     """
     Track the currently selected ability index for an entity.
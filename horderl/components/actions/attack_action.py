@@ -4,7 +4,7 @@ from engine import constants
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackAction(EnergyActor):
     """
     Instance of a live attack.
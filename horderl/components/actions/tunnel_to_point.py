@@ -5,7 +5,7 @@ from engine import constants
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class TunnelToPoint(EnergyActor):
     """
     Instance of a live attack.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class BombActor(EnergyActor):
     """
     Actor component that counts down to an explosion.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class Calendar(EnergyActor):
     """
     Actor component that tracks the passage of time.
@@ -16,4 +16,4 @@ class Calendar(EnergyActor):
     year: int = 1217
     status: str = ""
     energy_cost: int = EnergyActor.DAILY
-    round = 1
+    round: int = 1
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class HordelingSpawner(EnergyActor):
     """
     Hordelings will spawn at this object's location.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .animation_definition import AnimationDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatAnimationDefinition(AnimationDefinition):
     """
     Store the data needed to float an entity upward or rightward.
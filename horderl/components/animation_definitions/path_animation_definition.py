@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .animation_definition import AnimationDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class PathAnimationDefinition(AnimationDefinition):
     """
     Store the data needed to step an entity through a path.
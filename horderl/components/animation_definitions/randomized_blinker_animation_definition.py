@@ -6,7 +6,7 @@ from horderl import palettes
 from .animation_definition import AnimationDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class RandomizedBlinkerAnimationDefinition(AnimationDefinition):
     """
     Store the data needed to blink an entity with randomized timing.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class ResetOwnerAnimationDefinition(Component):
     """
     Mark an entity whose owner should be reset when it is deleted.
@@ -4,7 +4,7 @@ from typing import List, Tuple
 from .animation_definition import AnimationDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class SequenceAnimationDefinition(AnimationDefinition):
     """
     Store a sequence of appearance steps for an entity animation.
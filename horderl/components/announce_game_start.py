@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from ..components.events.start_game_events import GameStartListener
 
 
-@dataclass
+@dataclass(slots=True)
 class AnnounceGameStart(GameStartListener):
     """Tag entities that should announce the game start text."""
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple, Union
+from typing import ClassVar, FrozenSet, Tuple, Union
 
 from engine.components.component import Component
 from horderl import palettes
@@ -9,10 +9,13 @@ Color = Tuple[int, int, int]
 PaletteColor = Union[Color, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Appearance(Component):
     """
     Define an entity's base appearance.
+
+    Visual fields are watched so that renderers can redraw only the entities
+    whose appearance changed.
     """
 
     class RenderMode(str, Enum):
@@ -20,6 +23,10 @@ class Appearance(Component):
         HIGH_VEE = "HIGH_VEE"
         STEALTHY = "STEALTHY"
 
+    watched_fields: ClassVar[FrozenSet[str]] = frozenset(
+        {"symbol", "color", "bg_color", "render_mode"}
+    )
+
     symbol: str = " "
     color: PaletteColor = palettes.WHITE
     bg_color: PaletteColor = palettes.BACKGROUND
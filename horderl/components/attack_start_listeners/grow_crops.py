@@ -5,7 +5,7 @@ from horderl import palettes
 from horderl.components.events.attack_started_events import AttackStartListener
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowCrops(AttackStartListener):
     """Data-only marker for crops that grow at the start of an attack."""
 
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from horderl.components.events.attack_started_events import AttackStartListener
 
 
-@dataclass
+@dataclass(slots=True)
 class MovePeasantsIn(AttackStartListener):
     """Data-only marker for moving peasants indoors on attack start."""
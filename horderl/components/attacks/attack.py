@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Attack(Component):
     """
     Data-only base component for attacks.
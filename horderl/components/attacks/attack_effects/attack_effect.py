@@ -14,7 +14,7 @@ class AttackEffectType(str, Enum):
     KNOCKBACK = "knockback"
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackEffect(Component):
     """
     Data-only description of an attack effect applied by an attacker.
@@ -8,7 +8,7 @@ from horderl.components.attacks.attack_effects.attack_effect import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackEffectResolution(Component):
     """
     Queue item describing an attack effect resolution between two entities.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from horderl.components.attacks.attack import Attack
 
 
-@dataclass
+@dataclass(slots=True)
 class SiegeAttack(Attack):
     """
     Data-only marker for attacks that deal bonus damage to structures.
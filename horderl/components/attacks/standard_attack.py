@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from horderl.components.attacks.attack import Attack
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardAttack(Attack):
     """
     Data-only marker for a standard melee attack.
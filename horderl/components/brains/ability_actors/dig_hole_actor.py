@@ -4,7 +4,7 @@ from engine.components import EnergyActor
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class DigHoleActor(Brain):
     """
     Brain for digging holes and removing diggable entities.
@@ -5,7 +5,7 @@ from horderl.components.brains.ability_actors.place_thing_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceBombActor(PlaceThingActor):
     """Command component for placing bomb entities."""
 
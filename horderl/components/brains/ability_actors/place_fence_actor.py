@@ -5,7 +5,7 @@ from horderl.components.brains.ability_actors.place_thing_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceFenceActor(PlaceThingActor):
     """Command component for placing fence entities."""
 
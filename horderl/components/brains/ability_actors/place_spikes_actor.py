@@ -5,7 +5,7 @@ from horderl.components.brains.ability_actors.place_thing_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceSpikesActor(PlaceThingActor):
     """Command component for placing spike trap entities."""
 
@@ -5,7 +5,7 @@ from engine.components import EnergyActor
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceThingActor(Brain):
     """
     Brain for placing buildable objects adjacent to the player.
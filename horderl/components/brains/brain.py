@@ -4,7 +4,7 @@ from engine import constants
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class Brain(EnergyActor):
     """
     Store stack metadata for active brain components.
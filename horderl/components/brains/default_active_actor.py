@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
 
 from engine import constants
+from engine.components import transient
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class DefaultActiveActor(Brain):
     """
     Brain that selects and pursues targets for active hostile actors.
@@ -14,4 +18,5 @@ class DefaultActiveActor(Brain):
     """
 
     target: int = constants.INVALID
-    cost_map = None
+    # Rebuilt by brain_system every turn
+    cost_map: Optional[np.ndarray] = transient()
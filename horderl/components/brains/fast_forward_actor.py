@@ -4,7 +4,7 @@ from horderl.components.brains.brain import Brain
 from horderl.components.events.attack_started_events import AttackStartListener
 
 
-@dataclass
+@dataclass(slots=True)
 class FastForwardBrain(Brain, AttackStartListener):
     """
     Brain that fast-forwards time until interrupted.
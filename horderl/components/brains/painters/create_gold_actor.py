@@ -8,7 +8,7 @@ from horderl.components.brains.painters.painter_brain import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceGoldController(PainterBrain):
     """
     Painter controller data for placing gold nuggets.
@@ -8,7 +8,7 @@ from horderl.components.brains.painters.painter_brain import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceHordelingController(PainterBrain):
     """
     Painter controller data for placing hordelings.
@@ -15,7 +15,7 @@ class PainterTool(Enum):
     HORDELING = "hordeling"
 
 
-@dataclass
+@dataclass(slots=True)
 class PainterBrain(Brain):
     """
     Provide a base class for debug object placing controllers.
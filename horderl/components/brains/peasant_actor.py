@@ -5,7 +5,7 @@ from engine.components import EnergyActor
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class PeasantActor(Brain):
     """
     Brain controlling peasant movement and idle behavior.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerBrain(Brain):
     """
     Brain for player-controlled input.
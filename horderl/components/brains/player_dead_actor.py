@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerDeadBrain(Brain):
     """
     Brain that handles input when the player is dead.
@@ -4,7 +4,7 @@ from engine.components import EnergyActor
 from horderl.components.brains.brain import Brain
 
 
-@dataclass
+@dataclass(slots=True)
 class SleepingBrain(Brain):
     """
     Brain that sleeps for a fixed number of turns.
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
 
 from engine import constants
+from engine.components import transient
 from horderl.components.brains.brain import Brain
 from horderl.components.events.attack_started_events import AttackStartListener
 from horderl.components.season_reset_listeners.seasonal_actor import (
@@ -8,13 +12,13 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class StationaryAttackActor(Brain, SeasonResetListener, AttackStartListener):
     """
     Stand in place and attack any enemy in range.
     """
 
     target: int = constants.INVALID
-    cost_map = None
+    cost_map: Optional[np.ndarray] = transient()
     root_x: int = constants.INVALID
     root_y: int = constants.INVALID
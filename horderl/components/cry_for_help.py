@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class CryForHelp(Component):
     pass
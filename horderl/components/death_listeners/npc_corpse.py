@@ -4,7 +4,7 @@ from engine.components.component import Component
 from horderl import palettes
 
 
-@dataclass
+@dataclass(slots=True)
 class Corpse(Component):
     """Configure NPC corpse appearance spawned on death."""
 
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class OnDieEmitPeasantDied(Component):
     """
     Translate a peasant death into a population count decrement.
@@ -4,7 +4,7 @@ from engine.components.component import Component
 from horderl import palettes
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerCorpse(Component):
     """Configure the player corpse spawned on death."""
 
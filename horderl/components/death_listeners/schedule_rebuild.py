@@ -4,7 +4,7 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleRebuild(Component):
     """
     When this wall dies, set a delayed trigger to attempt to rebuild at the season
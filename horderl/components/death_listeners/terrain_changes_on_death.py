@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class TerrainChangedOnDeath(Component):
     """
     This entity is a part of the terrain and should notify anything that cares about
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from ..components.events.attack_events import OnAttackFinishedListener
 
 
-@dataclass
+@dataclass(slots=True)
 class DieOnAttackFinished(OnAttackFinishedListener):
     """Tag entities that should die after they finish an attack."""
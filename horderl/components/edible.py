@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Edible(Component):
     sleep_for: int = 3
@@ -22,6 +22,7 @@ class Intention(str, Enum):
     DALLY = "dally"
     SHOW_DEBUG_SCREEN = "wants_to_show_debug"
     SHOW_HELP = "show_help"
+    TOGGLE_CALL_PROFILE = "toggle_call_profile"
 
 
 class ControlMode(str, Enum):
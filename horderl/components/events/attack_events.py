@@ -3,14 +3,14 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackFinished(Component):
     """
     Emitted after an entity's attack has been processed.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class OnAttackFinishedListener(Component):
     """
     Respond to completed attacks.
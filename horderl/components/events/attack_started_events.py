@@ -9,7 +9,7 @@ class AttackStartListener(Component):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class AttackStarted(Component):
     """
     Emitted when the attack should begin.
@@ -4,7 +4,7 @@ from typing import List, Tuple
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class BreadcrumbsRequested(Component):
     """
     Request breadcrumb updates for an entity path.
@@ -16,7 +16,7 @@ class BreadcrumbsRequested(Component):
     path: List[Tuple[int, int]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BreadcrumbsCleared(Component):
     """
     Request cleanup of breadcrumb entities for an owner.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class ChargeAbilityEvent(Component):
     """
     Indicate that the player took an action.
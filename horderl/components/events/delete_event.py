@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Delete(Component):
     """
     Add this to an entity to have it delete itself after some time.
@@ -13,7 +13,7 @@ class Delete(Component):
     energy: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteListener(Component):
     """
     A world building step.
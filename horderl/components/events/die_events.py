@@ -4,7 +4,7 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Die(Component):
     """
     Emitted when an entity has died.
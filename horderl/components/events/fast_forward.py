@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class FastForward(EnergyActor):
     """
     Event actor that advances the calendar to a fixed day.
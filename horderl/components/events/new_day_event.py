@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class DayBegan(Component):
     """
     Add this to an entity to have it delete itself after some time.
@@ -12,7 +12,7 @@ class DayBegan(Component):
     day: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DayBeganListener(Component):
     """
     A world building step.
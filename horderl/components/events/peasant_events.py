@@ -3,28 +3,28 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class PeasantAddedListener(Component):
     """
     Respond to peasants moving in.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class PeasantAdded(Component):
     """
     Signal that a new peasant has moved in.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class PeasantDiedListener(Component):
     """
     Respond to peasant death events.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class PeasantDied(Component):
     """
     Signal that a peasant has died.
@@ -3,14 +3,14 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class QuitGameListener(Component):
     """
     Respond to a request to quit the game.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class QuitGame(Component):
     """
     Signal an intent to quit the game.
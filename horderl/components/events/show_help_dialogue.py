@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowHelpDialogue(EnergyActor):
     """Request that the help dialogue be shown."""
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class StartGame(Component):
     """
     Event triggered when a new game starts.
@@ -19,7 +19,7 @@ class StartGame(Component):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GameStartListener(Component):
     """
     Marker component for entities that respond to game start events.
@@ -5,7 +5,7 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class StepEvent(Component):
     """
     Emitted when the owning entity takes a step.
@@ -22,7 +22,7 @@ class StepListener(Component):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class EnterEvent(Component):
     """
     Emitted when the owning entity steps on another entity (if that entity cares).
@@ -3,14 +3,14 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class TerrainChangedEvent(Component):
     """
     Emitted when terrain has changed.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class TerrainChangedListener(Component):
     """
     Respond to terrain changes.
@@ -3,14 +3,14 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeCutEvent(Component):
     """
     Emitted when a tree has been cut.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeCutListener(Component):
     """
     Respond to tree cut events.
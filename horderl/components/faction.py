@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Faction(Component):
     class Options(str, enum.Enum):
         NONE = "none"
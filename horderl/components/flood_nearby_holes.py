@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class FloodHolesState(Component):
     """
     Record flood-fill timing state for the flood holes system.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Flooder(Component):
     """
     Mark an entity as a source of flood filling, with optional cooldown data.
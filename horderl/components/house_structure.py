@@ -1,13 +1,16 @@
 from dataclasses import dataclass
+from typing import ClassVar, FrozenSet
 
 from engine.components.component import Component
 from engine.types import EntityId
 
 
-@dataclass
+@dataclass(slots=True)
 class HouseStructure(Component):
     """Track the entity tiles that make up a house structure."""
 
+    indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"house_id"})
+
     house_id: EntityId = 0
     upgrade_level: int = 0
     is_destroyed: bool = False
@@ -1,10 +1,15 @@
 from dataclasses import dataclass
+from typing import ClassVar, FrozenSet
 
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Material(Component):
+    watched_fields: ClassVar[FrozenSet[str]] = frozenset(
+        {"blocks", "blocks_sight"}
+    )
+
     blocks: bool = False
     blocks_sight: bool = False
     indestructible: bool = False
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from horderl.components.events.step_event import EnterListener
 
 
-@dataclass
+@dataclass(slots=True)
 class DieOnEnter(EnterListener):
     """
     Data-only configuration for dying when stepped on.
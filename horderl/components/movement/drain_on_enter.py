@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..events.step_event import EnterListener
 
 
-@dataclass
+@dataclass(slots=True)
 class DrainOnEnter(EnterListener):
     """
     Data-only configuration for dealing damage when stepped on.
@@ -5,7 +5,7 @@ from ..events.dally_event import DallyListener
 from ..season_reset_listeners.seasonal_actor import SeasonResetListener
 
 
-@dataclass
+@dataclass(slots=True)
 class HealOnDally(DallyListener, AttackStartListener, SeasonResetListener):
     """
     Data-only configuration for healing after repeated dally actions.
@@ -4,6 +4,6 @@ from engine.components import EnergyActor
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Move(Component):
     energy_cost: int = EnergyActor.HOURLY
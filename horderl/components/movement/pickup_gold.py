@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..events.step_event import StepListener
 
 
-@dataclass
+@dataclass(slots=True)
 class PickupGoldOnStep(StepListener):
     """
     Data-only configuration for collecting gold when stepping on it.
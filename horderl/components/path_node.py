@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class PathNode(Component):
     """Store a single step in a precomputed path for animations."""
 
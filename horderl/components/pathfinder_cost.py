@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from typing import ClassVar, FrozenSet
 
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class PathfinderCost(Component):
+    watched_fields: ClassVar[FrozenSet[str]] = frozenset({"cost"})
+
     cost: int = 100
@@ -4,7 +4,7 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Breadcrumb(Component):
     """
     Represent a breadcrumb entity used for pathfinding visualization.
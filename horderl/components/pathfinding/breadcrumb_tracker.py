@@ -4,7 +4,7 @@ from typing import List, Tuple
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class BreadcrumbTracker(Component):
     """
     Store breadcrumb visualization data for an entity.
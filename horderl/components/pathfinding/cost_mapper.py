@@ -15,7 +15,7 @@ class CostMapperType(Enum):
     STRAIGHT_LINE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class CostMapper(Component):
     """
     Data-only component for pathfinding cost mapping configuration.
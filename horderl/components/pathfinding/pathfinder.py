@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Pathfinder(Component):
     """Data-only component indicating an entity can request pathfinding."""
 
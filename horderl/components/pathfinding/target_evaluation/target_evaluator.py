@@ -12,7 +12,7 @@ class TargetEvaluatorType(Enum):
     ALLY = "ally"
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetEvaluator(Component):
     """
     Data-only base component for pathfinding target evaluation.
@@ -6,7 +6,7 @@ from ..components.events.peasant_events import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Population(PeasantAddedListener, PeasantDiedListener):
     """Track the current population count."""
 
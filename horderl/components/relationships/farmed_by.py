@@ -4,6 +4,6 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class FarmedBy(Component):
     farmer: str = constants.INVALID
@@ -5,7 +5,7 @@ from engine import constants
 from ..tags.tag import Tag
 
 
-@dataclass
+@dataclass(slots=True)
 class Resident(Tag):
     resident: int = constants.INVALID
     value: str = "house"
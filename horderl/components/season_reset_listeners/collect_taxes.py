@@ -5,6 +5,6 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectTaxes(SeasonResetListener):
     """Data-only marker for collecting taxes on season reset."""
@@ -5,7 +5,7 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectTaxesForKing(SeasonResetListener):
     """
     Data-only marker for collecting taxes for the king.
@@ -5,6 +5,6 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CropsDieInWinter(SeasonResetListener):
     """Data-only marker for crops that die in winter."""
@@ -5,6 +5,6 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class DieOnSeasonReset(SeasonResetListener):
     """Data-only marker for death triggered on season reset."""
@@ -5,6 +5,6 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractContractFees(SeasonResetListener):
     """Data-only marker for contract fee extraction on season reset."""
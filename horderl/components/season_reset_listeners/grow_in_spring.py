@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from horderl.components.events.new_day_event import DayBeganListener
 
 
-@dataclass
+@dataclass(slots=True)
 class GrowIntoTree(DayBeganListener):
     """Track saplings that should grow into trees after enough warm days."""
 
@@ -5,6 +5,6 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MovePeasantsOut(SeasonResetListener):
     """Data-only marker for moving peasants out on season reset."""
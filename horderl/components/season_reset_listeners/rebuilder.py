@@ -5,7 +5,7 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Rebuilder(SeasonResetListener):
     """
     Data-only marker for rebuilding houses on season reset.
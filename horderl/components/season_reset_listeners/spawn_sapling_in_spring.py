@@ -5,7 +5,7 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnSaplingInSpring(SeasonResetListener):
     """
     Data-only marker for spawning saplings in spring.
@@ -5,6 +5,6 @@ from horderl.components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class UpgradeHouse(SeasonResetListener):
     """Data-only marker for upgrading houses on season reset."""
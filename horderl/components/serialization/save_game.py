@@ -4,7 +4,7 @@ from typing import Dict
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class SaveGame(Component):
     """
     Hold configuration for a save game request.
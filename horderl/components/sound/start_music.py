@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class StartMusic(Component):
     """
     Configure the music track to play at game start or season reset.
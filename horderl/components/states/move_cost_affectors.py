@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar, FrozenSet
 
 from engine.components.component import Component
 
@@ -15,10 +16,12 @@ class MoveCostAffectorType(Enum):
     EASY_TERRAIN = "easy_terrain"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MoveCostAffector(Component):
     """
     Store a movement cost modifier for an entity or terrain tile.
     """
 
+    indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"affector_type"})
+
     affector_type: MoveCostAffectorType
@@ -4,7 +4,7 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Stomach(Component):
     """Track an entity stored inside another entity."""
 
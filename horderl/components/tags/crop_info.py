@@ -4,7 +4,7 @@ from engine import constants
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class CropInfo(Component):
     field_id: int = constants.INVALID
     farmer_id: int = constants.INVALID
@@ -4,7 +4,7 @@ from typing import List
 from ..tags.tag import Tag, TagType
 
 
-@dataclass
+@dataclass(slots=True)
 class IceTag(Tag):
     """Tag that marks frozen water tiles and tracks frozen state."""
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar, FrozenSet
 
 from engine.components.component import Component
 
@@ -17,8 +18,10 @@ class TagType(str, Enum):
     ICE = "ice"
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag(Component):
     """Represent a categorical tag assigned to an entity."""
 
+    indexed_fields: ClassVar[FrozenSet[str]] = frozenset({"tag_type"})
+
     tag_type: TagType = TagType.NONE
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..tags.tag import Tag, TagType
 
 
-@dataclass
+@dataclass(slots=True)
 class WaterTag(Tag):
     """Tag that marks water tiles and tracks contamination."""
 
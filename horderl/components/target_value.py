@@ -10,6 +10,6 @@ CROPS = 75
 DEFAULT = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetValue(Component):
     value: int = DEFAULT
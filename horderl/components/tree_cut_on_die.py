@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeCutOnDeath(Component):
     """
     Signal that a tree has been cut down.
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class WantsToShowDebug(Component):
     """
     Marker component that requests the debug menu to be displayed.
@@ -6,7 +6,7 @@ from ..events.attack_started_events import AttackStartListener
 from ..season_reset_listeners.seasonal_actor import SeasonResetListener
 
 
-@dataclass
+@dataclass(slots=True)
 class FreezeWater(EnergyActor, AttackStartListener, SeasonResetListener):
     """
     Data-only marker for freezing/thawing water based on weather state.
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class SnowFall(EnergyActor):
     """
     Data-only marker for snowfall and grass growth based on weather state.
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from engine.components.component import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class Weather(Component):
     """Store weather state and configuration for the calendar."""
 
@@ -6,7 +6,7 @@ from ..components.season_reset_listeners.seasonal_actor import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldBeauty(TreeCutListener, SeasonResetListener):
     """Track world beauty values affected by tree cutting."""
 
@@ -16,7 +16,7 @@ DEFAULT_RIVER_RAPIDS: int = 3000
 DEFAULT_TREE_CUT_ANGER: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldParameters(Component):
     """Data container describing parameters for world generation."""
 
@@ -46,4 +46,4 @@ class WorldParameters(Component):
 
     world_seed: int | str = field(default_factory=time.time_ns)
 
-    flower_color = None
+    flower_color: tuple | None = None
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from engine.components import EnergyActor
 
 
-@dataclass
+@dataclass(slots=True)
 class WrathEffect(EnergyActor):
     """
     Trigger a wrathful purge that removes hordelings and spawners.
@@ -151,6 +151,11 @@ class Config:
     log_dir: str = "logs"
     log_file: str | None = "horderl.log"
     log_console_enabled: bool = False
+    log_queue_enabled: bool = False
+    log_queue_size: int = 10000
+    log_queue_policy: str = "drop"
+    frame_profiler_enabled: bool = False
+    trace_path: str | None = None
     config_version: int = CONFIG_VERSION
 
     def __post_init__(self) -> None:
@@ -223,6 +228,11 @@ _OPTIONS_FIELD_MAP = {
     "log-dir": "log_dir",
     "log-file": "log_file",
     "log-console-enabled": "log_console_enabled",
+    "log-queue-enabled": "log_queue_enabled",
+    "log-queue-size": "log_queue_size",
+    "log-queue-policy": "log_queue_policy",
+    "frame-profiler-enabled": "frame_profiler_enabled",
+    "trace-path": "trace_path",
     "config_version": "config_version",
 }
 
@@ -266,6 +276,11 @@ def _validate_types(values: Dict[str, Any]) -> None:
         "log_dir": str,
         "log_file": (str, type(None)),
         "log_console_enabled": bool,
+        "log_queue_enabled": bool,
+        "log_queue_size": int,
+        "log_queue_policy": str,
+        "frame_profiler_enabled": bool,
+        "trace_path": (str, type(None)),
         "config_version": int,
     }
     for color_field in _COLOR_FIELDS:
@@ -104,8 +104,7 @@ def _add_house(scene, x, y) -> EntityId:
         corner_y = plot_corner[1]
         farm_plot = get_box((corner_x, corner_y), (corner_x + 1, corner_y + 1))
 
-        coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-        if farm_plot.isdisjoint(coords):
+        if not any(scene.cm.at(px, py) for px, py in farm_plot):
             # safe to reuse old coords, can't overlap with this home
             finalized_plot = [x for x in farm_plot]
 
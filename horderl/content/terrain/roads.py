@@ -103,20 +103,20 @@ def _draw_road(
     cost_map,
     trim_start: int = 0,
 ):
+    # Roads drawn below are appended after it, so the first marker is fixed.
+    first_marker = next(
+        (
+            c
+            for c in scene.cm.get(Coordinates)
+            if scene.cm.get_one(RoadMarker, entity=c.entity)
+        ),
+        None,
+    )
     for node in _road_between(cost_map, start, end, trim_start=trim_start):
-        coords = scene.cm.get(
-            Coordinates,
-            query=lambda c: scene.cm.get_one(RoadMarker, entity=c.entity),
-        )
-        if coords and coords[0].x == node[0] and coords[0].y == node[1]:
+        if first_marker and first_marker.is_at_point(node):
             break
-        other_coords = scene.cm.get(
-            Coordinates,
-            query=lambda c: list(c.position) == node,
-            project=lambda c: c.entity,
-        )
         is_water = False
-        for other in other_coords:
+        for other in scene.cm.at(node[0], node[1]):
             is_water = scene.cm.get_one(WaterTag, entity=other)
             scene.cm.delete(other)
         if is_water:
@@ -47,7 +47,8 @@ def make_wall_tree(x, y):
             - component_list (list): A list of components that define the tree's behavior
 
     """
-    entity_id = core.get_id()
+    entity_id, *component_ids = core.get_ids(5)
+    ids = iter(component_ids)
     return (
         entity_id,
         [
@@ -58,15 +59,24 @@ def make_wall_tree(x, y):
                 static=True,
                 description=wall_tree_description,
             ),
-            Coordinates(entity=entity_id, x=x, y=y, priority=PRIORITY_MEDIUM),
+            Coordinates(
+                id=next(ids),
+                entity=entity_id,
+                x=x,
+                y=y,
+                priority=PRIORITY_MEDIUM,
+            ),
             Appearance(
+                id=next(ids),
                 entity=entity_id,
                 symbol="♣",
                 color=palettes.WALL_TREE,
                 bg_color=palettes.BACKGROUND,
             ),
-            Material(entity=entity_id, blocks=True, blocks_sight=True),
-            PathfinderCost(entity=entity_id, cost=100),
+            Material(
+                id=next(ids), entity=entity_id, blocks=True, blocks_sight=True
+            ),
+            PathfinderCost(id=next(ids), entity=entity_id, cost=100),
         ],
     )
 
@@ -97,7 +107,8 @@ def make_tree(x, y):
               for handling what happens when the tree is cut down
 
     """
-    entity_id = core.get_id()
+    entity_id, *component_ids = core.get_ids(12)
+    ids = iter(component_ids)
     return (
         entity_id,
         [
@@ -108,21 +119,34 @@ def make_tree(x, y):
                 static=True,
                 description=tree_description,
             ),
-            Coordinates(entity=entity_id, x=x, y=y, priority=PRIORITY_MEDIUM),
-            Attributes(entity=entity_id, hp=5, max_hp=5),
-            Corpse(entity=entity_id, symbol="%", color=palettes.WOOD),
-            Faction(entity=entity_id, faction=Faction.Options.PEASANT),
+            Coordinates(
+                id=next(ids),
+                entity=entity_id,
+                x=x,
+                y=y,
+                priority=PRIORITY_MEDIUM,
+            ),
+            Attributes(id=next(ids), entity=entity_id, hp=5, max_hp=5),
+            Corpse(
+                id=next(ids), entity=entity_id, symbol="%", color=palettes.WOOD
+            ),
+            Faction(
+                id=next(ids), entity=entity_id, faction=Faction.Options.PEASANT
+            ),
             Appearance(
+                id=next(ids),
                 entity=entity_id,
                 symbol="♣",
                 color=palettes.FOILAGE_C,
                 bg_color=palettes.BACKGROUND,
             ),
-            Material(entity=entity_id, blocks=True, blocks_sight=True),
-            Tag(entity=entity_id, tag_type=TagType.TREE),
-            TerrainChangedOnDeath(entity=entity_id),
-            Sellable(entity=entity_id, value=2),
-            PathfinderCost(entity=entity_id, cost=20),
-            TreeCutOnDeath(entity=entity_id),
+            Material(
+                id=next(ids), entity=entity_id, blocks=True, blocks_sight=True
+            ),
+            Tag(id=next(ids), entity=entity_id, tag_type=TagType.TREE),
+            TerrainChangedOnDeath(id=next(ids), entity=entity_id),
+            Sellable(id=next(ids), entity=entity_id, value=2),
+            PathfinderCost(id=next(ids), entity=entity_id, cost=20),
+            TreeCutOnDeath(id=next(ids), entity=entity_id),
         ],
     )
@@ -23,28 +23,43 @@ from horderl.components.tags.water_tag import WaterTag
 
 
 def make_water(x, y, rapidness=5000):
-    entity_id = core.get_id()
+    entity_id, *component_ids = core.get_ids(11)
+    ids = iter(component_ids)
     water_color = random.choice([palettes.LIGHT_WATER, palettes.WATER])
     return (
         entity_id,
         [
             Entity(id=entity_id, entity=entity_id, name="water", static=True),
             Appearance(
+                id=next(ids),
                 entity=entity_id,
                 symbol="~",
                 color=water_color,
                 bg_color=palettes.BACKGROUND,
             ),
-            Coordinates(entity=entity_id, x=x, y=y, priority=PRIORITY_LOWEST),
-            Material(entity=entity_id, blocks=False, blocks_sight=False),
+            Coordinates(
+                id=next(ids),
+                entity=entity_id,
+                x=x,
+                y=y,
+                priority=PRIORITY_LOWEST,
+            ),
+            Material(
+                id=next(ids),
+                entity=entity_id,
+                blocks=False,
+                blocks_sight=False,
+            ),
             MoveCostAffector(
+                id=next(ids),
                 entity=entity_id,
                 affector_type=MoveCostAffectorType.DIFFICULT_TERRAIN,
             ),
-            Diggable(entity=entity_id),
-            Flooder(entity=entity_id),
-            PathfinderCost(entity=entity_id, cost=10),
+            Diggable(id=next(ids), entity=entity_id),
+            Flooder(id=next(ids), entity=entity_id),
+            PathfinderCost(id=next(ids), entity=entity_id, cost=10),
             RandomizedBlinkerAnimationDefinition(
+                id=next(ids),
                 entity=entity_id,
                 new_symbol="~",
                 new_color=palettes.WATER,
@@ -52,14 +67,15 @@ def make_water(x, y, rapidness=5000):
                 timer_delay=rapidness,
                 next_update=core.time_ms() + random.randint(0, rapidness),
             ),
-            WaterTag(entity=entity_id, is_dirty=False),
-            DrainOnEnter(entity=entity_id, damage=1),
+            WaterTag(id=next(ids), entity=entity_id, is_dirty=False),
+            DrainOnEnter(id=next(ids), entity=entity_id, damage=1),
         ],
     )
 
 
 def make_swampy_water(x, y, rapidness):
-    entity_id = core.get_id()
+    entity_id, *component_ids = core.get_ids(11)
+    ids = iter(component_ids)
     water_color = random.choice([palettes.GRASS, palettes.WATER])
     return (
         entity_id,
@@ -71,21 +87,35 @@ def make_swampy_water(x, y, rapidness):
                 static=True,
             ),
             Appearance(
+                id=next(ids),
                 entity=entity_id,
                 symbol="~",
                 color=water_color,
                 bg_color=palettes.BACKGROUND,
             ),
-            Coordinates(entity=entity_id, x=x, y=y, priority=PRIORITY_LOWEST),
-            Material(entity=entity_id, blocks=False, blocks_sight=False),
+            Coordinates(
+                id=next(ids),
+                entity=entity_id,
+                x=x,
+                y=y,
+                priority=PRIORITY_LOWEST,
+            ),
+            Material(
+                id=next(ids),
+                entity=entity_id,
+                blocks=False,
+                blocks_sight=False,
+            ),
             MoveCostAffector(
+                id=next(ids),
                 entity=entity_id,
                 affector_type=MoveCostAffectorType.DIFFICULT_TERRAIN,
             ),
-            Diggable(entity=entity_id),
-            Flooder(entity=entity_id),
-            PathfinderCost(entity=entity_id, cost=10),
+            Diggable(id=next(ids), entity=entity_id),
+            Flooder(id=next(ids), entity=entity_id),
+            PathfinderCost(id=next(ids), entity=entity_id, cost=10),
             RandomizedBlinkerAnimationDefinition(
+                id=next(ids),
                 entity=entity_id,
                 new_symbol="~",
                 new_color=palettes.GRASS,
@@ -93,8 +123,8 @@ def make_swampy_water(x, y, rapidness):
                 timer_delay=rapidness * 4,
                 next_update=core.time_ms() + random.randint(0, rapidness * 4),
             ),
-            WaterTag(entity=entity_id, is_dirty=True),
-            DrainOnEnter(entity=entity_id, damage=1),
+            WaterTag(id=next(ids), entity=entity_id, is_dirty=True),
+            DrainOnEnter(id=next(ids), entity=entity_id, damage=1),
         ],
     )
 
@@ -1,4 +1,6 @@
 from engine.game_scene_controller import GameSceneController
+from engine.logging import get_logger
+from engine.tracing import TraceRecorder
 from engine.ui.gui import Gui
 from engine.ui.gui_adapter import GuiAdapter
 from horderl import palettes
@@ -20,11 +22,24 @@ def build_game_controller(config) -> GameSceneController:
     game = GameSceneController(
         t("game.title"), config, gui, ui_context, TRACKS
     )
+    game.profiler.set_enabled(config.frame_profiler_enabled)
+    if config.trace_path:
+        game.profiler.set_tracer(TraceRecorder())
     game.push_scene(get_start_menu())
     return game
 
 
 def start_game(config) -> GameSceneController:
     game = build_game_controller(config)
-    game.start()
+    try:
+        game.start()
+    finally:
+        from horderl.systems.debug_menu import stop_call_profile
+
+        paths = stop_call_profile(game.profiler)
+        if paths is not None:
+            get_logger(__name__).info("Wrote call profile to %s", paths[0])
+        if game.profiler.tracer is not None:
+            path = game.profiler.tracer.save(config.trace_path)
+            get_logger(__name__).info("Wrote frame trace to %s", path)
     return game
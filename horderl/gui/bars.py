@@ -70,11 +70,7 @@ class HordelingBar(Bar):
     mg_color: tuple = palettes.BLOOD
 
     def update(self, scene, dt_ms: int):
-        hordelings = len(
-            scene.cm.get(
-                Tag, query=lambda tag: tag.tag_type == TagType.HORDELING
-            )
-        )
+        hordelings = len(scene.cm.get_by(Tag, tag_type=TagType.HORDELING))
         self.value = hordelings
         self.max_value = hordelings
 
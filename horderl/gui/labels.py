@@ -141,6 +141,31 @@ class SpeedLabel(GuiElement):
         )
 
 
+class SavingLabel(GuiElement):
+    """
+    Show that an autosave is still being written in the background.
+    """
+
+    def __init__(self, x, y):
+        super().__init__(x, y, name="saving-label")
+        self.value = ""
+
+    def update(self, scene, dt_ms: int):
+        self.value = t("label.saving") if scene.is_saving() else ""
+
+    def render(self, panel):
+        """
+        Draw the label onto the panel.
+        """
+        panel.print(
+            self.x,
+            self.y,
+            self.value,
+            fg=palettes.LIGHT_WATER,
+            bg=palettes.BACKGROUND,
+        )
+
+
 class AbilityLabel(GuiElement):
     def __init__(self, x, y):
         super().__init__(x, y, name="hindered-label")
@@ -61,6 +61,12 @@ class PlayWindow(GuiElement):
             width, height, order="F"
         )  # buffer console
 
+        # entities drawn over the terrain, redrawn only where they change
+        self.entity_layer = None
+        self.memory_layer = None
+        self.entity_mask = None
+        self.memory_mask = None
+
     def on_load(self) -> None:
         self.regenerate_grass()
 
@@ -71,38 +77,13 @@ class PlayWindow(GuiElement):
         self.shadow_terrain_console.blit(self.memory_console)
         self.terrain_console.blit(self.console)
 
-        coordinates = self.cm.get(Coordinates)
-        coordinates = [c for c in coordinates]
-        coordinates = sorted(coordinates, key=lambda c: c.priority)
-        for coord in coordinates:
-            appearance = self.cm.get_one(Appearance, entity=coord.entity)
-            if appearance:
-                appearance_tile = appearance_to_tile(appearance)
-                if appearance.render_mode == Appearance.RenderMode.NORMAL:
-                    hidden_tile = (
-                        appearance_tile[0],
-                        (*palettes.SHADOW, 255),
-                        (*palettes.BACKGROUND, 255),
-                    )
-
-                    self.console.rgba[coord.x, coord.y] = appearance_tile
-                    self.memory_console.rgba[coord.x, coord.y] = hidden_tile
-                elif appearance.render_mode == Appearance.RenderMode.STEALTHY:
-                    self.console.rgba[coord.x, coord.y] = appearance_tile
-                elif appearance.render_mode == Appearance.RenderMode.HIGH_VEE:
-                    color = appearance.color
-                    hidden_tile = (
-                        appearance_tile[0],
-                        (*color, 255),
-                        (*palettes.BACKGROUND, 255),
-                    )
-
-                    self.console.rgba[coord.x, coord.y] = appearance_tile
-                    self.memory_console.rgba[coord.x, coord.y] = hidden_tile
-                else:
-                    raise ValueError(
-                        f"Unrecognized render mode {appearance.render_mode}"
-                    )
+        self._update_entity_layers()
+        self.console.rgba[self.entity_mask] = self.entity_layer[
+            self.entity_mask
+        ]
+        self.memory_console.rgba[self.memory_mask] = self.memory_layer[
+            self.memory_mask
+        ]
 
         buffer = np.where(
             self.visibility_map, self.console.rgba, self.memory_console.rgba
@@ -118,6 +99,80 @@ class PlayWindow(GuiElement):
             height=self.height,
         )
 
+    def _update_entity_layers(self) -> None:
+        """
+        Bring the cached entity layers up to date.
+
+        Only the tiles whose Coordinates or Appearance changed since the last
+        frame are redrawn; everything is redrawn after a load or a clear.
+        """
+        reader = self.cm.track(Coordinates, Appearance, key=__name__)
+        changes = reader.drain()
+        if changes.rebuild or self.entity_layer is None:
+            self._rebuild_entity_layers()
+            return
+
+        for x, y in self.cm.changed_tiles(changes):
+            if not self._in_bounds(x, y):
+                continue
+            self.entity_mask[x, y] = False
+            self.memory_mask[x, y] = False
+            rows = []
+            for coords in self.cm.coordinates_at(x, y):
+                appearance = self.cm.get_one(Appearance, entity=coords.entity)
+                if appearance:
+                    rows.append((coords, appearance))
+            for _, appearance in sorted(rows, key=_draw_order):
+                self._draw_entity(x, y, appearance)
+
+    def _rebuild_entity_layers(self) -> None:
+        dtype = self.console.rgba.dtype
+        shape = (self.width, self.height)
+        self.entity_layer = np.zeros(shape, dtype=dtype)
+        self.memory_layer = np.zeros(shape, dtype=dtype)
+        self.entity_mask = np.zeros(shape, dtype=bool)
+        self.memory_mask = np.zeros(shape, dtype=bool)
+        rows = sorted(self.cm.query(Coordinates, Appearance), key=_draw_order)
+        for coords, appearance in rows:
+            if self._in_bounds(coords.x, coords.y):
+                self._draw_entity(coords.x, coords.y, appearance)
+
+    def _draw_entity(self, x: int, y: int, appearance: Appearance) -> None:
+        appearance_tile = appearance_to_tile(appearance)
+        if appearance.render_mode == Appearance.RenderMode.NORMAL:
+            hidden_tile = (
+                appearance_tile[0],
+                (*palettes.SHADOW, 255),
+                (*palettes.BACKGROUND, 255),
+            )
+            self._draw_tile(x, y, appearance_tile, hidden_tile)
+        elif appearance.render_mode == Appearance.RenderMode.STEALTHY:
+            self._draw_tile(x, y, appearance_tile)
+        elif appearance.render_mode == Appearance.RenderMode.HIGH_VEE:
+            color = appearance.color
+            hidden_tile = (
+                appearance_tile[0],
+                (*color, 255),
+                (*palettes.BACKGROUND, 255),
+            )
+            self._draw_tile(x, y, appearance_tile, hidden_tile)
+        else:
+            raise ValueError(
+                f"Unrecognized render mode {appearance.render_mode}"
+            )
+
+    def _draw_tile(self, x: int, y: int, tile: tuple, hidden_tile=None):
+        self.entity_layer[x, y] = tile
+        self.entity_mask[x, y] = True
+        if hidden_tile is not None:
+            self.memory_layer[x, y] = hidden_tile
+            self.memory_mask[x, y] = True
+
+    def _in_bounds(self, x: int, y: int) -> bool:
+        if x is None or y is None:
+            return False
+        return 0 <= x < self.width and 0 <= y < self.height
+
     def regenerate_grass(self):
         memory_color = palettes.SHADOW
         for y in range(self.config.map_height):
@@ -194,3 +249,10 @@ class PlayWindow(GuiElement):
             (*palettes.SHADOW, 255),
             (*palettes.BACKGROUND, 255),
         )
+
+
+def _draw_order(row) -> tuple:
+    # Ties on priority are broken by id so that a redrawn tile stacks its
+    # entities the same way a full redraw would.
+    coords = row[0]
+    return coords.priority, coords.id
@@ -0,0 +1,58 @@
+from horderl.engine_adapter import GuiElement
+
+from .. import palettes
+
+# How often the overlay re-reads the profiler, so it does not cost a frame
+REFRESH_MS = 500
+
+
+class ProfilerOverlay(GuiElement):
+    """
+    Show the costliest frame profiler sections on screen.
+    """
+
+    def __init__(self, x, y, profiler, rows=12):
+        super().__init__(x, y, name="profiler-overlay")
+        self.profiler = profiler
+        self.rows = rows
+        self.lines = []
+        self.since_refresh = REFRESH_MS
+
+    def update(self, scene, dt_ms: int):
+        self.since_refresh += dt_ms
+        if self.since_refresh < REFRESH_MS:
+            return
+        self.since_refresh = 0
+        self.lines = format_stats(self.profiler.stats()[: self.rows])
+
+    def render(self, panel):
+        """
+        Draw the table in the top left corner of the overlay position.
+        """
+        for offset, line in enumerate(self.lines):
+            panel.print(
+                self.x,
+                self.y + offset,
+                line,
+                fg=palettes.GOLD,
+                bg=palettes.BACKGROUND,
+            )
+
+
+def format_stats(stats):
+    """
+    Lay profiler stats out as fixed-width text rows.
+
+    Args:
+        stats: SectionStats entries, in display order.
+
+    Returns:
+        list[str]: A header row followed by one row per section.
+    """
+    lines = [f"{'ms':<14}{'p50':>6}{'p95':>6}{'max':>6}"]
+    for entry in stats:
+        lines.append(
+            f"{entry.name[:14]:<14}"
+            f"{entry.p50_ms:>6.1f}{entry.p95_ms:>6.1f}{entry.max_ms:>6.1f}"
+        )
+    return lines
@@ -33,12 +33,14 @@ from horderl.gui.labels import (
     GoldLabel,
     HordeStatusLabel,
     Label,
+    SavingLabel,
     SpeedLabel,
     VillageNameLabel,
 )
 from horderl.gui.message_box import MessageBox
 from horderl.gui.play_window import PlayWindow
 from horderl.gui.popup_message import PopupMessage
+from horderl.gui.profiler_overlay import ProfilerOverlay
 from horderl.systems import act, control_turns, move, update_senses_system
 from horderl.systems.animation_controller_system import (
     run as run_animation_controllers,
@@ -160,7 +162,8 @@ class DefendScene(GameScene):
         anchor.add_element(CalendarLabel(1, 0))
         anchor.add_element(GoldLabel(1, 0))
         anchor.add_element(AbilityLabel(1, 0))
-        anchor.add_space(1)
+        # blank unless an autosave is being written
+        anchor.add_element(SavingLabel(1, 0))
 
         anchor.add_element(VillageNameLabel(1, 6))
         anchor.add_element(Label(1, 7, "Peasants"))
@@ -174,6 +177,10 @@ class DefendScene(GameScene):
 
         self.add_gui_element(anchor)
         self.add_gui_element(self.play_window)
+        if self.profiler.enabled:
+            self.add_gui_element(
+                ProfilerOverlay(self.play_window.x + 1, 1, self.profiler)
+            )
         self.cm.add(LoadClasses(entity=self.player))
 
         if self.from_file:
@@ -221,6 +228,9 @@ class DefendScene(GameScene):
         This structured approach ensures game systems are processed in the correct order,
         maintaining game logic consistency.
 
+        Each system and Updateable runs through the frame profiler, so its cost per
+        frame can be inspected when profiling is enabled.
+
         """
         if self.has_modal_gui():
             return
@@ -231,8 +241,10 @@ class DefendScene(GameScene):
         # as an Updeatable object that performs all initialization it needs to, which is a typical
         # game engine pattern.
         self.logger.debug("==== Beginning DefendScene update at dt=%s", dt_ms)
-        run_serialization_system(self)
-        build_world_system.run(self)  # only runs once due to component gates
+        profile = self.profiler.call
+        profile("serialization", run_serialization_system, self)
+        # only runs once due to component gates
+        profile("build_world", build_world_system.run, self)
 
         world_building_control = self.cm.get_one(
             WorldbuildingControl, entity=core.get_id("world")
@@ -243,26 +255,30 @@ class DefendScene(GameScene):
 
         for updateable in self.cm.get(Updateable):
             self.logger.debug("Updating Updateable: %s", updateable)
-            updateable.update(self, dt_ms)
+            profile(type(updateable).__name__, updateable.update, self, dt_ms)
 
         # legacy systems
-        run_animation_controllers(self, dt_ms)
-        run_flood_holes(self)
-        run_audio_system(self)
-        run_weather_system(self)
-        run_death_listeners(self)
-        run_start_game_system(self)
-        run_season_reset_system(self)
-        run_attack_start_system(self)
-        run_population_system(self)
-        run_world_beauty_system(self)
-        run_die_on_attack_finished_system(self)
-        run_event_system(self)
-        run_movement_event_system(self)
-        act.run(self)
-        move.run(self)
-        update_senses_system.run(self)
-        control_turns.run(self)
+        profile(
+            "animation_controllers", run_animation_controllers, self, dt_ms
+        )
+        profile("flood_holes", run_flood_holes, self)
+        profile("audio", run_audio_system, self)
+        profile("weather", run_weather_system, self)
+        profile("death_listeners", run_death_listeners, self)
+        profile("start_game", run_start_game_system, self)
+        profile("season_reset", run_season_reset_system, self)
+        profile("attack_start", run_attack_start_system, self)
+        profile("population", run_population_system, self)
+        profile("world_beauty", run_world_beauty_system, self)
+        profile(
+            "die_on_attack_finished", run_die_on_attack_finished_system, self
+        )
+        profile("event", run_event_system, self)
+        profile("movement_event", run_movement_event_system, self)
+        profile("act", act.run, self)
+        profile("move", move.run, self)
+        profile("update_senses", update_senses_system.run, self)
+        profile("control_turns", control_turns.run, self)
         self.logger.debug("==== Completed DefendScene update at dt=%s", dt_ms)
 
     def message(self, text: str, color: Tuple[int, int, int] = palettes.MEAT):
@@ -6,6 +6,8 @@ from horderl.gui.easy_menu import EasyMenu
 from horderl.gui.labels import Label
 from horderl.i18n import t
 from horderl.scenes.defend_scene import DefendScene
+from horderl.systems.actor_system import format_timecode
+from horderl.systems.serialization_system import SUMMARY
 
 
 class LoadMenuScene(GameScene):
@@ -37,10 +39,17 @@ class LoadMenuScene(GameScene):
 
     def build_menu(self):
         files = [file for file in os.listdir(".") if file.endswith(".world")]
+        options = {}
+        for file_name in files:
+            label = describe_save(file_name, self.read_save_info(file_name))
+            # Two saves can describe the same village
+            if label in options:
+                label = file_name
+            options[label] = self.get_world_loader(file_name)
 
         return EasyMenu(
             t("menu.load_prompt"),
-            {world: self.get_world_loader(world) for world in files},
+            options,
             self.config.inventory_width,
             self.config,
             on_escape=lambda: self.pop(),
@@ -55,3 +64,35 @@ class LoadMenuScene(GameScene):
     def load_world(self, file_name):
         self.pop()
         self.controller.push_scene(DefendScene(from_file=file_name))
+
+
+def describe_save(file_name, info) -> str:
+    """
+    Build a load menu label from a save's info block.
+
+    Args:
+        file_name: The save's file name, used when the save has no summary.
+        info: The save's info, as read by GameScene.read_save_info, or None.
+
+    Returns:
+        str: The village, date and population, or the file name for saves
+        written before summaries were saved.
+    """
+    extra = info["extra"] if info else None
+    summary = extra.get(SUMMARY) if extra else None
+    if not summary:
+        return file_name
+    if "season" not in summary:
+        return t(
+            "menu.load_entry_undated",
+            village=summary["village"],
+            population=summary["population"],
+        )
+    return t(
+        "menu.load_entry",
+        village=summary["village"],
+        timecode=format_timecode(
+            summary["season"], summary["day"], summary["year"]
+        ),
+        population=summary["population"],
+    )
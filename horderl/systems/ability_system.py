@@ -204,9 +204,7 @@ def _apply_null(scene, _dispatcher_id: int, _ability: NullAbility) -> None:
 def _apply_shoot(scene, dispatcher_id: int, ability: ShootAbility) -> None:
     hordelings = [
         tag
-        for tag in scene.cm.get(
-            Tag, query=lambda tag: tag.tag_type == TagType.HORDELING
-        )
+        for tag in scene.cm.get_by(Tag, tag_type=TagType.HORDELING)
         if is_visible(scene, scene.cm.get_one(Coordinates, entity=tag.entity))
     ]
     if not hordelings:
@@ -36,6 +36,8 @@ ACTOR_HANDLERS = (
     (HordelingSpawner, "run_hordeling_spawner"),
 )
 
+_SEASONS = {1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"}
+
 
 def run(scene) -> None:
     """
@@ -178,12 +180,26 @@ def get_timecode(calendar: Calendar) -> str:
     Returns:
         str: Localized timecode string.
     """
-    season = get_season_string(calendar)
+    return format_timecode(calendar.season, calendar.day, calendar.year)
+
+
+def format_timecode(season: int, day: int, year: int) -> str:
+    """
+    Return a formatted timecode string for a date.
+
+    Args:
+        season: Season number, 1 (spring) through 4 (winter).
+        day: Day of the season.
+        year: Calendar year.
+
+    Returns:
+        str: Localized timecode string.
+    """
     return t(
         "timecode.format",
-        season=t(f"season.{season.lower()}"),
-        day=calendar.day,
-        year=calendar.year,
+        season=t(f"season.{_SEASONS[season].lower()}"),
+        day=day,
+        year=year,
     )
 
 
@@ -197,7 +213,7 @@ def get_season_string(calendar: Calendar) -> str:
     Returns:
         str: Season name.
     """
-    return {1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"}[calendar.season]
+    return _SEASONS[calendar.season]
 
 
 def still_under_attack(scene) -> bool:
@@ -213,9 +229,7 @@ def still_under_attack(scene) -> bool:
     return (
         scene.cm.get(HordelingSpawner)
         or scene.cm.get(HordelingSpawner)
-        or scene.cm.get(
-            Tag, query=lambda tag: tag.tag_type == TagType.HORDELING
-        )
+        or scene.cm.get_by(Tag, tag_type=TagType.HORDELING)
     )
 
 
@@ -76,9 +76,7 @@ def execute(scene, action: AttackAction) -> None:
     action._log_info(f"dealing {action.damage} dmg to {action.target}")
     owner = scene.cm.get_one(Owner, entity=action.target)
     if owner:
-        structures = scene.cm.get(
-            HouseStructure, query=lambda hs: hs.house_id == owner.owner
-        )
+        structures = scene.cm.get_by(HouseStructure, house_id=owner.owner)
         house_structure = structures[0] if structures else None
     else:
         house_structure = None
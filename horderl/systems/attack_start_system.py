@@ -125,9 +125,7 @@ def _reset_heal_counter(healer: HealOnDally) -> None:
 
 def _move_peasants_in(scene: GameScene, mover: MovePeasantsIn) -> None:
     mover._log_info("moving peasants into homes")
-    peasants = scene.cm.get(
-        Tag, query=lambda tag: tag.tag_type == TagType.PEASANT
-    )
+    peasants = scene.cm.get_by(Tag, tag_type=TagType.PEASANT)
     for peasant in peasants:
         _move_peasant_home(scene, peasant)
 
@@ -7,7 +7,7 @@ import tcod
 
 from engine import constants, core, utilities
 from engine.components import Coordinates
-from engine.logging import get_logger
+from engine.logging import get_hot_path_logger, get_logger
 from engine.utilities import is_visible
 from horderl import palettes
 from horderl.components.ability_tracker import AbilityTracker
@@ -86,6 +86,9 @@ from horderl.systems.utilities import (
     pass_actor_turn,
 )
 
+# Logs once per brain per turn
+_hot_logger = get_hot_path_logger(__name__)
+
 BRAIN_HANDLERS = (
     (LookCursorController, "run_look_cursor_controller"),
     (DigHoleActor, "run_dig_hole_actor"),
@@ -180,11 +183,11 @@ def run_default_active_actor(scene, brain: DefaultActiveActor) -> None:
         - Adds attack/eat/tunnel actions or death events.
         - Consumes time via pass_actor_turn().
     """
-    logger = get_logger(__name__)
-    logger.debug(
-        "Default active actor tick",
-        extra={"entity": brain.entity, "target": brain.target},
-    )
+    if __debug__ and _hot_logger.debug_enabled:
+        _hot_logger.debug(
+            "Default active actor tick",
+            extra={"entity": brain.entity, "target": brain.target},
+        )
     brain.cost_map = _get_cost_map(scene, brain)
 
     target_evaluator = scene.cm.get_one(TargetEvaluator, entity=brain.entity)
@@ -226,11 +229,14 @@ def run_stationary_attack_actor(scene, brain: StationaryAttackActor) -> None:
         - Selects a nearby target and attacks.
         - Consumes time via pass_actor_turn().
     """
-    logger = get_logger(__name__)
-    logger.debug(
-        "Stationary attacker tick",
-        extra={"entity": brain.entity, "root": (brain.root_x, brain.root_y)},
-    )
+    if __debug__ and _hot_logger.debug_enabled:
+        _hot_logger.debug(
+            "Stationary attacker tick",
+            extra={
+                "entity": brain.entity,
+                "root": (brain.root_x, brain.root_y),
+            },
+        )
     coords = scene.cm.get_one(Coordinates, entity=brain.entity)
     targets = scene.cm.get(
         Coordinates,
@@ -256,11 +262,11 @@ def run_peasant_actor(scene, brain: PeasantActor) -> None:
     Side Effects:
         - Updates intention or consumes time via pass_actor_turn().
     """
-    logger = get_logger(__name__)
-    logger.debug(
-        "Peasant actor tick",
-        extra={"entity": brain.entity, "state": brain.state.value},
-    )
+    if __debug__ and _hot_logger.debug_enabled:
+        _hot_logger.debug(
+            "Peasant actor tick",
+            extra={"entity": brain.entity, "state": brain.state.value},
+        )
     if brain.state is PeasantActor.State.FARMING:
         _farm(scene, brain)
     elif brain.state is PeasantActor.State.WANDERING:
@@ -325,11 +331,11 @@ def run_sleeping_brain(scene, brain: SleepingBrain) -> None:
         - Consumes time via pass_actor_turn().
         - Pops brain stack when finished.
     """
-    logger = get_logger(__name__)
-    logger.debug(
-        "Sleeping brain tick",
-        extra={"entity": brain.entity, "turns_remaining": brain.turns},
-    )
+    if __debug__ and _hot_logger.debug_enabled:
+        _hot_logger.debug(
+            "Sleeping brain tick",
+            extra={"entity": brain.entity, "turns_remaining": brain.turns},
+        )
     brain._log_debug("sleeping one turn")
     coords = scene.cm.get_one(Coordinates, entity=brain.entity)
     scene.cm.add(*sleep_animation(coords.x, coords.y)[1])
@@ -823,6 +829,10 @@ def _handle_player_input(scene, brain: PlayerBrain, action_map) -> None:
             scene.cm.add(ShowHelpDialogue(entity=brain.entity))
         elif intention == Intention.BACK:
             scene.cm.add(QuitGame(entity=brain.entity))
+        elif intention == Intention.TOGGLE_CALL_PROFILE:
+            from horderl.systems.debug_menu import toggle_call_profile
+
+            toggle_call_profile(scene)
         elif intention is None:
             brain._log_debug("found no useable intention")
             return
@@ -893,6 +903,10 @@ def _handle_fast_forward_input(
 
             brain_stack.back_out(scene, brain)
             return
+        if intention == Intention.TOGGLE_CALL_PROFILE:
+            from horderl.systems.debug_menu import toggle_call_profile
+
+            toggle_call_profile(scene)
     else:
         brain.intention = Intention.DALLY
 
@@ -1005,13 +1019,7 @@ def is_buildable(scene, x: int, y: int) -> bool:
     Returns:
         bool: True if the tile is buildable.
     """
-    target_coords = scene.cm.get(
-        Coordinates,
-        query=lambda coords: coords.x == x
-        and coords.y == y
-        and not coords.buildable,
-    )
-    return not target_coords
+    return all(coords.buildable for coords in scene.cm.coordinates_at(x, y))
 
 
 def _dig_hole(scene, brain: DigHoleActor, direction: Intention) -> None:
@@ -1080,23 +1088,16 @@ def _in_bounds(x: int, y: int, config) -> bool:
 
 def _is_empty(scene, x: int, y: int) -> bool:
     """# Empty tiles have no blocking coordinates."""
-    target_coords = scene.cm.get(
-        Coordinates,
-        query=lambda coords: coords.x == x
-        and coords.y == y
-        and not coords.buildable,
-    )
-    return not target_coords
+    return all(coords.buildable for coords in scene.cm.coordinates_at(x, y))
 
 
 def _get_diggables(scene, x: int, y: int) -> List[int]:
     """# Diggable entities are sorted by priority before returning."""
-    fillable_entities = scene.cm.get(
-        Coordinates,
-        query=lambda coords: coords.x == x
-        and coords.y == y
-        and scene.cm.get_one(Diggable, entity=coords.entity),
-    )
+    fillable_entities = [
+        coords
+        for coords in scene.cm.coordinates_at(x, y)
+        if scene.cm.get_one(Diggable, entity=coords.entity)
+    ]
     return [
         fe.entity
         for fe in sorted(fillable_entities, key=lambda fe: fe.priority)
@@ -1148,9 +1149,7 @@ def _get_next_enemy(scene, brain: RangedAttackActor) -> int:
         ),
         None,
     )
-    all_enemies = scene.cm.get(
-        Tag, query=lambda tag: tag.tag_type == TagType.HORDELING
-    )
+    all_enemies = scene.cm.get_by(Tag, tag_type=TagType.HORDELING)
     visible_enemies = [
         e
         for e in all_enemies
@@ -1239,6 +1238,7 @@ PLAYER_KEY_ACTION_MAP = {
     tcod.event.KeySym.LEFT: Intention.STEP_WEST,
     tcod.event.KeySym.PERIOD: Intention.DALLY,
     tcod.event.KeySym.ESCAPE: Intention.BACK,
+    tcod.event.KeySym.F9: Intention.TOGGLE_CALL_PROFILE,
 }
 
 DIZZY_KEY_ACTION_MAP = {
@@ -1257,6 +1257,7 @@ DIZZY_KEY_ACTION_MAP = {
 FAST_FORWARD_KEY_ACTION_MAP = {
     tcod.event.KeySym.PERIOD: Intention.DALLY,
     tcod.event.KeySym.ESCAPE: Intention.BACK,
+    tcod.event.KeySym.F9: Intention.TOGGLE_CALL_PROFILE,
 }
 
 PLAYER_DEAD_KEY_ACTION_MAP = {
@@ -44,14 +44,15 @@ def run(scene: GameScene) -> None:
     if worldbuilding_control.world_parameters_selected:
         # remove the worldbuilding control component, we are done with it
         logger.info("building world with selected parameters")
-        _add_player(scene)
-        place_lakes(scene)
-        place_river(scene)
-        place_peasants(scene)
-        place_roads(scene)
-        place_trees(scene)
-        place_rocks(scene)
-        place_flowers(scene)
+        with scene.cm.batch():
+            _add_player(scene)
+            place_lakes(scene)
+            place_river(scene)
+            place_peasants(scene)
+            place_roads(scene)
+            place_trees(scene)
+            place_rocks(scene)
+            place_flowers(scene)
         scene.cm.delete_component(worldbuilding_control)
         logger.info("world build complete")
         return
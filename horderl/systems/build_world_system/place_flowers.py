@@ -1,7 +1,6 @@
 import random
 
 from engine import core
-from engine.components import Coordinates
 from engine.utilities import get_3_by_3_box
 from horderl import palettes
 from horderl.components.world_building.world_parameters import WorldParameters
@@ -56,8 +55,7 @@ def _add_flower_field(scene, x: int, y: int) -> None:
 
 
 def _add_flower(scene, x: int, y: int, color) -> None:
-    coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-    if (x, y) not in coords:
+    if not scene.cm.at(x, y):
         flower = make_flower(x, y, color)
         scene.cm.add(*flower[1])
     color = None
@@ -1,7 +1,6 @@
 import random
 
 from engine import core
-from engine.components import Coordinates
 from engine.utilities import get_3_by_3_box
 from horderl.components.world_building.world_parameters import WorldParameters
 
@@ -19,8 +18,7 @@ def place_lakes(scene):
     for _ in range(world_settings.lakes):
         x = random.randint(0, scene.config.map_width - 1)
         y = random.randint(0, scene.config.map_height - 1)
-        coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-        if (x, y) not in coords:
+        if not scene.cm.at(x, y):
             _spawn_lake(scene, x, y)
     logger.info(f"lakes placed.")
 
@@ -58,7 +56,6 @@ def _spawn_lake(scene, x: int, y: int) -> None:
 
 
 def _add_water(scene, x: int, y: int, painter, rapidness) -> None:
-    coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-    if (x, y) not in coords:
+    if not scene.cm.at(x, y):
         water = painter(x, y, rapidness)
         scene.cm.add(*water[1])
@@ -1,7 +1,6 @@
 import random
 
 from engine import core
-from engine.components import Coordinates
 from engine.utilities import get_3_by_3_box
 from horderl.components.world_building.world_parameters import WorldParameters
 
@@ -18,8 +17,7 @@ def place_rocks(scene):
     for _ in range(world_settings.rock_fields):
         x = random.randint(0, scene.config.map_width - 1)
         y = random.randint(0, scene.config.map_height - 1)
-        coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-        if (x, y) not in coords:
+        if not scene.cm.at(x, y):
             _add_rock_field(scene, x, y)
     logger.info(f"rock fields placed.")
 
@@ -46,7 +44,6 @@ def _add_rock_field(scene, x: int, y: int) -> None:
 
 
 def _add_rock(scene, x: int, y: int) -> None:
-    coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-    if (x, y) not in coords:
+    if not scene.cm.at(x, y):
         rock = make_rock(x, y)
         scene.cm.add(*rock[1])
@@ -1,7 +1,6 @@
 import random
 
 from engine import core
-from engine.components import Coordinates
 from engine.utilities import get_3_by_3_box
 from horderl.components.world_building.world_parameters import WorldParameters
 
@@ -19,8 +18,7 @@ def place_trees(scene):
     for _ in range(world_settings.copse):
         x = random.randint(0, scene.config.map_width - 1)
         y = random.randint(0, scene.config.map_height - 1)
-        coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-        if (x, y) not in coords:
+        if not scene.cm.at(x, y):
             _spawn_copse(scene, x, y)
     logger.info(f"copse of trees placed.")
 
@@ -47,7 +45,6 @@ def _spawn_copse(scene, x: int, y: int) -> None:
 
 
 def _add_tree(scene, x: int, y: int) -> None:
-    coords = {(coord.x, coord.y) for coord in scene.cm.get(Coordinates)}
-    if (x, y) not in coords:
+    if not scene.cm.at(x, y):
         tree = make_tree(x, y)
         scene.cm.add(*tree[1])
@@ -6,10 +6,13 @@ functions used by the menu entries.
 """
 
 import logging
+from datetime import datetime
 
 from engine import core
+from engine.call_profiler import SCENE_SECTIONS, CallProfiler
 from engine.components import Coordinates
 from engine.components.entity import Entity
+from engine.profiler import FRAME
 
 from ..components import Attributes, Senses
 from ..components.abilities.build_wall_ability import BuildWallAbility
@@ -30,6 +33,7 @@ from ..content.cursor import make_cursor
 from ..content.farmsteads.houses import place_farmstead
 from ..content.terrain.roads import connect_point_to_road_network
 from ..gui.easy_menu import EasyMenu
+from ..gui.profiler_overlay import ProfilerOverlay
 
 
 def run(scene) -> None:
@@ -76,6 +80,12 @@ def run(scene) -> None:
                 "toggle pathing": get_pathfinding_for(scene),
                 "spawn a home": get_spawn_home(scene),
                 "quicksave": quick_save(scene),
+                "toggle frame profiler": get_toggle_frame_profiler(scene),
+                "export frame profile": get_export_frame_profile(scene),
+                "profile scene calls": get_toggle_call_profile(
+                    scene, SCENE_SECTIONS
+                ),
+                "profile system calls": get_profile_system_calls(scene),
             },
             scene.config.inventory_width,
             scene.config,
@@ -548,3 +558,169 @@ def quick_save(scene):
         scene.cm.add(SaveGame(entity=scene.player))
 
     return out_fn
+
+
+# Profiling Functions
+# ---------------------------------
+
+FRAME_PROFILE_PATH = "./frame-profile.csv"
+
+
+def get_toggle_frame_profiler(scene):
+    """
+    Create a function that switches the frame profiler and its overlay.
+
+    Args:
+        scene: The current game scene, whose profiler is shared with the
+            scene controller.
+
+    Returns:
+        function: A callback that enables the profiler and shows the overlay,
+            or hides the overlay and disables the profiler.
+
+    """
+
+    def out_fn():
+        overlays = [
+            element
+            for element in scene.gui_elements
+            if isinstance(element, ProfilerOverlay) and not element.is_closed
+        ]
+        if overlays:
+            for overlay in overlays:
+                overlay.close()
+            scene.profiler.set_enabled(False)
+            return
+        scene.profiler.set_enabled(True)
+        scene.add_gui_element(
+            ProfilerOverlay(scene.play_window.x + 1, 1, scene.profiler)
+        )
+
+    return out_fn
+
+
+def get_export_frame_profile(scene):
+    """
+    Create a function that writes the frame profiler's stats to disk.
+
+    Args:
+        scene: The current game scene.
+
+    Returns:
+        function: A callback that writes FRAME_PROFILE_PATH as CSV and
+            reports where it went.
+
+    """
+
+    def out_fn():
+        path = scene.profiler.export(FRAME_PROFILE_PATH)
+        scene.message(f"Frame profile written to {path}")
+
+    return out_fn
+
+
+CALL_PROFILE_DIR = "./profiles"
+
+
+def toggle_call_profile(scene, sections=SCENE_SECTIONS):
+    """
+    Start a cProfile capture of some frame sections, or stop the running one.
+
+    Args:
+        scene: The current game scene, whose profiler is shared with the
+            scene controller.
+        sections: The section names to capture when starting.
+
+    Side Effects:
+        Attaches or detaches a CallProfiler, writes the capture under
+        CALL_PROFILE_DIR when stopping and reports it in the message log.
+    """
+    if scene.profiler.call_profiler is not None:
+        pstats_path, _ = stop_call_profile(scene.profiler)
+        scene.message(f"Call profile written to {pstats_path}")
+        return
+    call_profiler = CallProfiler(sections)
+    call_profiler.start()
+    scene.profiler.set_call_profiler(call_profiler)
+    scene.message(f"Profiling calls in {', '.join(sorted(sections))}")
+
+
+def stop_call_profile(profiler):
+    """
+    Stop the running cProfile capture, if any, and write it to disk.
+
+    Args:
+        profiler: The FrameProfiler the capture is attached to.
+
+    Returns:
+        tuple: The pstats and collapsed-stack paths, or None if no capture
+            was running.
+    """
+    call_profiler = profiler.call_profiler
+    if call_profiler is None:
+        return None
+    profiler.set_call_profiler(None)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return call_profiler.stop(f"{CALL_PROFILE_DIR}/calls-{stamp}")
+
+
+def get_toggle_call_profile(scene, sections):
+    """
+    Create a function that starts or stops a cProfile capture.
+
+    Args:
+        scene: The current game scene.
+        sections: The section names to capture.
+
+    Returns:
+        function: A callback that calls toggle_call_profile.
+
+    """
+
+    def out_fn():
+        toggle_call_profile(scene, sections)
+
+    return out_fn
+
+
+def get_profile_system_calls(scene):
+    """
+    Create a function that offers the profiled sections to capture.
+
+    The choices are the sections the frame profiler has timed, costliest
+    first, so the frame profiler must have run for a while.
+
+    Args:
+        scene: The current game scene.
+
+    Returns:
+        function: A callback that stops a running capture, or shows a menu of
+            sections to start one for.
+
+    """
+
+    def out_fn():
+        if scene.profiler.call_profiler is not None:
+            toggle_call_profile(scene)
+            return
+        names = [
+            stats.name
+            for stats in scene.profiler.stats()
+            if stats.name != FRAME
+        ]
+        if not names:
+            scene.message("Run the frame profiler first to list systems")
+            return
+        scene.add_gui_element(
+            EasyMenu(
+                "Profile which system?",
+                {
+                    name: get_toggle_call_profile(scene, [name])
+                    for name in names
+                },
+                scene.config.inventory_width,
+                scene.config,
+            )
+        )
+
+    return out_fn
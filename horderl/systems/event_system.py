@@ -165,12 +165,10 @@ def _after_quit_game(scene: GameScene, event: QuitGame) -> None:
 def _after_step_event(scene: GameScene, event: StepEvent) -> None:
     # Emit entered events after stepping, relying on movement system to consume.
     this_coords = scene.cm.get_one(Coordinates, entity=event.entity)
-    enter_listeners = scene.cm.get(EnterListener)
-    for enter_listener in enter_listeners:
-        other_coords = scene.cm.get_one(
-            Coordinates, entity=enter_listener.entity
-        )
-        if this_coords.is_at(other_coords):
+    if this_coords is None:
+        return
+    for entity in scene.cm.at(this_coords.x, this_coords.y):
+        for enter_listener in scene.cm.get_all(EnterListener, entity=entity):
             scene.cm.add(
                 EnterEvent(entity=event.entity, entered=enter_listener.entity)
             )
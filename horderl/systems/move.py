@@ -177,11 +177,7 @@ def move(scene, entity: int, vector: Tuple[int, int]):
 
 
 def _apply_post_move_factors(coords, entity, scene):
-    coords_entities = [
-        coord.entity
-        for coord in scene.cm.get(Coordinates)
-        if coord.x == coords.x and coord.y == coords.y
-    ]
+    coords_entities = scene.cm.at(coords.x, coords.y)
     difficult_terrain = any(
         _get_move_cost_affector(
             scene, coord_entity, MoveCostAffectorType.DIFFICULT_TERRAIN
@@ -224,10 +220,8 @@ def _apply_post_move_factors(coords, entity, scene):
 def _get_move_cost_affector(scene, entity, affector_type):
     return next(
         iter(
-            scene.cm.get(
-                MoveCostAffector,
-                query=lambda affector: affector.entity == entity
-                and affector.affector_type == affector_type,
+            scene.cm.get_by(
+                MoveCostAffector, entity=entity, affector_type=affector_type
             )
         ),
         None,
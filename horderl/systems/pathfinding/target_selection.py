@@ -71,13 +71,36 @@ def _build_cost_map(scene, cost_mapper: CostMapper) -> np.ndarray:
 
 
 def _build_normal_cost_map(scene) -> np.ndarray:
-    # Uses PathfinderCost overrides for baseline grid.
+    # Uses PathfinderCost overrides for baseline grid. The grid is kept
+    # between calls and patched where PathfinderCosts changed; callers get a
+    # copy because they add their own penalties to it.
+    reader = scene.cm.track(
+        PathfinderCost, Coordinates, key=f"{__name__}.normal_cost"
+    )
+    changes = reader.drain()
     size = (scene.config.map_width, scene.config.map_height)
-    cost = np.ones(size, dtype=np.int8, order="F")
-    for cost_component in scene.cm.get(PathfinderCost):
-        coords = scene.cm.get_one(Coordinates, entity=cost_component.entity)
-        cost[coords.x, coords.y] = cost_component.cost
-    return cost
+    cost = reader.data
+    if changes.rebuild or cost is None or cost.shape != size:
+        cost = np.ones(size, dtype=np.int8, order="F")
+        for cost_component, coords in scene.cm.query(
+            PathfinderCost, Coordinates
+        ):
+            cost[coords.x, coords.y] = cost_component.cost
+        reader.data = cost
+        return cost.copy()
+
+    width, height = size
+    for x, y in scene.cm.changed_tiles(changes):
+        if x is None or y is None or not (0 <= x < width and 0 <= y < height):
+            continue
+        cost[x, y] = 1
+        for coords in scene.cm.coordinates_at(x, y):
+            cost_component = scene.cm.get_one(
+                PathfinderCost, entity=coords.entity
+            )
+            if cost_component:
+                cost[x, y] = cost_component.cost
+    return cost.copy()
 
 
 def _build_stealthy_cost_map(scene) -> np.ndarray:
@@ -103,8 +126,7 @@ def _build_stealthy_cost_map(scene) -> np.ndarray:
 def _build_peasant_cost_map(scene) -> np.ndarray:
     # Adds hazards to the base cost map.
     cost = _build_normal_cost_map(scene)
-    for drain_on_enter in scene.cm.get(DrainOnEnter):
-        coords = scene.cm.get_one(Coordinates, entity=drain_on_enter.entity)
+    for drain_on_enter, coords in scene.cm.query(DrainOnEnter, Coordinates):
         cost[coords.x, coords.y] += drain_on_enter.damage * 20
     return cost
 
@@ -114,12 +136,13 @@ def _build_road_cost_map(scene) -> np.ndarray:
     size = (scene.config.map_width, scene.config.map_height)
     cost = np.ones(size, dtype=np.uint16, order="F")
     max_x, max_y = size
-    for coord in scene.cm.get(Coordinates):
+    rows = scene.cm.query(Coordinates, optional=[Attributes, WaterTag])
+    for coord, attributes, water in rows:
         if coord.x < 0 or coord.x >= max_x or coord.y < 0 or coord.y >= max_y:
             continue
-        if scene.cm.get_one(Attributes, entity=coord.entity):
+        if attributes:
             cost[coord.x, coord.y] = 10000
-        elif scene.cm.get_one(WaterTag, entity=coord.entity):
+        elif water:
             cost[coord.x, coord.y] += 2
         else:
             cost[coord.x, coord.y] += 1000
@@ -192,9 +215,7 @@ def get_target_values(
     if evaluator.evaluator_type is TargetEvaluatorType.ALLY:
         return [
             (tv.entity, 1)
-            for tv in scene.cm.get(
-                Tag, query=lambda tag: tag.tag_type == TagType.HORDELING
-            )
+            for tv in scene.cm.get_by(Tag, tag_type=TagType.HORDELING)
         ]
     raise ValueError(
         f"Unsupported target evaluator: {type(evaluator).__name__}"
@@ -108,7 +108,8 @@ def run(scene: GameScene) -> None:
     """
     for event in list(scene.cm.get(ResetSeason)):
         _announce_season(scene, event.season)
-        _handle_season_reset(scene, event.season)
+        with scene.cm.batch():
+            _handle_season_reset(scene, event.season)
         scene.cm.delete_component(event)
 
 
@@ -267,9 +268,7 @@ def _reset_heal_counter(listener: HealOnDally) -> None:
 
 
 def _move_peasants_out(scene: GameScene, season: str) -> None:
-    peasants = scene.cm.get(
-        Tag, query=lambda tag: tag.tag_type == TagType.PEASANT
-    )
+    peasants = scene.cm.get_by(Tag, tag_type=TagType.PEASANT)
     for peasant in peasants:
         farm_plots = scene.cm.get(
             FarmedBy,
@@ -303,10 +302,8 @@ def _rebuild_house(scene: GameScene, listener: Rebuilder) -> None:
 
 def _get_living_residents(scene: GameScene, house_id: int) -> List[Tag]:
     resident: Resident = scene.cm.get_one(Resident, entity=house_id)
-    peasants: List[Tag] = scene.cm.get(
-        Tag,
-        query=lambda tag: tag.tag_type == TagType.PEASANT
-        and tag.entity == resident.resident,
+    peasants: List[Tag] = scene.cm.get_by(
+        Tag, tag_type=TagType.PEASANT, entity=resident.resident
     )
     return peasants
 
@@ -402,9 +399,7 @@ def _spawn_saplings(
 
     tree_coords = [
         scene.cm.get_one(Coordinates, entity=tt.entity)
-        for tt in scene.cm.get(
-            Tag, query=lambda tag: tag.tag_type == TagType.TREE
-        )
+        for tt in scene.cm.get_by(Tag, tag_type=TagType.TREE)
         if random.randint(0, 500) < weather.seasonal_norm
     ]
 
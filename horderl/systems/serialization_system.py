@@ -3,13 +3,18 @@
 from engine import GameScene, core
 from engine.logging import get_logger
 from horderl import palettes
+from horderl.components.actors.calendar_actor import Calendar
 from horderl.components.events.start_game_events import StartGame
+from horderl.components.population import Population
 from horderl.components.serialization.load_game import LoadGame
 from horderl.components.serialization.save_game import SaveGame
 from horderl.components.world_building.world_parameters import WorldParameters
 from horderl.i18n import t
 from horderl.systems.world_building import format_world_filename
 
+# The key of save_summary's data in a save's extra data
+SUMMARY = "summary"
+
 
 def run(scene: GameScene) -> None:
     """
@@ -58,7 +63,11 @@ def load_game(scene: GameScene, request: LoadGame) -> None:
     data = scene.load_game(request.file_name)
     scene.cm.from_data(data)
     end = core.time_ms()
-    logger.info("loaded %s objects in %sms", len(data), end - start)
+    logger.info(
+        "loaded %s objects in %sms",
+        len(data["active_components"]),
+        end - start,
+    )
 
     for event in pending_start_events:
         scene.cm.add(StartGame(entity=event.entity))
@@ -78,7 +87,9 @@ def save_game(scene: GameScene, request: SaveGame) -> None:
         None
 
     Side Effects:
-        - Serializes component manager state to disk.
+        - Writes the state changed since the last save to the save's journal,
+          or a full snapshot on the first save, with save_summary in its extra
+          data.
         - Logs save progress.
         - Posts a message to the player.
     """
@@ -89,10 +100,36 @@ def save_game(scene: GameScene, request: SaveGame) -> None:
 
     logger.info("attempting to save game")
     params = scene.cm.get_one(WorldParameters, entity=core.get_id("world"))
-    scene.save_game(
-        scene.cm.get_serial_form(),
+    scene.save_game_incremental(
         f"./{format_world_filename(params.world_name)}.world",
-        request.extra,
+        {**request.extra, SUMMARY: save_summary(scene)},
     )
     logger.info("save complete")
     scene.message(t("message.game_saved"), color=palettes.LIGHT_WATER)
+
+
+def save_summary(scene: GameScene) -> dict:
+    """
+    Describe the game for the load menu, which reads it from the save's info
+    block without loading the save.
+
+    Args:
+        scene: Active game scene containing a component manager.
+
+    Returns:
+        dict: The village name and population, and the calendar's season,
+        day and year when the game has a calendar.
+    """
+    world = core.get_id("world")
+    params = scene.cm.get_one(WorldParameters, entity=world)
+    population = scene.cm.get_one(Population, entity=world)
+    summary = {
+        "village": params.world_name if params else "",
+        "population": population.population if population else 0,
+    }
+    calendar = scene.cm.get_one(Calendar, entity=core.get_id("calendar"))
+    if calendar is not None:
+        summary.update(
+            season=calendar.season, day=calendar.day, year=calendar.year
+        )
+    return summary
@@ -53,9 +53,7 @@ def run(scene: GameScene) -> None:
 
 
 def _move_peasants_out(scene: GameScene) -> None:
-    peasants = scene.cm.get(
-        Tag, query=lambda tag: tag.tag_type == TagType.PEASANT
-    )
+    peasants = scene.cm.get_by(Tag, tag_type=TagType.PEASANT)
     for peasant in peasants:
         farm_plots = scene.cm.get(
             FarmedBy,
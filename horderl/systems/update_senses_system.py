@@ -17,18 +17,36 @@ def run(scene: GameScene) -> None:
     if not senses.dirty:
         return
 
-    transparency = np.ones(
-        (scene.config.map_width, scene.config.map_height),
-        order="F",
-        dtype=bool,
+    transparency = _get_transparency(scene)
+    scene.visibility_map[:] = tcod.map.compute_fov(
+        transparency,
+        (player.x, player.y),
+        light_walls=True,
+        radius=scene.config.torch_radius,
     )
-    materials = scene.cm.get(Material, query=lambda m: m.blocks_sight)
-    for material in materials:
-        coords = scene.cm.get_one(Coordinates, entity=material.entity)
-        transparency[coords.x, coords.y] = False
-        scene.visibility_map[:] = tcod.map.compute_fov(
-            transparency,
-            (player.x, player.y),
-            light_walls=True,
-            radius=scene.config.torch_radius,
-        )
+
+
+def _get_transparency(scene: GameScene) -> np.ndarray:
+    # The map is kept between runs and patched where Materials changed.
+    reader = scene.cm.track(Material, Coordinates, key=__name__)
+    changes = reader.drain()
+    size = (scene.config.map_width, scene.config.map_height)
+    transparency = reader.data
+    if changes.rebuild or transparency is None or transparency.shape != size:
+        transparency = np.ones(size, order="F", dtype=bool)
+        for material, coords in scene.cm.query(Material, Coordinates):
+            if material.blocks_sight:
+                transparency[coords.x, coords.y] = False
+        reader.data = transparency
+        return transparency
+
+    width, height = size
+    for x, y in scene.cm.changed_tiles(changes):
+        if x is None or y is None or not (0 <= x < width and 0 <= y < height):
+            continue
+        transparency[x, y] = True
+        for coords in scene.cm.coordinates_at(x, y):
+            material = scene.cm.get_one(Material, entity=coords.entity)
+            if material and material.blocks_sight:
+                transparency[x, y] = False
+    return transparency
@@ -27,11 +27,7 @@ def get_blocking_object(cm: ComponentManager, x: int, y: int) -> int:
     """
     materials_at_coords = filter(
         lambda material: material and material.blocks,
-        iter(
-            cm.get_one(Material, coord.entity)
-            for coord in cm.get(Coordinates)
-            if (coord.x == x and coord.y == y)
-        ),
+        (cm.get_one(Material, entity) for entity in cm.at(x, y)),
     )
 
     blocking_material = next(materials_at_coords, None)
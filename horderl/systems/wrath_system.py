@@ -22,10 +22,7 @@ def _trigger_wrath(scene: GameScene, effect: WrathEffect) -> None:
 
     effect._log_info("Obliterating hordelings")
     hordelings = [
-        tag.entity
-        for tag in scene.cm.get(
-            Tag, query=lambda tag: tag.tag_type == TagType.HORDELING
-        )
+        tag.entity for tag in scene.cm.get_by(Tag, tag_type=TagType.HORDELING)
     ]
     for hordeling in hordelings:
         scene.cm.add(Die(entity=hordeling, killer=scene.player))
@@ -1,6 +1,12 @@
+import json
+
+import numpy as np
+
 from engine import constants
 from engine.component_manager import ComponentManager
 from engine.components import Coordinates
+from engine.serialization import EnhancedJSONEncoder
+from horderl.components.brains.default_active_actor import DefaultActiveActor
 from horderl.components.brains.player_brain import PlayerBrain
 from horderl.components.brains.sleeping_brain import SleepingBrain
 from horderl.components.events.peasant_events import PeasantDied
@@ -40,3 +46,13 @@ def test_handle_back_out_cleans_sleeping_brain_stomach():
     assert scene.warn_messages == ["A peasant has been lost!"]
     assert scene.cm.get(PeasantDied)
     assert stomach.contents == constants.INVALID
+
+
+def test_cost_map_is_not_saved():
+    brain = DefaultActiveActor(entity=1, target=2)
+    brain.cost_map = np.ones((3, 3), dtype=np.int32)
+
+    record = json.loads(EnhancedJSONEncoder().encode(brain))
+
+    assert "cost_map" not in record
+    assert record["target"] == 2
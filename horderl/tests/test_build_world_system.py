@@ -0,0 +1,60 @@
+import random
+
+from engine import core
+from engine.component_manager import ComponentManager
+from engine.components import Coordinates
+from engine.components.entity import Entity
+from horderl.components.worldbuilding_control import WorldbuildingControl
+from horderl.config import Config
+from horderl.systems.build_world_system import build_world_system
+from horderl.systems.world_building.params_factory import get_forest_params
+
+
+class DummyScene:
+    def __init__(self):
+        self.config = Config(screen_width=40, screen_height=30, world_seed="7")
+        self.cm = ComponentManager()
+
+
+def test_world_build_tile_checks_do_not_flush_the_batch():
+    scene = DummyScene()
+    world = core.get_id("world")
+    params = get_forest_params(world, scene.config)
+    random.seed(params.world_seed)
+    scene.cm.add(
+        params,
+        WorldbuildingControl(entity=world, world_parameters_selected=True),
+    )
+    cm = scene.cm
+    lookups = 0
+    flushes = 0
+    at, flush = cm.at, cm._flush
+
+    def counting_at(x, y):
+        nonlocal lookups
+        lookups += 1
+        return at(x, y)
+
+    def counting_flush():
+        nonlocal flushes
+        if cm._batch_depth and cm._pending:
+            flushes += 1
+        flush()
+
+    cm.at, cm._flush = counting_at, counting_flush
+
+    build_world_system.run(scene)
+
+    # Placing terrain checks hundreds of tiles; only the road planner's
+    # queries (one per road) index the batch before it ends
+    assert lookups > 200
+    assert flushes < 10
+    assert cm.get(WorldbuildingControl) == []
+    # The tile checks still saw the terrain placed before them
+    tiles = [
+        (coords.x, coords.y)
+        for entity in cm.get(Entity)
+        if entity.static
+        for coords in cm.get_all(Coordinates, entity=entity.entity)
+    ]
+    assert len(tiles) == len(set(tiles))
@@ -0,0 +1,77 @@
+import gc
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("tcod")
+
+from engine.component_manager import ComponentManager
+from engine.components import Coordinates
+from engine.components.entity import Entity
+from horderl.components.appearance import Appearance
+from horderl.components.material import Material
+from horderl.components.pathfinder_cost import PathfinderCost
+from horderl.components.states.move_cost_affectors import (
+    MoveCostAffector,
+    MoveCostAffectorType,
+)
+
+REFERENCE_TILES = 2000
+
+# Retained bytes per terrain entity (about five components plus the manager's
+# bookkeeping) on the reference world below. Slotted components brought this
+# from about 2340 to 2100 bytes; raise the budget only for a deliberate trade.
+BYTES_PER_ENTITY_BUDGET = 2200
+
+
+def _build_reference_world(cm: ComponentManager) -> None:
+    """
+    Add terrain-like entities shaped like the ones world generation places.
+
+    Args:
+        cm: The component manager to populate.
+
+    Side Effects:
+        Adds REFERENCE_TILES entities to ``cm``.
+    """
+    width = 50
+    for i in range(REFERENCE_TILES):
+        entity = 1_000_000 + i
+        cm.add(
+            Entity(id=entity, entity=entity, name="tree", static=True),
+            Coordinates(entity=entity, x=i % width, y=i // width),
+            Appearance(entity=entity, symbol="^"),
+            Material(entity=entity, blocks=True, blocks_sight=True),
+            PathfinderCost(entity=entity, cost=20),
+        )
+        if i % 4 == 0:
+            cm.add(
+                MoveCostAffector(
+                    entity=entity,
+                    affector_type=MoveCostAffectorType.DIFFICULT_TERRAIN,
+                )
+            )
+
+
+def test_bytes_per_entity_stay_within_budget():
+    """
+    Validate that a reference world fits in the per-entity memory budget.
+
+    Side Effects:
+        Traces allocations with tracemalloc while building the world.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cm = ComponentManager()
+        _build_reference_world(cm)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    bytes_per_entity = retained / REFERENCE_TILES
+    assert bytes_per_entity <= BYTES_PER_ENTITY_BUDGET, (
+        f"{bytes_per_entity:.0f} bytes per entity exceeds the budget of"
+        f" {BYTES_PER_ENTITY_BUDGET}"
+    )
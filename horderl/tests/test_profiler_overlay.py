@@ -0,0 +1,109 @@
+import pytest
+
+pytest.importorskip("tcod")
+
+from engine.component_manager import ComponentManager
+from engine.profiler import FrameProfiler, SectionStats
+from horderl.gui.profiler_overlay import ProfilerOverlay, format_stats
+from horderl.systems import debug_menu
+from horderl.systems.debug_menu import (
+    get_toggle_frame_profiler,
+    toggle_call_profile,
+)
+
+
+class DummyPlayWindow:
+    x = 25
+
+
+class DummyScene:
+    """Minimal scene fixture for frame profiler debug actions."""
+
+    def __init__(self):
+        """
+        Initialize the scene with a disabled profiler and no GUI elements.
+
+        Side Effects:
+            Initializes in-memory scene state for tests.
+        """
+        self.cm = ComponentManager()
+        self.profiler = FrameProfiler()
+        self.play_window = DummyPlayWindow()
+        self.gui_elements = []
+        self.messages = []
+
+    def add_gui_element(self, element) -> None:
+        self.gui_elements.append(element)
+
+    def message(self, text) -> None:
+        self.messages.append(text)
+
+
+def test_toggle_frame_profiler_shows_and_hides_overlay():
+    """
+    Validate that the debug action switches the profiler and its overlay.
+
+    Side Effects:
+        Adds and closes GUI elements on the dummy scene.
+    """
+    scene = DummyScene()
+    toggle = get_toggle_frame_profiler(scene)
+
+    toggle()
+    (overlay,) = scene.gui_elements
+    assert scene.profiler.enabled
+    assert isinstance(overlay, ProfilerOverlay)
+    assert overlay.x == 26
+
+    toggle()
+    assert overlay.is_closed
+    assert not scene.profiler.enabled
+
+
+def test_format_stats_rows_fit_the_map_width():
+    """
+    Validate the overlay's table layout.
+
+    Side Effects:
+        None.
+    """
+    stats = [
+        SectionStats(
+            name="update_senses_system",
+            samples=10,
+            last_ms=1.0,
+            mean_ms=1.0,
+            p50_ms=0.5,
+            p95_ms=12.25,
+            max_ms=30.0,
+        )
+    ]
+
+    lines = format_stats(stats)
+
+    assert lines[1] == "update_senses_   0.5  12.2  30.0"
+    assert all(len(line) <= 35 for line in lines)
+
+
+def test_toggle_call_profile_captures_only_its_sections(tmp_path, monkeypatch):
+    """
+    Validate that a scoped capture starts, profiles and writes its files.
+
+    Side Effects:
+        Writes pstats and collapsed-stack files under tmp_path.
+    """
+    monkeypatch.setattr(debug_menu, "CALL_PROFILE_DIR", str(tmp_path))
+    scene = DummyScene()
+
+    toggle_call_profile(scene, ["move"])
+    assert scene.profiler.active
+    scene.profiler.call("move", sorted, range(1000))
+    toggle_call_profile(scene)
+
+    assert scene.profiler.call_profiler is None
+    assert not scene.profiler.active
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [
+        ".collapsed",
+        ".pstats",
+    ]
+    assert scene.messages[-1].startswith("Call profile written to")
@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+from engine import core, serialization
+from horderl.benchmarks.save_load import (
+    BASELINES,
+    TOLERANCES,
+    build_world,
+    compare,
+)
+from horderl.components.house_structure import HouseStructure
+from horderl.components.tags.tag import Tag, TagType
+from horderl.components.tags.water_tag import WaterTag
+
+
+@pytest.fixture
+def id_state():
+    named_ids = dict(core.get_named_ids())
+    id_state = core.get_id_state()
+    yield
+    core.set_named_ids(named_ids)
+    core.set_id_state(id_state)
+
+
+def test_synthetic_world_uses_every_factory(id_state):
+    cm = build_world(1_000)
+
+    assert 1_000 <= len(cm.components_by_id) < 1_020
+    assert cm.get(HouseStructure)
+    assert cm.get(WaterTag)
+    tags = {tag.tag_type for tag in cm.get(Tag)}
+    assert {TagType.HORDELING, TagType.TREE} <= tags
+
+
+@pytest.mark.parametrize("save_format", serialization.FORMATS)
+def test_small_world_file_size_matches_its_baseline(
+    save_format, tmp_path, id_state
+):
+    cm = build_world(1_000)
+    path = tmp_path / "world"
+
+    serialization.save(cm.get_serial_form(), path, save_format=save_format)
+
+    loaded = serialization.load(path)["active_components"]
+    assert len(loaded) == len(cm.components_by_id)
+    baseline = json.loads(BASELINES.read_text())[save_format]["1000"]
+    results = {save_format: {"1000": {"file_size": os.path.getsize(path)}}}
+    tolerances = {"file_size": TOLERANCES["file_size"]}
+    assert (
+        compare(results, {save_format: {"1000": baseline}}, tolerances) == []
+    )
+
+
+def test_compare_reports_only_results_past_their_tolerance():
+    baselines = {"binary": {"1000": {"save_seconds": 1.0}}}
+    tolerances = {"save_seconds": (0.5, 0.1)}
+
+    def check(seconds, size="1000"):
+        results = {"binary": {size: {"save_seconds": seconds}}}
+        return compare(results, baselines, tolerances)
+
+    assert check(1.6) == []
+    (regression,) = check(1.7)
+    assert regression.startswith("binary 1000: save_seconds 1.7")
+    # Sizes without a baseline are not checked
+    assert check(100.0, size="10000") == []
@@ -1,9 +1,12 @@
 from engine import core
 from engine.component_manager import ComponentManager
+from horderl.components.actors.calendar_actor import Calendar
 from horderl.components.events.start_game_events import StartGame
+from horderl.components.population import Population
 from horderl.components.serialization.load_game import LoadGame
 from horderl.components.serialization.save_game import SaveGame
 from horderl.components.world_building.world_parameters import WorldParameters
+from horderl.scenes.load_game_scene import describe_save
 from horderl.systems.serialization_system import (
     run as run_serialization_system,
 )
@@ -16,8 +19,8 @@ class DummyScene:
         self.saved = []
         self.loaded = []
 
-    def save_game(self, data, filename, extra) -> None:
-        self.saved.append((data, filename, extra))
+    def save_game_incremental(self, filename, extra) -> None:
+        self.saved.append((filename, extra))
 
     def load_game(self, filename):
         self.loaded.append(filename)
@@ -45,8 +48,43 @@ def test_serialization_system_saves_game_and_removes_request():
     run_serialization_system(scene)
 
     assert scene.cm.get(SaveGame) == []
-    assert scene.saved[0][1] == "./My-World.world"
-    assert scene.saved[0][2] == {"foo": "bar"}
+    assert scene.saved == [
+        (
+            "./My-World.world",
+            {
+                "foo": "bar",
+                "summary": {"village": "My World", "population": 0},
+            },
+        )
+    ]
+
+
+def test_saves_summarize_the_game_for_the_load_menu():
+    scene = DummyScene()
+    world = core.get_id("world")
+    scene.cm.add(
+        WorldParameters(entity=world, world_name="Oakvale"),
+        Population(entity=world, population=12),
+        Calendar(entity=core.get_id("calendar"), day=3, season=2, year=1218),
+    )
+    scene.cm.add(SaveGame(entity=1))
+
+    run_serialization_system(scene)
+
+    ((_, extra),) = scene.saved
+    assert extra["summary"] == {
+        "village": "Oakvale",
+        "population": 12,
+        "season": 2,
+        "day": 3,
+        "year": 1218,
+    }
+    label = describe_save("Oakvale.world", {"extra": extra})
+    assert label.startswith("Oakvale: ")
+    assert "1218" in label and "12" in label
+    # Saves from before summaries were kept are listed by file name
+    assert describe_save("Old.world", {"extra": {}}) == "Old.world"
+    assert describe_save("Broken.world", None) == "Broken.world"
 
 
 def test_serialization_system_loads_game_and_restores_start_event():
@@ -5,8 +5,12 @@ pytest.importorskip("tcod")
 
 from engine.component_manager import ComponentManager
 from engine.components import Coordinates
+from horderl.components.pathfinder_cost import PathfinderCost
 from horderl.config import Config
-from horderl.systems.pathfinding.target_selection import get_new_target
+from horderl.systems.pathfinding.target_selection import (
+    _build_normal_cost_map,
+    get_new_target,
+)
 
 
 class DummyScene:
@@ -59,3 +63,40 @@ def test_get_new_target_returns_none_when_no_targets():
     target = get_new_target(scene, cost_map, (0, 0), [])
 
     assert target is None
+
+
+def test_normal_cost_map_is_patched_incrementally():
+    """
+    Validate that the cached cost map follows component changes.
+
+    Side Effects:
+        Adds, moves and deletes in-memory components on the dummy scene.
+    """
+    scene = DummyScene()
+    wall_cost = PathfinderCost(entity=1, cost=50)
+    scene.cm.add(Coordinates(entity=1, x=1, y=1), wall_cost)
+    scene.cm.add(Coordinates(entity=2, x=3, y=3), PathfinderCost(entity=2))
+
+    first = _build_normal_cost_map(scene)
+    assert first[1, 1] == 50
+    first[0, 0] = 99
+
+    scene.cm.get_one(Coordinates, entity=1).x = 2
+    wall_cost.cost = 20
+    scene.cm.delete(2)
+    scene.cm.add(Coordinates(entity=3, x=4, y=0), PathfinderCost(entity=3))
+
+    patched = _build_normal_cost_map(scene)
+    scene.cm.clear()
+    scene.cm.add(
+        Coordinates(entity=1, x=2, y=1),
+        PathfinderCost(entity=1, cost=20),
+        Coordinates(entity=3, x=4, y=0),
+        PathfinderCost(entity=3),
+    )
+    rebuilt = _build_normal_cost_map(scene)
+
+    assert patched[0, 0] == 1
+    assert patched[1, 1] == 1
+    assert patched[2, 1] == 20
+    np.testing.assert_array_equal(rebuilt, patched)
@@ -13,7 +13,7 @@ from pathlib import Path
 repo_root = Path(os.environ["REPO_ROOT"]).resolve()
 locale_dir = repo_root / "horderl" / "resources" / "locales"
 
-pattern = re.compile(r"t\(\s*(['\"])(.*?)\1")
+pattern = re.compile(r"(?<![\w.])t\(\s*(['\"])(.*?)\1")
 keys = set()
 for path in (repo_root / "horderl").rglob("*.py"):
     text = path.read_text(encoding="utf-8")